@@ -5,13 +5,26 @@ import json
 import uuid
 import re
 import time
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 import subprocess
-import pypdf
 import requests
 from supabase import create_client, Client
 from docx import Document
 import streamlit as st  # Import Streamlit first
+from resume_core import parsing, workers
+from resume_core.incremental import ResumeAnalysis
+from resume_core.jobs import extract_job_features_local, get_job_posting_store, read_postings
+from resume_core.matching import get_match_artifact, job_text, match_key
+from resume_core.model import ResumeDocument, as_resume_document
+from resume_core.parsing import extract_sections_simple
+from resume_core.ranking import DEFAULT_TOP_K, get_resume_ranker
+from resume_core.render_cache import get_render_cache, render_key
+from resume_core.rendering import COLOR_SCHEMES, FONT_FAMILIES
+from resume_core.scoring import calculate_resume_scores, generate_improvement_suggestions
+from resume_core.search import get_search_index
+from resume_core.tailoring import highlight_skills, tailor_resume
 
 # --- Configuration ---
 # Set page config must be the first Streamlit command
@@ -926,6 +939,7 @@ def store_file_in_supabase(file, user_id, file_type):
     #    )
         
         st.success("File uploaded to Supabase successfully!")
+        index_stored_file(file_name, file_bytes)
         return file_name
     except Exception as e:
         error_msg = str(e)
@@ -967,6 +981,7 @@ def store_file_locally(file, user_id, file_type):
             json.dump(metadata, f)
         
         st.success("File stored locally successfully!")
+        index_stored_file(file_name, file_bytes)
         return file_name
     except Exception as e:
         st.error(f"Failed to store file locally: {str(e)}")
@@ -1012,229 +1027,399 @@ def list_files(user_id=None):
     
     return files
 
+# Precomputed feature rows of every stored resume, for recruiter ranking
+RESUME_FEATURES_PATH = os.path.join(LOCAL_STORAGE_DIR, "resume_features.json")
+# Inverted index of every stored resume, for skill/keyword search
+RESUME_SEARCH_INDEX_PATH = os.path.join(LOCAL_STORAGE_DIR, "resume_search.sqlite3")
+# Rendered PDFs keyed by their inputs, so identical renders are a file read
+RENDER_CACHE_DIR = os.environ.get("RESUME_RENDER_CACHE_DIR") or os.path.join(LOCAL_STORAGE_DIR, "render_cache")
+
+def index_resume_text(file_name, resume_text, save=True):
+    """Add a stored resume's text to the search index and the recruiter ranking store.
+
+    The ranking store is rewritten in batches (save_if_stale), not on every add.
+    """
+    get_search_index(RESUME_SEARCH_INDEX_PATH).add(file_name, resume_text)
+    ranker = get_resume_ranker(RESUME_FEATURES_PATH)
+    ranker.add(file_name, resume_text)
+    if save:
+        ranker.save_if_stale()
+
+def index_stored_file(file_name, file_bytes):
+    """Index a file right after it is stored; failures never block the upload."""
+    try:
+        resume_text = run_background_task("extract_text", file_bytes,
+                                          key=f"extract_text:{hashlib.sha1(file_bytes).hexdigest()}",
+                                          label="Indexing resume...")
+        index_resume_text(file_name, resume_text)
+    except Exception as e:
+        st.warning(f"Resume stored but not indexed for search: {str(e)}")
+
+def index_stored_resumes(file_names):
+    """Download and extract stored resumes missing from the search index or ranking store."""
+    search_index = get_search_index(RESUME_SEARCH_INDEX_PATH)
+    ranker = get_resume_ranker(RESUME_FEATURES_PATH)
+    missing = sorted(set(search_index.missing(file_names)) | set(ranker.missing(file_names)))
+    if not missing:
+        return 0
+    progress_bar = st.progress(0.0, text="Indexing stored resumes...")
+    indexed = 0
+    try:
+        for position, file_name in enumerate(missing, 1):
+            resume_file = get_file(file_name)
+            if resume_file is not None:
+                try:
+                    index_resume_text(file_name, parsing.extract_text_from_pdf(resume_file), save=False)
+                    indexed += 1
+                except Exception as e:
+                    st.warning(f"Skipped {file_name}: {str(e)}")
+            progress_bar.progress(position / len(missing), text=f"Indexing stored resumes ({position}/{len(missing)})...")
+        ranker.save()
+    finally:
+        progress_bar.empty()
+    return indexed
+
+# Model match scores are requested only for this many of the best local matches
+JOB_REFINE_TOP_N = int(os.environ.get("RESUME_JOB_REFINE_TOP_N", "3"))
+
+def job_postings_path(user_id):
+    """Saved job postings of one user."""
+    return os.path.join(LOCAL_STORAGE_DIR, f"job_postings_{user_id}.json")
+
+def refine_job_matches(resume_text, store, job_ids, fetch=False):
+    """Model match scores for postings, memoized per resume and posting.
+
+    Without fetch only scores already requested are returned, so reruns
+    never call the model again.
+    """
+    refined = st.session_state.setdefault('refined_job_matches', {})
+    resume_key = hashlib.sha1(resume_text.encode('utf-8')).hexdigest()
+    if fetch:
+        resume_sections = parse_resume_sections(resume_text)
+        for job_id in job_ids:
+            if (resume_key, job_id) not in refined:
+                posting = store.posting(job_id)
+                refined[(resume_key, job_id)] = call_gemini_api(
+                    "calculate_match_score",
+                    {"resume": resume_sections, "job": posting['features'], "job_text": posting['text']})
+    return {job_id: refined[(resume_key, job_id)] for job_id in job_ids if (resume_key, job_id) in refined}
+
+# Scores the model may override in the local match result (experience_match stays local)
+MODEL_MATCH_SCORES = ("match_score", "skills_match", "education_match", "overall_fit")
+# Set RESUME_MATCH_MODEL_REFINE=0 to keep match scores fully local
+MATCH_MODEL_REFINE = os.environ.get("RESUME_MATCH_MODEL_REFINE", "1") != "0"
+
+# --- Background Workers ---
+BACKGROUND_POLL_INTERVAL = 0.2  # seconds between status polls
+# Fragments (Streamlit 1.37+) let a render be polled without rerunning or blocking the page
+STREAMLIT_FRAGMENTS_AVAILABLE = hasattr(st, "fragment")
+RENDER_POLL_INTERVAL = 0.5  # seconds between render status polls from the fragment
+# Session render handles still running but not polled for this many seconds are forgotten
+RENDER_HANDLE_TIMEOUT = float(os.environ.get("RESUME_RENDER_HANDLE_TIMEOUT", "120"))
+# Session keys holding render handles (see request_pdf_render)
+PDF_RENDER_KEYS = ('pdf_render', 'enhanced_pdf_render', 'tailored_pdf_render')
+# Memoized background results kept per session (texts, parses, ATS reports), least recently used dropped
+BACKGROUND_RESULTS_LIMIT = int(os.environ.get("RESUME_BACKGROUND_RESULTS_LIMIT", "16"))
+# Local parses scoring below this confidence are sent to the model
+PARSE_CONFIDENCE_THRESHOLD = float(os.environ.get("RESUME_PARSE_CONFIDENCE_THRESHOLD", "0.6"))
+
+def run_background_task(task_name, *args, key=None, label="Processing...", timeout=None):
+    """Run a CPU-heavy task in the worker pool and poll it until it finishes.
+    
+    When a key is given, the result is memoized in the session (the
+    BACKGROUND_RESULTS_LIMIT most recently used ones) and a task still in
+    flight from an interrupted rerun is picked up instead of resubmitted.
+    ``timeout`` is the task's deadline in seconds.
+    """
+    results = st.session_state.setdefault('background_results', OrderedDict())
+    pending = st.session_state.setdefault('background_tasks', {})
+    if key is not None and key in results:
+        results.move_to_end(key)
+        return results[key]
+    
+    service = workers.get_worker_service()
+    task_id = pending.get(key) if key is not None else None
+    if task_id is None or service.status(task_id)['state'] == 'unknown':
+        task_id = service.submit(task_name, *args, timeout=timeout)
+        if key is not None:
+            pending[key] = task_id
+    
+    progress_bar = st.progress(0.0, text=label)
+    try:
+        status = service.status(task_id)
+        while status['state'] not in ('done', 'failed'):
+            progress_bar.progress(min(1.0, status['progress']), text=label)
+            time.sleep(BACKGROUND_POLL_INTERVAL)
+            status = service.status(task_id)
+        
+        result = service.result(task_id)
+        service.forget(task_id)
+        pending.pop(key, None)
+        if key is not None:
+            results[key] = result
+            while len(results) > BACKGROUND_RESULTS_LIMIT:
+                results.popitem(last=False)
+        return result
+    except Exception:
+        service.forget(task_id)
+        pending.pop(key, None)
+        raise
+    finally:
+        progress_bar.empty()
+
 # --- Helper Functions ---
 def extract_text_from_pdf(file):
     """Extract text from a PDF file using pypdf."""
     try:
-        # Make a copy of the file to avoid modifying the original
-        if hasattr(file, 'seek'):
-            file.seek(0)
-        
-        pdf_reader = pypdf.PdfReader(file)
-        text = []
-        for page in pdf_reader.pages:
-            content = page.extract_text()
-            if content:
-                text.append(content)
-        return "\n".join(text)
+        return parsing.extract_text_from_pdf(file)
     except Exception as e:
         st.error(f"Failed to extract text from PDF: {str(e)}")
         return ""
 
-def parse_resume_sections(resume_text):
-    """Parse resume text into sections using regex patterns and AI assistance."""
-    # First try to identify common section headers
-    common_sections = {
-        "Contact Information": [],
-        "Summary": [],
-        "Professional Summary": [],
-        "Objective": [],
-        "Skills": [],
-        "Technical Skills": [],
-        "Soft Skills": [],
-        "Experience": [],
-        "Work Experience": [],
-        "Employment History": [],
-        "Education": [],
-        "Projects": [],
-        "Certifications": [],
-        "Publications": [],
-        "Patents": [],
-        "Awards": [],
-        "Achievements": [],
-        "Languages": [],
-        "Interests": [],
-        "Hobbies": [],
-        "Volunteer Experience": [],
-        "Professional Affiliations": [],
-        "References": []
-    }
-    
-    # Try to extract sections using regex patterns
-    lines = resume_text.split('\n')
-    current_section = "Contact Information"  # Default first section
-    
-    # Common section header patterns - expanded with more variations
-    section_patterns = {
-        r'(?i)^\s*(contact|personal|info|contact information|personal information|contact details|personal details|contact info)\s*:?\s*$': "Contact Information",
-        r'(?i)^\s*(summary|professional summary|profile|about me|career summary|executive summary|professional profile)\s*:?\s*$': "Summary",
-        r'(?i)^\s*(objective|career objective|professional objective|career goal|job objective)\s*:?\s*$': "Objective",
-        r'(?i)^\s*(skills|technical skills|core skills|key skills|competencies|areas of expertise|areas of knowledge)\s*:?\s*$': "Skills",
-        r'(?i)^\s*(technical skills|hard skills|technical competencies|technical expertise)\s*:?\s*$': "Technical Skills",
-        r'(?i)^\s*(soft skills|interpersonal skills|people skills|communication skills)\s*:?\s*$': "Soft Skills",
-        r'(?i)^\s*(experience|work experience|employment|employment history|work history|career history|professional experience)\s*:?\s*$': "Experience",
-        r'(?i)^\s*(education|academic background|qualifications|academic qualifications|educational background)\s*:?\s*$': "Education",
-        r'(?i)^\s*(projects|project experience|key projects|relevant projects|personal projects)\s*:?\s*$': "Projects",
-        r'(?i)^\s*(certifications|certificates|professional certifications|credentials|qualifications)\s*:?\s*$': "Certifications",
-        r'(?i)^\s*(publications|papers|research papers|articles|published works)\s*:?\s*$': "Publications",
-        r'(?i)^\s*(patents|patent applications|inventions)\s*:?\s*$': "Patents",
-        r'(?i)^\s*(awards|honors|recognitions|achievements)\s*:?\s*$': "Awards",
-        r'(?i)^\s*(achievements|accomplishments|key achievements)\s*:?\s*$': "Achievements",
-        r'(?i)^\s*(languages|language skills|language proficiency|foreign languages)\s*:?\s*$': "Languages",
-        r'(?i)^\s*(interests|hobbies|activities|personal interests)\s*:?\s*$': "Interests",
-        r'(?i)^\s*(volunteer|volunteering|volunteer experience|community service)\s*:?\s*$': "Volunteer Experience",
-        r'(?i)^\s*(affiliations|professional affiliations|memberships|professional memberships)\s*:?\s*$': "Professional Affiliations",
-        r'(?i)^\s*(references|professional references|character references)\s*:?\s*$': "References"
-    }
-    
-    # Process each line
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if this line is a section header
-        is_section_header = False
-        for pattern, section in section_patterns.items():
-            if re.match(pattern, line):
-                current_section = section
-                is_section_header = True
-                break
-                
-        if not is_section_header:
-            common_sections[current_section].append(line)
-    
-    # Convert lists to strings
-    parsed_sections = {}
-    for section, content in common_sections.items():
-        if content:
-            parsed_sections[section] = "\n".join(content)
-    
-    # If we couldn't parse much, use AI to help if available
-    if len(parsed_sections) <= 2 and GEMINI_AVAILABLE:
-        return extract_sections_with_ai(resume_text)
-    
-    # If we still don't have much, try a simpler approach
-    if len(parsed_sections) <= 2:
-        return extract_sections_simple(resume_text)
-        
-    return parsed_sections
+def extract_text_in_background(file):
+    """Extract text from a PDF file in the worker pool, falling back to inline extraction."""
+    try:
+        file.seek(0)
+        pdf_bytes = file.getvalue() if hasattr(file, 'getvalue') else file.read()
+        return run_background_task("extract_text", pdf_bytes,
+                                   key=f"extract_text:{hashlib.sha1(pdf_bytes).hexdigest()}",
+                                   label="Extracting text...")
+    except Exception as e:
+        st.warning(f"Background extraction unavailable, extracting inline: {str(e)}")
+        return extract_text_from_pdf(file)
 
-def extract_sections_simple(resume_text):
-    """Simple fallback method to extract resume sections without AI."""
-    # Basic extraction based on line breaks and capitalization patterns
-    sections = {}
-    lines = resume_text.split('\n')
-    
-    # Try to identify contact info (usually at the top)
-    contact_lines = []
-    for i, line in enumerate(lines[:10]):  # Check first 10 lines
-        if re.search(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', line) or re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', line):
-            contact_lines.append(line)
-    
-    # Add name (usually the first line)
-    if lines and lines[0].strip() and not re.search(r'@|www|\d{3}[-.]?\d{3}[-.]?\d{4}', lines[0]):
-        contact_lines.insert(0, lines[0].strip())
-            
-    if contact_lines:
-        sections["Personal Information"] = "\n".join(contact_lines)
-    
-    # Look for skills (keywords, comma-separated lists)
-    skills_pattern = r'\b(python|java|javascript|html|css|react|angular|vue|node|express|django|flask|sql|nosql|mongodb|mysql|postgresql|aws|azure|gcp|docker|kubernetes|git|agile|scrum|machine learning|deep learning|nlp|ai|data science|data analysis|statistics|communication|leadership|teamwork|problem solving)\b'
-    skills = set()
-    for line in lines:
-        matches = re.findall(skills_pattern, line.lower())
-        skills.update(matches)
-    
-    if skills:
-        sections["Skills"] = ", ".join(sorted(skills))
-    
-    # Try to identify education (look for degree keywords)
-    education_lines = []
-    for i, line in enumerate(lines):
-        if re.search(r'\b(degree|bachelor|master|phd|mba|bsc|msc|ba|bs|ms|university|college|school|gpa)\b', line.lower()):
-            education_lines.append(line)
-    
-    if education_lines:
-        sections["Education"] = "\n".join(education_lines)
-    
-    # Try to identify experience (look for date patterns)
-    experience_lines = []
-    for i, line in enumerate(lines):
-        if re.search(r'\b(20\d\d|19\d\d)[-–—]?(20\d\d|19\d\d|present|current)\b', line.lower()):
-            # Include this line and the next few lines as they likely describe the role
-            experience_lines.append(line)
-            for j in range(1, 5):  # Include up to 5 lines after a date pattern
-                if i+j < len(lines) and lines[i+j].strip():
-                    experience_lines.append(lines[i+j])
-    
-    if experience_lines:
-        sections["Experience"] = "\n".join(experience_lines)
+def analyze_ats_in_background(file):
+    """Local ATS format report of an uploaded PDF from the worker pool, or None when the PDF cannot be read."""
+    try:
+        file.seek(0)
+        pdf_bytes = file.getvalue() if hasattr(file, 'getvalue') else file.read()
+        return run_background_task("ats_report", pdf_bytes,
+                                   key=f"ats_report:{hashlib.sha1(pdf_bytes).hexdigest()}",
+                                   label="Checking ATS format...")
+    except Exception as e:
+        st.warning(f"ATS format check unavailable: {str(e)}")
+        return None
+
+def display_ats_report(ats_report):
+    """List each ATS format check with its outcome, detail and penalty."""
+    with st.expander(f"ATS Format Check: {ats_report['ats_score']}/100", expanded=False):
+        for check in ats_report['checks']:
+            icon = "✅" if check['passed'] else "❌"
+            penalty = f" (-{check['penalty']:g})" if check['penalty'] else ""
+            st.markdown(f"{icon} **{check['label']}**{penalty}: {check['detail']}")
+
+def display_resume_score(sections, ats_report=None, scores=None, suggestions=None):
+    """Local score panel: content scores, the PDF's ATS format score, section completeness and suggestions.
     
-    # Try to identify projects (look for project keywords)
-    project_lines = []
-    in_project_section = False
-    for i, line in enumerate(lines):
-        if re.search(r'\b(project|projects|portfolio|github)\b', line.lower()):
-            in_project_section = True
-            project_lines.append(line)
-        elif in_project_section and line.strip():
-            project_lines.append(line)
-            # End project section if we hit another major section
-            if re.search(r'\b(education|experience|skills|certification|reference)\b', line.lower()):
-                in_project_section = False
+    ``scores`` and ``suggestions`` may come from a ResumeAnalysis graph, which
+    recombines them from cached per-section components; otherwise they are
+    computed here (from the same component cache).
+    """
+    st.markdown('<h2 class="section-header">Resume Score & Analysis</h2>', unsafe_allow_html=True)
     
-    if project_lines:
-        sections["Projects"] = "\n".join(project_lines)
+    # Calculate scores based on resume content
+    if scores is None:
+        scores = calculate_resume_scores(sections)
+    if ats_report:
+        # Format compatibility from the PDF's structure rather than section presence
+        # (a copy: graph scores are shared and must not be edited)
+        scores = dict(scores, format_score=ats_report['ats_score'])
     
-    # Try to identify certifications
-    cert_lines = []
-    in_cert_section = False
-    for i, line in enumerate(lines):
-        if re.search(r'\b(certification|certificate|certified|credential)\b', line.lower()):
-            in_cert_section = True
-            cert_lines.append(line)
-        elif in_cert_section and line.strip():
-            cert_lines.append(line)
-            # End certification section if we hit another major section
-            if re.search(r'\b(education|experience|skills|project|reference)\b', line.lower()):
-                in_cert_section = False
+    # Create a 3-column layout for score display
+    col1, col2, col3 = st.columns(3)
     
-    if cert_lines:
-        sections["Certifications"] = "\n".join(cert_lines)
+    with col1:
+        overall_score = scores['overall']
+        score_class = "score-high" if overall_score >= 80 else "score-medium" if overall_score >= 60 else "score-low"
+        
+        st.markdown(f"""
+        <div class="score-display {score_class}">
+            <span>Overall Score</span>
+            <h2>{overall_score}/100</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Display feedback based on overall score
+        if overall_score >= 80:
+            st.markdown("""
+            <div class="alert alert-success">
+                <strong>Excellent!</strong> Your resume is well-structured and comprehensive.
+            </div>
+            """, unsafe_allow_html=True)
+        elif overall_score >= 60:
+            st.markdown("""
+            <div class="alert alert-warning">
+                <strong>Good start!</strong> Your resume has potential but needs some improvements.
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown("""
+            <div class="alert alert-error">
+                <strong>Needs work!</strong> Your resume requires significant improvements to be competitive.
+            </div>
+            """, unsafe_allow_html=True)
     
-    # Try to identify summary/objective (usually near the top, after contact info)
-    summary_lines = []
-    for i, line in enumerate(lines[1:15]):  # Check lines 1-15
-        if re.search(r'\b(summary|objective|profile|about me)\b', line.lower()):
-            summary_lines.append(line)
-            # Include the next few lines as they likely contain the summary
-            for j in range(1, 5):
-                if i+j < len(lines) and lines[i+j].strip():
-                    summary_lines.append(lines[i+j])
+    with col2:
+        ats_score = scores['ats_compatibility']
+        score_class = "score-high" if ats_score >= 80 else "score-medium" if ats_score >= 60 else "score-low"
+        
+        st.markdown(f"""
+        <div class="score-display {score_class}">
+            <span>ATS Compatibility</span>
+            <h2>{ats_score}/100</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Display custom progress bars for ATS factors
+        st.markdown('<div class="subsection-header">ATS Factors</div>', unsafe_allow_html=True)
+        
+        # Keywords presence
+        keyword_score = scores.get('keyword_score', 65)
+        st.markdown(f"""
+        <div>Keywords Presence</div>
+        <div class="progress-container">
+            <div class="progress-bar" style="width: {keyword_score}%;"></div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Format compatibility
+        format_score = scores.get('format_score', 75)
+        st.markdown(f"""
+        <div>Format Compatibility</div>
+        <div class="progress-container">
+            <div class="progress-bar" style="width: {format_score}%;"></div>
+        </div>
+        """, unsafe_allow_html=True)
     
-    if summary_lines:
-        sections["Summary"] = "\n".join(summary_lines)
+    with col3:
+        content_score = scores['content_quality']
+        score_class = "score-high" if content_score >= 80 else "score-medium" if content_score >= 60 else "score-low"
+        
+        st.markdown(f"""
+        <div class="score-display {score_class}">
+            <span>Content Quality</span>
+            <h2>{content_score}/100</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Display section completeness
+        st.markdown('<div class="subsection-header">Section Completeness</div>', unsafe_allow_html=True)
+        
+        # Check for key sections
+        key_sections = {
+            'Personal Information': sections.get('Personal Information', '') != '',
+            'Summary/Objective': sections.get('Summary', '') != '' or sections.get('Objective', '') != '',
+            'Skills': sections.get('Skills', '') != '',
+            'Experience': sections.get('Experience', '') != '',
+            'Education': sections.get('Education', '') != '',
+            'Projects': sections.get('Projects', '') != ''
+        }
+        
+        for section, present in key_sections.items():
+            if present:
+                st.markdown(f"""
+                <div style="display: flex; align-items: center; margin-bottom: 8px;">
+                    <div style="color: var(--success-color); margin-right: 10px;">✓</div>
+                    <div>{section}</div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                <div style="display: flex; align-items: center; margin-bottom: 8px;">
+                    <div style="color: var(--error-color); margin-right: 10px;">✗</div>
+                    <div>{section} <span style="color: var(--error-color); font-size: 12px;">(Missing)</span></div>
+                </div>
+                """, unsafe_allow_html=True)
     
-    # If we still don't have much, just split the text into chunks
-    if len(sections) <= 2:
-        chunk_size = max(5, len(lines) // 5)  # Divide into roughly 5 sections
-        for i in range(0, len(lines), chunk_size):
-            section_name = f"Section {i//chunk_size + 1}"
-            sections[section_name] = "\n".join(lines[i:i+chunk_size])
+    # Improvement suggestions
+    st.markdown('<div class="subsection-header">Improvement Suggestions</div>', unsafe_allow_html=True)
     
-    # Add empty strings for important missing sections
-    important_sections = [
-        "Personal Information", "Summary", "Skills", "Experience", 
-        "Education", "Projects", "Certifications"
-    ]
+    if suggestions is None:
+        suggestions = generate_improvement_suggestions(sections, scores)
     
-    for section in important_sections:
-        if section not in sections:
-            sections[section] = ""
+    for i, suggestion in enumerate(suggestions):
+        st.markdown(f"""
+        <div class="card">
+            <div class="card-header">Suggestion #{i+1}</div>
+            <div class="card-content">{suggestion}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def parse_resume_sections(resume_text):
+    """Parse resume text into sections using regex patterns and AI assistance."""
+    sections, confidence, _ = parsing.parse_sections_with_confidence(resume_text)
+    return route_parsed_sections(resume_text, sections, confidence)
+
+def route_parsed_sections(resume_text, sections, confidence):
+    """Keep the local parse unless its confidence is below the threshold, then ask the model.
     
+    The parse becomes the shared ResumeDocument here, once; matching and
+    tenure look the same document up by content.
+    """
+    if confidence < PARSE_CONFIDENCE_THRESHOLD and GEMINI_AVAILABLE:
+        parsing.record_parse_route('ai')
+        sections = extract_sections_with_ai(resume_text)
+    else:
+        parsing.record_parse_route('local')
+    as_resume_document(sections)
     return sections
 
+def load_resume_in_background(file):
+    """Extract and parse an uploaded resume in the worker pool, using AI only when local parse confidence is low."""
+    try:
+        file.seek(0)
+        pdf_bytes = file.getvalue() if hasattr(file, 'getvalue') else file.read()
+        parsed = run_background_task("extract_and_parse", pdf_bytes,
+                                     key=f"extract_and_parse:{hashlib.sha1(pdf_bytes).hexdigest()}",
+                                     label="Extracting resume text...")
+    except Exception as e:
+        st.warning(f"Background parsing unavailable, parsing inline: {str(e)}")
+        resume_text = extract_text_from_pdf(file)
+        return resume_text, parse_resume_sections(resume_text)
+    
+    # Route once per file so reruns neither re-call the model nor skew the routing stats
+    resume_text = parsed['text']
+    if 'routed_sections' not in parsed:
+        parsed['routed_sections'] = route_parsed_sections(resume_text, parsed['sections'], parsed['confidence'])
+    return resume_text, parsed['routed_sections']
+
+def uploaded_file_key(file):
+    """Content hash identifying an uploaded file across reruns."""
+    file.seek(0)
+    file_bytes = file.getvalue() if hasattr(file, 'getvalue') else file.read()
+    file.seek(0)
+    return hashlib.sha1(file_bytes).hexdigest()
+
+def store_upload_once(file, file_key, file_type="original"):
+    """Store an uploaded file the first time it is seen; later reruns reuse the stored name."""
+    stored = st.session_state.setdefault('stored_uploads', {})
+    if file_key not in stored:
+        file_name = store_file_in_supabase(file, st.session_state['user_id'], file_type)
+        if not file_name:
+            return None
+        stored[file_key] = file_name
+    return stored[file_key]
+
+def get_resume_analysis(file_key, resume_text):
+    """Return the incremental analysis graph for an uploaded resume, creating it on first use.
+
+    Gemini scoring and suggestions depend only on the extracted resume text,
+    so editing a section never re-calls the API.
+    """
+    analyses = st.session_state.setdefault('resume_analyses', {})
+    analysis = analyses.get(file_key)
+    if analysis is None:
+        analysis = ResumeAnalysis()
+        analysis.define("ai_scores", ["resume_text"],
+                        lambda text: call_gemini_api("score_resume", {"text": text}))
+        analysis.define("ai_suggestions", ["resume_text"],
+                        lambda text: call_gemini_api("generate_suggestions", {"text": text}))
+        # Only the current upload's graph is kept
+        analyses.clear()
+        analyses[file_key] = analysis
+    analysis.set_input("resume_text", resume_text)
+    return analysis
+
 def extract_sections_with_ai(resume_text):
     """Use Gemini AI to extract sections from resume text with enhanced categorization."""
     if not GEMINI_AVAILABLE:
@@ -1495,132 +1680,160 @@ def generate_pdf_from_sections(sections, template_name, options=None):
         return None
         
     try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, Flowable
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-        
-        buffer = io.BytesIO()
-        
-        # Set up the document with consistent margins
-        doc = SimpleDocTemplate(buffer, pagesize=letter, 
-                               leftMargin=0.75*inch, rightMargin=0.75*inch,
-                               topMargin=0.75*inch, bottomMargin=0.75*inch)
-        
-        styles = getSampleStyleSheet()
-        
-        # Create custom styles for all templates
-        styles.add(ParagraphStyle(name='Name',
-                                 parent=styles['Heading1'],
-                                 fontSize=24,
-                                 spaceAfter=12,
-                                 alignment=TA_CENTER,
-                                 textColor=colors.darkblue))
-        
-        styles.add(ParagraphStyle(name='ContactInfo',
-                                 parent=styles['Normal'],
-                                 fontSize=10,
-                                 alignment=TA_CENTER,
-                                 spaceAfter=12))
-        
-        styles.add(ParagraphStyle(name='SectionHeader',
-                                 parent=styles['Heading2'],
-                                 fontSize=14,
-                                 spaceAfter=6,
-                                 textColor=colors.darkblue,
-                                 borderWidth=1,
-                                 borderColor=colors.darkblue,
-                                 borderPadding=5,
-                                 borderRadius=0))
-        
-        styles.add(ParagraphStyle(name='Content',
-                                 parent=styles['Normal'],
-                                 fontSize=10,
-                                 spaceAfter=6))
-        
-        # Build the document
-        elements = []
-        
-        # Add name if available (usually in contact info)
-        name = ""
-        if "Contact Information" in sections:
-            # Try to extract name from first line of contact info
-            name_line = sections["Contact Information"].split('\n')[0]
-            if not re.search(r'@|www|\d{3}[-.]?\d{3}[-.]?\d{4}', name_line):
-                name = name_line
-        
-        if name:
-            elements.append(Paragraph(name, styles['Name']))
-            elements.append(Spacer(1, 6))
-        
-        # Add contact information
-        if "Contact Information" in sections:
-            contact_info = sections["Contact Information"].replace('\n', ' | ')
-            elements.append(Paragraph(contact_info, styles['ContactInfo']))
-            elements.append(Spacer(1, 12))
-        
-        # Template-specific formatting
-        if template_name == "Minimalist":
-            # Clean, simple design with focus on content
-            for section in ["Summary", "Skills", "Experience", "Education", "Projects", "Certifications"]:
-                if section in sections and sections[section]:
-                    elements.append(Paragraph(section.upper(), styles['SectionHeader']))
-                    elements.append(Paragraph(sections[section].replace('\n', '<br/>'), styles['Content']))
-                    elements.append(Spacer(1, 12))
-                    
-        elif template_name == "ATS-Friendly":
-            # Optimized for Applicant Tracking Systems
-            for section in ["Summary", "Skills", "Experience", "Education", "Projects", "Certifications"]:
-                if section in sections and sections[section]:
-                    elements.append(Paragraph(section.upper(), styles['SectionHeader']))
-                    # Format content for ATS
-                    content = sections[section].replace('\n', '<br/>')
-                    if section == "Skills":
-                        # Format skills as bullet points for better ATS parsing
-                        skills_list = content.split(',')
-                        content = "<br/>".join(f"• {skill.strip()}" for skill in skills_list if skill.strip())
-                    elements.append(Paragraph(content, styles['Content']))
-                    elements.append(Spacer(1, 12))
-                    
-        elif template_name == "Project-Focused":
-            # Highlights projects and technical skills
-            # First add Projects section if available
-            if "Projects" in sections and sections["Projects"]:
-                elements.append(Paragraph("PROJECTS", styles['SectionHeader']))
-                projects_text = sections["Projects"]
-                # Split by newlines and format each project
-                project_entries = projects_text.split('\n\n')
-                for entry in project_entries:
-                    lines = entry.split('\n')
-                    if lines:
-                        # First line as project title
-                        elements.append(Paragraph(lines[0], styles['SectionHeader']))
-                        if len(lines) > 1:
-                            # Remaining lines as project description
-                            project_desc = '<br/>'.join(lines[1:])
-                            elements.append(Paragraph(project_desc, styles['Content']))
-                    elements.append(Spacer(1, 8))
-                elements.append(Spacer(1, 4))
-            
-            # Then add other sections
-            for section in ["Summary", "Skills", "Experience", "Education", "Certifications"]:
-                if section in sections and sections[section]:
-                    elements.append(Paragraph(section.upper(), styles['SectionHeader']))
-                    elements.append(Paragraph(sections[section].replace('\n', '<br/>'), styles['Content']))
-                    elements.append(Spacer(1, 12))
-        
-        # Build the PDF
-        doc.build(elements)
-        return buffer.getvalue()
-    
+        etag = render_key(sections, template_name, options)
+        pdf_bytes = cached_pdf_render(etag)
+        if pdf_bytes is None:
+            pdf_bytes = run_background_task("render_pdf", sections, template_name, options,
+                                            label="Rendering PDF...", timeout=workers.RENDER_TIMEOUT)
+            remember_pdf_render(etag, pdf_bytes)
+        return pdf_bytes
+    except workers.WorkerBusy:
+        st.error("Too many PDFs are being generated right now. Please try again in a moment.")
+        return None
     except Exception as e:
         st.error(f"Failed to generate PDF: {str(e)}")
         return None
 
+def cached_pdf_render(etag):
+    """PDF bytes for a render ETag from the session's last render or the render cache, else None."""
+    # Same ETag as the session's last render: the bytes it holds are still valid
+    last_render = st.session_state.get('last_render')
+    if last_render is not None and last_render['etag'] == etag:
+        return last_render['pdf']
+    pdf_bytes = get_render_cache(RENDER_CACHE_DIR).get(etag)
+    if pdf_bytes is not None:
+        st.session_state['last_render'] = {'etag': etag, 'pdf': pdf_bytes}
+    return pdf_bytes
+
+def remember_pdf_render(etag, pdf_bytes):
+    """Store a finished render in the render cache and as the session's last render."""
+    get_render_cache(RENDER_CACHE_DIR).put(etag, pdf_bytes)
+    st.session_state['last_render'] = {'etag': etag, 'pdf': pdf_bytes}
+
+def start_pdf_render(sections, template_name, options=None):
+    """Start rendering a PDF without waiting and return a handle for poll_pdf_render.
+
+    A cached render completes the handle at once; otherwise the render is
+    queued in the worker pool (raising workers.WorkerBusy when its queue
+    is full).
+    """
+    etag = render_key(sections, template_name, options)
+    handle = {'etag': etag, 'template': template_name, 'task_id': None, 'pdf': cached_pdf_render(etag),
+              'error': None, 'progress': 0.0, 'page': None, 'polled_at': time.monotonic()}
+    if handle['pdf'] is None:
+        handle['task_id'] = workers.get_worker_service().submit(
+            "render_pdf", sections, template_name, options, timeout=workers.RENDER_TIMEOUT)
+    return handle
+
+def poll_pdf_render(handle):
+    """Advance a render handle without blocking; True once it holds the PDF or an error."""
+    handle['polled_at'] = time.monotonic()
+    if handle['pdf'] is not None or handle['error'] is not None:
+        return True
+    service = workers.get_worker_service()
+    status = service.status(handle['task_id'])
+    handle['progress'] = status['progress']
+    if status['state'] == 'done':
+        try:
+            handle['pdf'] = service.result(handle['task_id'])
+            remember_pdf_render(handle['etag'], handle['pdf'])
+        except Exception as e:
+            handle['error'] = str(e)
+    elif status['state'] in ('failed', 'unknown'):
+        handle['error'] = status['error'] or "The render was lost; please generate the PDF again."
+    else:
+        return False
+    service.forget(handle['task_id'])
+    return True
+
+def _pdf_render_progress(state_key):
+    """Poll a session render on a timer and rerun the page once it finishes."""
+    handle = st.session_state.get(state_key)
+    if handle is None:
+        return  # forgotten by expire_pdf_renders
+    if poll_pdf_render(handle):
+        st.rerun()
+    st.progress(min(1.0, handle['progress']), text="Rendering PDF...")
+
+if STREAMLIT_FRAGMENTS_AVAILABLE:
+    _pdf_render_progress = st.fragment(run_every=RENDER_POLL_INTERVAL)(_pdf_render_progress)
+
+def display_pdf_render(state_key='pdf_render', label="Download Resume PDF", file_name=None,
+                       preview_key='pdf_preview'):
+    """Show a session PDF render: progress while it runs, then its download button or error.
+
+    While the render runs, only a fragment polls it, so the rest of the
+    page stays interactive; without fragments this waits for the render.
+    Returns the PDF bytes once the render is done, else None.
+    """
+    handle = st.session_state[state_key]
+    if not poll_pdf_render(handle):
+        if STREAMLIT_FRAGMENTS_AVAILABLE:
+            _pdf_render_progress(state_key)
+            return None
+        with st.spinner("Generating PDF resume..."):
+            while not poll_pdf_render(handle):
+                time.sleep(BACKGROUND_POLL_INTERVAL)
+    
+    if handle['error'] is not None:
+        st.error(f"Failed to generate PDF: {handle['error']}")
+        del st.session_state[state_key]
+        return None
+    
+    # Store PDF in session state for preview
+    st.session_state[preview_key] = handle['pdf']
+    st.session_state[preview_key + '_etag'] = handle['etag']
+    st.download_button(
+        label=label,
+        data=handle['pdf'],
+        file_name=file_name or f"optimized_resume_{handle['template'].lower().replace(' ', '_')}.pdf",
+        mime="application/pdf",
+        use_container_width=True,
+        key=f"{state_key}_download"
+    )
+    st.success("Resume PDF generated successfully!")
+    return handle['pdf']
+
+def request_pdf_render(state_key, sections, template_name, options=None, page=None):
+    """Start a render into a session key, reporting why it could not start.
+    
+    A render requested from a sidebar ``page`` is forgotten once another
+    page is shown (see expire_pdf_renders).
+    """
+    if not REPORTLAB_AVAILABLE:
+        st.error("ReportLab is not available. PDF generation cannot proceed.")
+        return
+    forget_pdf_render(state_key)
+    try:
+        st.session_state[state_key] = dict(start_pdf_render(sections, template_name, options), page=page)
+    except workers.WorkerBusy:
+        st.error("Too many PDFs are being generated right now. Please try again in a moment.")
+    except Exception as e:
+        st.error(f"Failed to generate PDF: {str(e)}")
+
+def forget_pdf_render(state_key):
+    """Drop a session render handle, and its worker task when the render is still running."""
+    handle = st.session_state.pop(state_key, None)
+    if handle is not None and handle['pdf'] is None and handle['error'] is None:
+        workers.get_worker_service().forget(handle['task_id'])
+
+def expire_pdf_renders(page):
+    """Forget render handles requested from another page, or still running but not polled lately.
+    
+    A handle is only polled while its page section is shown; without this,
+    a render the user navigated away from would keep its PDF (or its
+    worker task) in the session for good.
+    """
+    now = time.monotonic()
+    for state_key in PDF_RENDER_KEYS:
+        handle = st.session_state.get(state_key)
+        if handle is None:
+            continue
+        running = handle['pdf'] is None and handle['error'] is None
+        if (handle['page'] is not None and handle['page'] != page) or \
+                (running and now - handle['polled_at'] > RENDER_HANDLE_TIMEOUT):
+            forget_pdf_render(state_key)
+
 def generate_suggestions(resume_text, resume_sections):
     """Generate improvement suggestions using Gemini AI."""
     try:
@@ -1775,7 +1988,7 @@ def extract_job_features(job_description):
         }
 
 def calculate_match_score(resume_sections, job_features):
-    """Calculate match score between resume and job using Gemini AI."""
+    """Calculate match score between resume and job using Gemini AI; None if the response is unusable."""
     try:
         model = genai.GenerativeModel(
             model_name="gemini-1.5-flash",
@@ -1812,23 +2025,11 @@ def calculate_match_score(resume_sections, job_features):
             except json.JSONDecodeError:
                 pass
                 
-        # Fallback match data
-        return {
-            "match_score": 55,
-            "skills_match": 60,
-            "experience_match": 50,
-            "education_match": 65,
-            "overall_fit": 55
-        }
+        # The caller keeps the local scores
+        return None
     except Exception as e:
         st.error(f"Match calculation failed: {str(e)}")
-        return {
-            "match_score": 55,
-            "skills_match": 60,
-            "experience_match": 50,
-            "education_match": 65,
-            "overall_fit": 55
-        }
+        return None
 
 def generate_enhancements(resume_sections, job_features):
     """Generate job-specific enhancements using Gemini AI."""
@@ -1990,26 +2191,24 @@ def call_gemini_api(endpoint, data):
                 return extract_job_features(data.get("text", ""))
             else:
                 # Simple job feature extraction without AI
-                job_text = data.get("text", "")
-                return {
-                    "Required Skills": extract_skills_simple(job_text),
-                    "Required Experience": extract_experience_simple(job_text),
-                    "Education Requirements": extract_education_simple(job_text),
-                    "Job Responsibilities": "Review the job description for detailed responsibilities",
-                    "Company Values/Culture": "Review the job description for company culture information"
-                }
+                return extract_job_features_local(data.get("text", ""))
         elif endpoint == "calculate_match_score":
-            if GEMINI_AVAILABLE:
-                return calculate_match_score(data.get("resume", {}), data.get("job", {}))
-            else:
-                # Simple match calculation without AI
-                return {
-                    "match_score": 55,
-                    "skills_match": 60,
-                    "experience_match": 50,
-                    "education_match": 65,
-                    "overall_fit": 55
-                }
+            resume_sections, job_features = data.get("resume", {}), data.get("job", {})
+            description = data.get("job_text") or job_text(job_features)
+            match_result = dict(get_match_artifact(resume_sections, description)['scores'], model_refined=False)
+            if GEMINI_AVAILABLE and MATCH_MODEL_REFINE:
+                # Model scores are memoized per match artifact key, failures included (as no scores),
+                # so reruns do not call the model again
+                model_scores = st.session_state.setdefault('model_match_scores', {})
+                key = match_key(resume_sections, description)
+                if key not in model_scores:
+                    refined = calculate_match_score(resume_sections, job_features)
+                    # Years of experience are always compared locally from parsed date ranges
+                    model_scores[key] = {name: refined[name] for name in MODEL_MATCH_SCORES
+                                         if isinstance(refined, dict) and isinstance(refined.get(name), (int, float))}
+                match_result.update(model_scores[key])
+                match_result['model_refined'] = bool(model_scores[key])
+            return match_result
         elif endpoint == "generate_enhancements":
             if GEMINI_AVAILABLE:
                 return generate_enhancements(data.get("resume", {}), data.get("job", {}))
@@ -2079,7 +2278,7 @@ def call_gemini_api(endpoint, data):
                         return None
                 
                 # Generate PDF using our custom function
-                return generate_pdf_from_sections(sections, template)
+                return generate_pdf_from_sections(sections, template, data.get("options"))
             except Exception as e:
                 st.error(f"Failed to generate PDF: {str(e)}")
                 return None
@@ -2091,38 +2290,17 @@ def call_gemini_api(endpoint, data):
         return {}
 
 # Simple helper functions for fallback mode
-def extract_skills_simple(text):
-    """Extract skills from text using regex patterns."""
-    skills_pattern = r'\b(python|java|javascript|html|css|react|angular|vue|node|express|django|flask|sql|nosql|mongodb|mysql|postgresql|aws|azure|gcp|docker|kubernetes|git|agile|scrum|machine learning|deep learning|nlp|ai|data science|data analysis|statistics|communication|leadership|teamwork|problem solving)\b'
-    skills = set()
-    for line in text.lower().split('\n'):
-        matches = re.findall(skills_pattern, line)
-        skills.update(matches)
-    
-    return ", ".join(sorted(skills)) if skills else "No specific skills extracted"
-
-def extract_experience_simple(text):
-    """Extract experience requirements from text."""
-    experience_pattern = r'\b(\d+)[+\-]?\s*(year|yr)[s]?\b'
-    matches = re.findall(experience_pattern, text.lower())
-    if matches:
-        years = [int(match[0]) for match in matches]
-        return f"{max(years)}+ years of experience required"
-    return "Experience requirements not specified"
-
-def extract_education_simple(text):
-    """Extract education requirements from text."""
-    education_pattern = r'\b(bachelor|master|phd|mba|bsc|msc|ba|bs|ms|degree)\b'
-    matches = re.findall(education_pattern, text.lower())
-    if matches:
-        return f"Requires {', '.join(set(matches))} degree"
-    return "Education requirements not specified"
-
-def display_pdf(file):
-    """Display PDF in the app."""
+def display_pdf(file, etag=None):
+    """Display PDF in the app; with an ETag the encoded preview is reused across reruns."""
     try:
-        base64_pdf = base64.b64encode(file.read()).decode('utf-8')
-        pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600" type="application/pdf"></iframe>'
+        inline = st.session_state.get('pdf_inline')
+        if etag is not None and inline is not None and inline[0] == etag:
+            pdf_display = inline[1]
+        else:
+            base64_pdf = base64.b64encode(file.read()).decode('utf-8')
+            pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600" type="application/pdf"></iframe>'
+            if etag is not None:
+                st.session_state['pdf_inline'] = (etag, pdf_display)
         st.markdown(pdf_display, unsafe_allow_html=True)
     except Exception as e:
         st.error(f"Failed to display PDF: {str(e)}")
@@ -2205,7 +2383,8 @@ else:
     # Sidebar Navigation
     st.sidebar.title("Resume Optimizer Pro")
     st.sidebar.markdown("Welcome! Choose a feature below:")
-    page = st.sidebar.radio("Features", ["Resume Enhancer", "Resume Job Matching"], label_visibility="collapsed")
+    page = st.sidebar.radio("Features", ["Resume Enhancer", "Resume Job Matching", "Job Postings", "Resume Search", "Recruiter Ranking"], label_visibility="collapsed")
+    expire_pdf_renders(page)
     st.sidebar.markdown("""
         <div class='tooltip'>
             <span>ℹ️ Need Help?</span>
@@ -2213,6 +2392,10 @@ else:
         </div>
     """, unsafe_allow_html=True)
     
+    route_stats = parsing.parse_route_stats()
+    if route_stats['total']:
+        st.sidebar.caption(f"Resume parses sent to AI: {route_stats['ai_share']:.0%} of {route_stats['total']}")
+    
     # Add logout button
     if st.sidebar.button("Logout"):
         for key in list(st.session_state.keys()):
@@ -2231,16 +2414,12 @@ else:
                 st.error("File size exceeds 5MB limit.")
             else:
                 with st.spinner("Uploading and analyzing resume..."):
-                    # Store file using our improved function
-                    file_name = store_file_in_supabase(uploaded_file, st.session_state['user_id'], "original")
+                    # Store the file once per upload; reruns from section edits reuse it
+                    file_key = uploaded_file_key(uploaded_file)
+                    file_name = store_upload_once(uploaded_file, file_key)
                     if file_name:
-                        # Reset file pointer for reading
-                        uploaded_file.seek(0)
-                        resume_text = extract_text_from_pdf(uploaded_file)
-
-                        # Step 2: Key Feature Extraction
-                        extraction_data = {"text": resume_text}
-                        sections = call_gemini_api("extract_sections", extraction_data)
+                        # Step 2: Key Feature Extraction (extraction and parsing run in the worker pool)
+                        resume_text, sections = load_resume_in_background(uploaded_file)
                         
                         # If API call failed, provide mock data for testing
                         if not sections:
@@ -2288,10 +2467,17 @@ else:
                                     st.success(f"Added {custom_section_name} section!")
                                     st.rerun()
 
+                        # Live feedback: only artifacts downstream of an edited section are recomputed,
+                        # and the format score comes from the uploaded PDF's ATS rubric
+                        analysis = get_resume_analysis(file_key, resume_text)
+                        analysis.update_sections(edited_sections)
+                        ats_report = analyze_ats_in_background(uploaded_file)
+                        display_resume_score(edited_sections, ats_report, scores=analysis.get("scores"),
+                                             suggestions=analysis.get("suggestions"))
+
                         # Step 3: AI-Based Scoring
                         st.markdown("<div class='section-header'>Resume Scoring</div>", unsafe_allow_html=True)
-                        scoring_data = {"text": resume_text}
-                        scores = call_gemini_api("score_resume", scoring_data)
+                        scores = analysis.get("ai_scores")
                         
                         # If API call failed, provide mock data for testing
                         if not scores:
@@ -2305,6 +2491,10 @@ else:
                                 'genai_score': 60, 
                                 'ai_score': 58
                             }
+                        
+                        # The ATS score comes from the PDF's structure, not the model's reading of the text
+                        if ats_report:
+                            scores = dict(scores, ats_score=ats_report['ats_score'])
                             
                         # Display scores in a more organized way
                         col1, col2, col3 = st.columns(3)
@@ -2336,10 +2526,13 @@ else:
                             score_class = "score-low" if ai_score <= 60 else "score-high"
                             st.markdown(f"<div class='score-display {score_class}'>AI Score: {ai_score}/100</div>", unsafe_allow_html=True)
 
+                        if ats_report:
+                            display_ats_report(ats_report)
+
                         # Step 4 & 5: Decision Point and AI-Based Enhancement
                         if overall_score <= 70 or genai_score <= 65 or ai_score <= 65:
                             st.markdown("<div class='section-header'>AI Suggestions</div>", unsafe_allow_html=True)
-                            suggestions = call_gemini_api("generate_suggestions", {"text": resume_text})
+                            suggestions = analysis.get("ai_suggestions")
                             
                             # If API call failed, provide mock data for testing
                             if not suggestions:
@@ -2568,7 +2761,7 @@ else:
                                                     help="Adds a QR code linking to your LinkedIn or portfolio")
                             
                             color_scheme = st.selectbox("Color Scheme", 
-                                                      ["Professional Blue", "Modern Green", "Classic Black", "Creative Purple"],
+                                                      list(COLOR_SCHEMES),
                                                       help="Choose a color scheme for your resume")
                         
                         with enhancement_col2:
@@ -2579,47 +2772,31 @@ else:
                                                           ["Modern", "Traditional", "Compact", "Expanded"],
                                                           help="Choose the overall formatting style")
                         
+                        # The render runs in the worker pool; the page does not wait on it
                         if st.button("Generate and Download Resume", key="generate_resume_btn"):
-                            with st.spinner("Generating enhanced PDF..."):
-                                # Prepare data with all options
-                                template_data = {
-                                    "text": "\n".join(f"{k}: {v}" for k, v in edited_sections.items()), 
-                                    "template": st.session_state['selected_template'],
-                                    "options": {
-                                        "include_qr": include_qr,
-                                        "color_scheme": color_scheme,
-                                        "add_achievements": add_achievements,
-                                        "formatting_style": formatting_style
-                                    }
+                            template_data = {
+                                "sections": edited_sections,
+                                "template": st.session_state['selected_template'],
+                                "options": {
+                                    "include_qr": include_qr,
+                                    "color_scheme": color_scheme,
+                                    "add_achievements": add_achievements,
+                                    "formatting_style": formatting_style
                                 }
-                                
-                                pdf_bytes = call_gemini_api("generate_pdf", template_data)
-                                
-                                if pdf_bytes:
-                                    col1, col2 = st.columns(2)
-                                    with col1:
-                                        st.download_button(
-                                            "📥 Download Enhanced Resume", 
-                                            data=pdf_bytes, 
-                                            file_name="enhanced_resume.pdf", 
-                                            mime="application/pdf",
-                                            help="Download your enhanced resume as a PDF file",
-                                            use_container_width=True
-                                        )
-                                    
-                                    with col2:
-                                        if st.button("📋 Save to My Collection", use_container_width=True):
-                                            # Store the enhanced resume
-                                            enhanced_file = io.BytesIO(pdf_bytes)
-                                            enhanced_file.name = "enhanced_resume.pdf"
-                                            file_name = store_file_in_supabase(enhanced_file, st.session_state['user_id'], "enhanced")
-                                            if file_name:
-                                                st.success("Resume saved to your collection!")
-                                    
-                                    st.session_state['pdf_preview'] = pdf_bytes
-                                    st.success("Resume generated successfully!")
-                                else:
-                                    st.error("Failed to generate PDF. Please try again.")
+                            }
+                            request_pdf_render('enhanced_pdf_render', template_data["sections"],
+                                               template_data["template"], template_data["options"], page=page)
+                        
+                        if 'enhanced_pdf_render' in st.session_state:
+                            pdf_bytes = display_pdf_render('enhanced_pdf_render', label="📥 Download Enhanced Resume",
+                                                           file_name="enhanced_resume.pdf")
+                            if pdf_bytes and st.button("📋 Save to My Collection", use_container_width=True):
+                                # Store the enhanced resume
+                                enhanced_file = io.BytesIO(pdf_bytes)
+                                enhanced_file.name = "enhanced_resume.pdf"
+                                file_name = store_file_in_supabase(enhanced_file, st.session_state['user_id'], "enhanced")
+                                if file_name:
+                                    st.success("Resume saved to your collection!")
 
                         # Preview with improved styling
                         if 'pdf_preview' in st.session_state:
@@ -2639,7 +2816,8 @@ else:
                             <div class="pdf-preview-container">
                             """, unsafe_allow_html=True)
                             
-                            display_pdf(io.BytesIO(st.session_state['pdf_preview']))
+                            display_pdf(io.BytesIO(st.session_state['pdf_preview']),
+                                        etag=st.session_state.get('pdf_preview_etag'))
                             
                             st.markdown("</div>", unsafe_allow_html=True)
                             
@@ -2671,10 +2849,10 @@ else:
                 if uploaded_file.size > 5 * 1024 * 1024:
                     st.error("File size exceeds 5MB limit.")
                 else:
-                    file_name = store_file_in_supabase(uploaded_file, st.session_state['user_id'], "original")
+                    # Store the file once per upload; widget reruns reuse the stored name
+                    file_name = store_upload_once(uploaded_file, uploaded_file_key(uploaded_file))
                     if file_name:
-                        uploaded_file.seek(0)
-                        resume_text = extract_text_from_pdf(uploaded_file)
+                        resume_text = extract_text_in_background(uploaded_file)
                         st.success("Resume uploaded successfully!")
         else:
             # Get list of files from both Supabase and local storage
@@ -2687,7 +2865,7 @@ else:
                     # Get file from either Supabase or local storage
                     resume_file = get_file(selected_resume)
                     if resume_file:
-                        resume_text = extract_text_from_pdf(resume_file)
+                        resume_text = extract_text_in_background(resume_file)
                         st.success(f"Selected resume: {selected_resume}")
                     else:
                         st.error("Failed to retrieve the selected resume.")
@@ -2801,43 +2979,22 @@ else:
                     # Calculate and display gap analysis
                     st.subheader("Skills Gap Analysis")
                     
-                    # Extract skills from resume and job - with type checking to fix AttributeError
-                    resume_skills_text = resume_sections.get("Skills", "")
-                    resume_skills_text = resume_skills_text.lower() if isinstance(resume_skills_text, str) else ""
-                    
-                    # Handle job_skills which may be a list or string
-                    job_skills_data = job_features.get("Required Skills", "")
-                    
-                    # Fix AttributeError by properly handling different types
-                    if isinstance(job_skills_data, list):
-                        job_skills_text = ", ".join(str(skill) for skill in job_skills_data)
-                    elif isinstance(job_skills_data, str):
-                        job_skills_text = job_skills_data.lower()
-                    else:
-                        job_skills_text = str(job_skills_data)
-                    
-                    # Convert to sets for comparison - improved tokenization
-                    resume_skills_set = {skill.strip() for skill in resume_skills_text.replace(",", " ").split() if skill.strip()}
-                    job_skills_set = {skill.strip() for skill in job_skills_text.replace(",", " ").split() if skill.strip()}
-                    
-                    # Find matching and missing skills
-                    matching_skills = resume_skills_set.intersection(job_skills_set)
-                    missing_skills = job_skills_set - resume_skills_set
-                    
-                    # Calculate match percentage
-                    if job_skills_set:
-                        match_percentage = len(matching_skills) / len(job_skills_set) * 100
-                    else:
-                        match_percentage = 0
+                    # Skills come from the shared match artifact, the same one the match scores use
+                    match_artifact = get_match_artifact(resume_sections, job_desc)
+                    matching_skills = match_artifact['matched_skills']
+                    missing_skills = match_artifact['missing_skills']
+                    match_percentage = match_artifact['scores']['skills_match']
                     
                     # Display match score with visual indicator
                     col1, col2 = st.columns([1, 3])
                     with col1:
-                        st.metric("Match Score", f"{match_percentage:.1f}%")
+                        st.metric("Skills Match", "n/a" if match_percentage is None else f"{match_percentage}%")
                     
                     with col2:
                         # Progress bar with color coding
-                        if match_percentage >= 80:
+                        if match_percentage is None:
+                            st.info("The job description names no skills to compare against.")
+                        elif match_percentage >= 80:
                             st.progress(match_percentage/100)
                             st.success("Strong match! Your resume aligns well with this job.")
                         elif match_percentage >= 60:
@@ -2858,7 +3015,7 @@ else:
                     with col1:
                         st.markdown("#### 🎯 Skills Present in Your Resume")
                         if matching_skills:
-                            for skill in sorted(matching_skills):
+                            for skill in matching_skills:
                                 st.markdown(f"- ✅ {skill}")
                         else:
                             st.markdown("No directly matching skills found.")
@@ -2866,7 +3023,7 @@ else:
                     with col2:
                         st.markdown("#### 🚀 Skills to Develop")
                         if missing_skills:
-                            for skill in sorted(missing_skills):
+                            for skill in missing_skills:
                                 st.markdown(f"- ❌ {skill}")
                             
                             # AI-powered advice for addressing skill gaps
@@ -2896,7 +3053,7 @@ else:
                     
                     # Add skill-specific recommendations if there are missing skills
                     if missing_skills:
-                        recommendations.insert(0, f"Add these key skills to your resume (if you possess them): {', '.join(list(missing_skills)[:5])}")
+                        recommendations.insert(0, f"Add these key skills to your resume (if you possess them): {', '.join(missing_skills[:5])}")
                     
                     # Display recommendations as checklist
                     for idx, rec in enumerate(recommendations):
@@ -2910,18 +3067,11 @@ else:
                 st.markdown("<div class='section-header'>Match Analysis</div>", unsafe_allow_html=True)
                 
                 match_data = {"resume": resume_sections, "job": job_features}
-                match_result = call_gemini_api("calculate_match_score", match_data)
+                match_result = call_gemini_api("calculate_match_score", dict(match_data, job_text=job_desc))
                 
-                # If API call failed, provide mock data for testing
                 if not match_result:
-                    st.warning("API call failed. Using sample match score for demonstration.")
-                    match_result = {
-                        'match_score': 55,
-                        'skills_match': 60,
-                        'experience_match': 50,
-                        'education_match': 65,
-                        'overall_fit': 55
-                    }
+                    st.warning("Match scoring failed; scores are unavailable.")
+                    match_result = {}
                 
                 # Display match scores in a more visual way
                 col1, col2, col3 = st.columns(3)
@@ -2933,13 +3083,19 @@ else:
                 
                 with col2:
                     skills_match = match_result.get('skills_match', 0)
-                    score_class = "score-low" if skills_match <= 60 else "score-high"
-                    st.markdown(f"<div class='score-display {score_class}'>Skills Match: {skills_match}/100</div>", unsafe_allow_html=True)
+                    if skills_match is None:
+                        # The job names no skills, so there is nothing to score
+                        st.markdown("<div class='score-display'>Skills Match: n/a</div>", unsafe_allow_html=True)
+                    else:
+                        score_class = "score-low" if skills_match <= 60 else "score-high"
+                        st.markdown(f"<div class='score-display {score_class}'>Skills Match: {skills_match}/100</div>", unsafe_allow_html=True)
                 
                 with col3:
                     experience_match = match_result.get('experience_match', 0)
                     score_class = "score-low" if experience_match <= 60 else "score-high"
                     st.markdown(f"<div class='score-display {score_class}'>Experience Match: {experience_match}/100</div>", unsafe_allow_html=True)
+                    if 'total_years' in match_result:
+                        st.caption(f"{match_result['total_years']} years of dated experience found")
                 
                 # Additional scores
                 col1, col2 = st.columns(2)
@@ -2954,6 +3110,16 @@ else:
                     score_class = "score-low" if overall_fit <= 60 else "score-high"
                     st.markdown(f"<div class='score-display {score_class}'>Cultural Fit: {overall_fit}/100</div>", unsafe_allow_html=True)
 
+                section_similarity = match_result.get('section_similarity') or {}
+                similarity_labels = {
+                    'summary_vs_responsibilities': "Summary ↔ Responsibilities",
+                    'experience_vs_requirements': "Experience ↔ Requirements",
+                }
+                similarity_notes = [f"{similarity_labels.get(name, name)}: {value}%"
+                                    for name, value in section_similarity.items() if value is not None]
+                if similarity_notes:
+                    st.caption("Text similarity — " + " · ".join(similarity_notes))
+
                 # Step 5 & 6: Decision Point and AI-Based Enhancement
                 st.markdown("<div class='section-header'>Resume Optimization</div>", unsafe_allow_html=True)
                 
@@ -3017,50 +3183,149 @@ else:
                 template = st.selectbox("Choose a Template", ["Minimalist", "ATS-Friendly", "Project-Focused"])
 
                 # Step 9: Download and Storage
+                # The render runs in the worker pool; the page does not wait on it
                 if st.button("Generate and Download Tailored Resume"):
-                    with st.spinner("Generating tailored PDF..."):
-                        template_data = {"text": "\n".join(f"{k}: {v}" for k, v in edited_sections.items()), "template": template}
-                        pdf_bytes = call_gemini_api("generate_pdf", template_data)
-                        
-                        # For demo purposes, if API fails, create a simple PDF
-                        if not pdf_bytes:
-                            st.warning("API call failed. Creating a simple PDF for demonstration.")
-                            # Create a simple PDF with the content
-                            try:
-                                from reportlab.lib.pagesizes import letter
-                                from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-                                from reportlab.lib.styles import getSampleStyleSheet
-                                
-                                buffer = io.BytesIO()
-                                doc = SimpleDocTemplate(buffer, pagesize=letter)
-                                styles = getSampleStyleSheet()
-                                flowables = []
-                                
-                                for section, content in edited_sections.items():
-                                    flowables.append(Paragraph(f"<b>{section}</b>", styles['Heading2']))
-                                    flowables.append(Spacer(1, 12))
-                                    flowables.append(Paragraph(content.replace('\n', '<br/>'), styles['Normal']))
-                                    flowables.append(Spacer(1, 24))
-                                
-                                doc.build(flowables)
-                                pdf_bytes = buffer.getvalue()
-                            except Exception as e:
-                                st.error(f"Failed to create PDF: {str(e)}")
-                                pdf_bytes = None
-                        
-                        if pdf_bytes:
-                            st.download_button("Download Tailored Resume", data=pdf_bytes, file_name="tailored_resume.pdf", mime="application/pdf")
-                            # Store the tailored resume
-                            tailored_file = io.BytesIO(pdf_bytes)
-                            tailored_file.name = "tailored_resume.pdf"
-                            store_file_in_supabase(tailored_file, st.session_state['user_id'], "tailored")
+                    request_pdf_render('tailored_pdf_render', dict(edited_sections), template, page=page)
+                
+                if 'tailored_pdf_render' in st.session_state:
+                    handle = st.session_state['tailored_pdf_render']
+                    pdf_bytes = display_pdf_render('tailored_pdf_render', label="Download Tailored Resume",
+                                                   file_name="tailored_resume.pdf", preview_key='pdf_preview_job')
+                    # Store each tailored render once, not on every rerun that shows it
+                    if pdf_bytes and not handle.get('stored'):
+                        tailored_file = io.BytesIO(pdf_bytes)
+                        tailored_file.name = "tailored_resume.pdf"
+                        handle['stored'] = bool(store_file_in_supabase(tailored_file, st.session_state['user_id'], "tailored"))
+                        if handle['stored']:
                             st.success("Tailored resume generated and saved!")
-                            st.session_state['pdf_preview_job'] = pdf_bytes
 
                 # Preview
                 if 'pdf_preview_job' in st.session_state:
                     st.markdown("<div class='section-header'>Preview</div>", unsafe_allow_html=True)
-                    display_pdf(io.BytesIO(st.session_state['pdf_preview_job']))
+                    display_pdf(io.BytesIO(st.session_state['pdf_preview_job']),
+                                etag=st.session_state.get('pdf_preview_job_etag'))
+
+    # --- Job Postings Feature ---
+    elif page == "Job Postings":
+        st.title("Job Postings")
+        st.markdown("Save postings and find the ones that fit your resume best.")
+
+        store = get_job_posting_store(job_postings_path(st.session_state['user_id']))
+
+        # Step 1: Save or import postings
+        st.markdown("<div class='section-header'>Saved Postings</div>", unsafe_allow_html=True)
+        add_col, import_col = st.columns(2)
+        with add_col:
+            posting_title = st.text_input("Posting Title (optional)")
+            posting_text = st.text_area("Job Description", height=150, key="saved_posting_text")
+            if st.button("Save Posting") and posting_text.strip():
+                store.add(posting_title, posting_text)
+                store.save()
+                st.success("Posting saved!")
+        with import_col:
+            import_file = st.file_uploader("Import postings", type=["csv", "json", "txt"],
+                                           help="CSV/JSON with title and description, or text with postings separated by ---")
+            if import_file and st.button("Import"):
+                try:
+                    imported = read_postings(import_file.name, import_file.getvalue())
+                    for title, text in imported:
+                        store.add(title, text)
+                    store.save()
+                    st.success(f"Imported {len(imported)} postings.")
+                except Exception as e:
+                    st.error(f"Failed to import postings: {str(e)}")
+        st.caption(f"{len(store)} postings saved")
+
+        # Step 2: Resume to rank them against
+        st.markdown("<div class='section-header'>Resume</div>", unsafe_allow_html=True)
+        resume_text = None
+        user_files = list_files(st.session_state['user_id'])
+        if user_files:
+            selected_resume = st.selectbox("Select a Resume", user_files, key="postings_resume")
+            resume_file = get_file(selected_resume) if selected_resume else None
+            if resume_file:
+                resume_text = extract_text_in_background(resume_file)
+            else:
+                st.error("Failed to retrieve the selected resume.")
+        else:
+            st.warning("No stored resumes found. Upload one in Resume Job Matching first.")
+
+        # Step 3: Rank every posting locally; the model only looks at the top few
+        if resume_text and len(store):
+            top_k = st.number_input("Postings to show", min_value=1, max_value=500, value=min(20, len(store)), step=5)
+            ranking = store.rank(resume_text, int(top_k))
+            if GEMINI_AVAILABLE and MATCH_MODEL_REFINE and ranking:
+                refine_ids = [job_id for job_id, _ in ranking[:JOB_REFINE_TOP_N]]
+                if st.button(f"Refine top {len(refine_ids)} with AI"):
+                    with st.spinner("Scoring the best matches..."):
+                        refine_job_matches(resume_text, store, refine_ids, fetch=True)
+            refined = refine_job_matches(resume_text, store, [job_id for job_id, _ in ranking])
+            for position, (job_id, score) in enumerate(ranking, 1):
+                posting = store.posting(job_id)
+                label = f"{position}. {posting['title']} — {score:.0f}%"
+                if (refined.get(job_id) or {}).get('model_refined'):
+                    label += f" (AI: {refined[job_id]['match_score']}%)"
+                with st.expander(label):
+                    matched, missing = store.explain(job_id, resume_text)
+                    st.markdown(f"**Matched skills:** {', '.join(matched) or 'None'}")
+                    st.markdown(f"**Missing skills:** {', '.join(missing) or 'None'}")
+                    st.markdown(f"**Experience:** {posting['features']['Required Experience']}")
+                    if st.button("Remove posting", key=f"remove_posting_{job_id}"):
+                        store.remove(job_id)
+                        store.save()
+                        st.rerun()
+
+    # --- Resume Search Feature ---
+    elif page == "Resume Search":
+        st.title("Resume Search")
+        st.markdown("Find which of your stored resumes mention a skill, keyword or phrase.")
+
+        search_index = get_search_index(RESUME_SEARCH_INDEX_PATH)
+        user_files = list_files(st.session_state['user_id'])
+        unindexed = search_index.missing(user_files)
+        if unindexed:
+            st.info(f"{len(unindexed)} of your stored resumes are not indexed yet.")
+            if st.button("Index My Resumes"):
+                indexed = index_stored_resumes(user_files)
+                st.success(f"Indexed {indexed} resumes.")
+
+        query = st.text_input("Search", placeholder='kubernetes "machine learning" -java OR rust',
+                              help='Words are ANDed; use quotes for phrases, -word or NOT to exclude, OR between alternatives')
+        if query:
+            own_files = set(user_files)
+            results = [name for name in search_index.search(query) if name in own_files]
+            st.caption(f"{len(results)} matching resumes")
+            for file_name in results:
+                st.markdown(f"- {file_name}")
+
+    # --- Recruiter Ranking Feature ---
+    elif page == "Recruiter Ranking":
+        st.title("Recruiter Ranking")
+        st.markdown("Rank every stored resume against a job posting.")
+
+        ranker = get_resume_ranker(RESUME_FEATURES_PATH)
+        stored_files = list_files()
+        unindexed = ranker.missing(stored_files)
+        if unindexed:
+            st.info(f"{len(unindexed)} of {len(stored_files)} stored resumes are not indexed yet.")
+            if st.button("Index Stored Resumes"):
+                indexed = index_stored_resumes(stored_files)
+                st.success(f"Indexed {indexed} resumes.")
+        st.caption(f"{len(ranker)} resumes indexed")
+
+        job_desc = st.text_area("Job Posting", height=200, help="Paste the posting to rank stored resumes against")
+        top_k = st.number_input("Candidates to show", min_value=1, max_value=500, value=DEFAULT_TOP_K, step=10)
+
+        if job_desc:
+            ranking = ranker.rank(job_desc, int(top_k))
+            if not ranking:
+                st.warning("No matches: either no resumes are indexed or no skills were found in the posting.")
+            for position, (file_name, score) in enumerate(ranking, 1):
+                # Skill breakdown is only computed for the rows actually shown
+                with st.expander(f"{position}. {file_name} — {score:.0f}%"):
+                    matched, missing = ranker.explain(file_name, job_desc)
+                    st.markdown(f"**Matched skills:** {', '.join(matched) or 'None'}")
+                    st.markdown(f"**Missing skills:** {', '.join(missing) or 'None'}")
 
 def display_template_selection():
     st.markdown('<h2 class="section-header">Select Resume Template</h2>', unsafe_allow_html=True)
@@ -3154,207 +3419,6 @@ def display_template_selection():
     
     return st.session_state.get('template', 'Minimalist')  # Default to Minimalist if none selected
 
-def display_resume_score(sections):
-    st.markdown('<h2 class="section-header">Resume Score & Analysis</h2>', unsafe_allow_html=True)
-    
-    # Calculate scores based on resume content
-    scores = calculate_resume_scores(sections)
-    
-    # Create a 3-column layout for score display
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        overall_score = scores['overall']
-        score_class = "score-high" if overall_score >= 80 else "score-medium" if overall_score >= 60 else "score-low"
-        
-        st.markdown(f"""
-        <div class="score-display {score_class}">
-            <span>Overall Score</span>
-            <h2>{overall_score}/100</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Display feedback based on overall score
-        if overall_score >= 80:
-            st.markdown("""
-            <div class="alert alert-success">
-                <strong>Excellent!</strong> Your resume is well-structured and comprehensive.
-            </div>
-            """, unsafe_allow_html=True)
-        elif overall_score >= 60:
-            st.markdown("""
-            <div class="alert alert-warning">
-                <strong>Good start!</strong> Your resume has potential but needs some improvements.
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div class="alert alert-error">
-                <strong>Needs work!</strong> Your resume requires significant improvements to be competitive.
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with col2:
-        ats_score = scores['ats_compatibility']
-        score_class = "score-high" if ats_score >= 80 else "score-medium" if ats_score >= 60 else "score-low"
-        
-        st.markdown(f"""
-        <div class="score-display {score_class}">
-            <span>ATS Compatibility</span>
-            <h2>{ats_score}/100</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Display custom progress bars for ATS factors
-        st.markdown('<div class="subsection-header">ATS Factors</div>', unsafe_allow_html=True)
-        
-        # Keywords presence
-        keyword_score = scores.get('keyword_score', 65)
-        st.markdown(f"""
-        <div>Keywords Presence</div>
-        <div class="progress-container">
-            <div class="progress-bar" style="width: {keyword_score}%;"></div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Format compatibility
-        format_score = scores.get('format_score', 75)
-        st.markdown(f"""
-        <div>Format Compatibility</div>
-        <div class="progress-container">
-            <div class="progress-bar" style="width: {format_score}%;"></div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        content_score = scores['content_quality']
-        score_class = "score-high" if content_score >= 80 else "score-medium" if content_score >= 60 else "score-low"
-        
-        st.markdown(f"""
-        <div class="score-display {score_class}">
-            <span>Content Quality</span>
-            <h2>{content_score}/100</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Display section completeness
-        st.markdown('<div class="subsection-header">Section Completeness</div>', unsafe_allow_html=True)
-        
-        # Check for key sections
-        key_sections = {
-            'Personal Information': sections.get('Personal Information', '') != '',
-            'Summary/Objective': sections.get('Summary', '') != '' or sections.get('Objective', '') != '',
-            'Skills': sections.get('Skills', '') != '',
-            'Experience': sections.get('Experience', '') != '',
-            'Education': sections.get('Education', '') != '',
-            'Projects': sections.get('Projects', '') != ''
-        }
-        
-        for section, present in key_sections.items():
-            if present:
-                st.markdown(f"""
-                <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                    <div style="color: var(--success-color); margin-right: 10px;">✓</div>
-                    <div>{section}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                    <div style="color: var(--error-color); margin-right: 10px;">✗</div>
-                    <div>{section} <span style="color: var(--error-color); font-size: 12px;">(Missing)</span></div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    # Improvement suggestions
-    st.markdown('<div class="subsection-header">Improvement Suggestions</div>', unsafe_allow_html=True)
-    
-    suggestions = generate_improvement_suggestions(sections, scores)
-    
-    for i, suggestion in enumerate(suggestions):
-        st.markdown(f"""
-        <div class="card">
-            <div class="card-header">Suggestion #{i+1}</div>
-            <div class="card-content">{suggestion}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-def calculate_resume_scores(sections):
-    """Calculate various scores for the resume based on content analysis"""
-    scores = {}
-    
-    # Check for presence of key sections
-    key_sections = ['Personal Information', 'Summary', 'Skills', 'Experience', 'Education']
-    present_sections = sum(1 for section in key_sections if sections.get(section, '').strip())
-    section_score = min(100, (present_sections / len(key_sections)) * 100)
-    
-    # Calculate content length score
-    total_content = sum(len(content) for content in sections.values())
-    length_score = min(100, (total_content / 2000) * 100)  # Assuming 2000 chars is optimal
-    
-    # Calculate keyword richness (simplified)
-    all_content = ' '.join(sections.values()).lower()
-    keywords = ['experience', 'skill', 'project', 'develop', 'manage', 'create', 'team', 
-                'lead', 'analyze', 'implement', 'design', 'collaborate', 'achieve']
-    keyword_count = sum(1 for keyword in keywords if keyword in all_content)
-    keyword_score = min(100, (keyword_count / len(keywords)) * 100)
-    
-    # Calculate ATS compatibility score
-    ats_score = (section_score * 0.5) + (keyword_score * 0.5)
-    
-    # Calculate content quality score (simplified)
-    content_score = (section_score * 0.4) + (length_score * 0.3) + (keyword_score * 0.3)
-    
-    # Calculate overall score
-    overall_score = int((ats_score * 0.5) + (content_score * 0.5))
-    
-    # Compile all scores
-    scores = {
-        'overall': overall_score,
-        'ats_compatibility': int(ats_score),
-        'content_quality': int(content_score),
-        'section_score': int(section_score),
-        'length_score': int(length_score),
-        'keyword_score': int(keyword_score),
-        'format_score': int(min(100, section_score + 10))  # Simplified format score
-    }
-    
-    return scores
-
-def generate_improvement_suggestions(sections, scores):
-    """Generate personalized improvement suggestions based on resume content and scores"""
-    suggestions = []
-    
-    # Check for missing sections
-    key_sections = ['Personal Information', 'Summary', 'Skills', 'Experience', 'Education', 'Projects']
-    for section in key_sections:
-        if not sections.get(section, '').strip():
-            suggestions.append(f"<strong>Add a {section} section</strong> to your resume. This is a critical section that recruiters look for.")
-    
-    # Check content quality
-    if scores['content_quality'] < 70:
-        suggestions.append("<strong>Enhance your content quality</strong> by adding more specific achievements and quantifiable results to your experience section.")
-    
-    # Check ATS compatibility
-    if scores['ats_compatibility'] < 70:
-        suggestions.append("<strong>Improve ATS compatibility</strong> by including more industry-specific keywords relevant to your target positions.")
-    
-    # Check for skills section quality
-    skills = sections.get('Skills', '')
-    if len(skills) < 100:
-        suggestions.append("<strong>Expand your skills section</strong> with both technical and soft skills relevant to your industry.")
-    
-    # Check for summary quality
-    summary = sections.get('Summary', '')
-    if len(summary) < 200:
-        suggestions.append("<strong>Enhance your professional summary</strong> with a compelling statement that highlights your unique value proposition.")
-    
-    # If no suggestions were generated, add a generic one
-    if not suggestions:
-        suggestions.append("<strong>Continue refining your resume</strong> by tailoring it to specific job descriptions and highlighting relevant achievements.")
-    
-    return suggestions
-
 def display_job_matching_section(sections):
     st.markdown('<h2 class="section-header">Job Matching & Optimization</h2>', unsafe_allow_html=True)
     
@@ -3459,17 +3523,11 @@ Software Engineer with 3+ years of experience in Python development. Proficient
             st.markdown('<div class="subsection-header">Keyword Frequency</div>', unsafe_allow_html=True)
             
             # Create a visual representation of keyword frequency
-            keywords = match_results.get('keywords', {
-                'Python': {'job': 3, 'resume': 2},
-                'Web Development': {'job': 2, 'resume': 1},
-                'Database': {'job': 2, 'resume': 0},
-                'Team': {'job': 1, 'resume': 3},
-                'Problem-solving': {'job': 2, 'resume': 1}
-            })
+            keywords = match_results.get('keyword_analysis', {})
             
             for keyword, counts in keywords.items():
-                job_count = counts.get('job', 0)
-                resume_count = counts.get('resume', 0)
+                job_count = counts.get('job_count', 0)
+                resume_count = counts.get('resume_count', 0)
                 
                 # Calculate percentages for visual bars
                 max_count = max(job_count, resume_count, 1)  # Avoid division by zero
@@ -3586,7 +3644,14 @@ Software Engineer with 3+ years of experience in Python development. Proficient
                     """, unsafe_allow_html=True)
                 
                 with col_enh:
-                    enhanced_experience = st.session_state['match_results'].get('enhanced_experience', 'Click "Enhance with AI" to generate job-tailored experience descriptions.')
+                    enhanced_experience = st.session_state['match_results'].get('enhanced_experience')
+                    if enhanced_experience:
+                        # Job skills are highlighted for display only; the stored text stays plain
+                        enhanced_experience = highlight_skills(
+                            enhanced_experience, st.session_state['match_results'].get('job_skill_ids', frozenset())
+                        ).replace('\n', '<br>')
+                    else:
+                        enhanced_experience = 'Click "Enhance with AI" to generate job-tailored experience descriptions.'
                     
                     st.markdown("<strong>Enhanced Experience:</strong>", unsafe_allow_html=True)
                     st.markdown(f"""
@@ -3597,11 +3662,12 @@ Software Engineer with 3+ years of experience in Python development. Proficient
             
             # Add an "Enhance with AI" button
             if st.button("Enhance with AI", key="enhance_resume_btn", use_container_width=True):
-                with st.spinner("Tailoring your resume with AI..."):
-                    # Call AI to enhance resume sections
-                    enhanced_sections = enhance_resume_for_job(sections, st.session_state['job_description'])
+                with st.spinner("Tailoring your resume..."):
+                    # Tailor resume sections locally (no model call)
+                    enhanced_sections, job_skill_ids = enhance_resume_for_job(sections, st.session_state['job_description'])
                     
                     # Update session state with enhanced sections
+                    st.session_state['match_results']['job_skill_ids'] = job_skill_ids
                     st.session_state['match_results']['enhanced_summary'] = enhanced_sections.get('Summary', '')
                     st.session_state['match_results']['enhanced_skills'] = enhanced_sections.get('Skills', '')
                     st.session_state['match_results']['enhanced_experience'] = enhanced_sections.get('Experience', '')
@@ -3641,246 +3707,28 @@ def analyze_job_match(resume_sections, job_description):
     Enhanced implementation for analyzing how well a resume matches a job description.
     Provides detailed gap analysis and skill matching with improved accuracy.
     """
-    # Extract all resume text
-    resume_text = ' '.join(resume_sections.values()).lower() if isinstance(resume_sections, dict) else ""
-    job_text = job_description.lower() if isinstance(job_description, str) else ""
-    
-    # Extract skills using enhanced method
-    job_skills = extract_enhanced_skills(job_text)
-    resume_skills = extract_enhanced_skills(resume_text)
+    if not isinstance(resume_sections, (dict, ResumeDocument)):
+        resume_sections = {}
+    job_description = job_description if isinstance(job_description, str) else ""
     
-    # Technical skill synonym mapping for better matching
-    tech_synonyms = {
-        "js": ["javascript"],
-        "javascript": ["js"],
-        "react": ["reactjs", "react.js"],
-        "reactjs": ["react", "react.js"],
-        "python": ["py"],
-        "node": ["nodejs", "node.js"],
-        "nodejs": ["node", "node.js"],
-        "typescript": ["ts"],
-        "ts": ["typescript"],
-        "aws": ["amazon web services"],
-        "azure": ["microsoft azure"],
-        "ml": ["machine learning"],
-        "ai": ["artificial intelligence"],
-        "sql": ["mysql", "postgresql", "tsql", "database"],
-        "ui": ["user interface"],
-        "ux": ["user experience"],
-        "ci/cd": ["continuous integration", "continuous deployment"],
-        "api": ["rest", "rest api", "restful"],
-        "nlp": ["natural language processing"],
-        "cv": ["computer vision"]
-    }
-    
-    # Find matched skills with synonym support
-    matched_skills = []
-    for resume_skill in resume_skills:
-        # Direct match
-        if resume_skill.lower() in [s.lower() for s in job_skills]:
-            matched_skills.append(resume_skill)
-            continue
-            
-        # Check for synonyms
-        resume_skill_lower = resume_skill.lower()
-        matched_by_synonym = False
-        
-        for job_skill in job_skills:
-            job_skill_lower = job_skill.lower()
-            
-            # Check synonyms for resume skill
-            if resume_skill_lower in tech_synonyms:
-                if job_skill_lower in tech_synonyms[resume_skill_lower]:
-                    matched_skills.append(resume_skill)
-                    matched_by_synonym = True
-                    break
-            
-            # Check synonyms for job skill
-            if job_skill_lower in tech_synonyms:
-                if resume_skill_lower in tech_synonyms[job_skill_lower]:
-                    matched_skills.append(resume_skill)
-                    matched_by_synonym = True
-                    break
-        
-        if matched_by_synonym:
-            continue
-    
-    # Find missing skills
-    missing_skills = []
-    for job_skill in job_skills:
-        job_skill_lower = job_skill.lower()
-        if not any(job_skill_lower == skill.lower() for skill in matched_skills):
-            # Check if it's a synonym of any matched skill
-            has_synonym_match = False
-            for matched_skill in matched_skills:
-                matched_skill_lower = matched_skill.lower()
-                if matched_skill_lower in tech_synonyms and job_skill_lower in tech_synonyms[matched_skill_lower]:
-                    has_synonym_match = True
-                    break
-                if job_skill_lower in tech_synonyms and matched_skill_lower in tech_synonyms[job_skill_lower]:
-                    has_synonym_match = True
-                    break
-            
-            if not has_synonym_match:
-                missing_skills.append(job_skill)
-    
-    # Calculate match score with weighted relevance
-    if len(job_skills) > 0:
-        match_score = int((len(matched_skills) / len(job_skills)) * 100)
-    else:
-        match_score = 0
-    
-    # Extract keywords and their frequencies with enhanced list
-    keywords = {}
-    common_keywords = [
-        'python', 'javascript', 'java', 'c++', 'sql', 'database', 'web', 'api', 
-        'cloud', 'aws', 'azure', 'docker', 'kubernetes', 'agile', 'team', 
-        'leadership', 'project', 'development', 'software', 'engineering',
-        'problem-solving', 'communication', 'analysis', 'design', 'testing',
-        'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
-        'devops', 'ci/cd', 'git', 'github', 'jira', 'scrum', 'kanban',
-        'machine learning', 'ai', 'data science', 'tensorflow', 'pytorch',
-        'nlp', 'computer vision', 'deep learning', 'automation', 'security',
-        'linux', 'windows', 'macos', 'mobile', 'android', 'ios', 'swift',
-        'kotlin', 'react native', 'flutter', 'blockchain', 'cybersecurity'
-    ]
-    
-    for keyword in common_keywords:
-        job_count = job_text.count(keyword)
-        resume_count = resume_text.count(keyword)
-        
-        if job_count > 0 or resume_count > 0:
-            keywords[keyword] = {
-                'job_count': job_count,
-                'resume_count': resume_count,
-                'ratio': resume_count / max(1, job_count)
-            }
+    # Skills, keyword counts, tenure and scores come from the shared match artifact,
+    # built once per (resume, job) pair and reused by the other matching views
+    match_artifact = get_match_artifact(resume_sections, job_description)
     
     return {
-        'match_score': match_score,
-        'matched_skills': matched_skills,
-        'missing_skills': missing_skills,
-        'keyword_analysis': keywords
+        'match_score': match_artifact['scores']['match_score'],
+        'skills_match': match_artifact['scores']['skills_match'],
+        'matched_skills': match_artifact['matched_skills'],
+        'missing_skills': match_artifact['missing_skills'],
+        'keyword_analysis': match_artifact['keyword_analysis']
     }
 
-def extract_enhanced_skills(text):
-    """Extract skills from text using a more sophisticated approach"""
-    if not text:
-        return []
-        
-    # Common technical skills (expanded list)
-    tech_skills = [
-        'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
-        'html', 'css', 'sql', 'nosql', 'mongodb', 'mysql', 'postgresql', 'oracle',
-        'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'asp.net',
-        'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'cloud', 'devops', 'ci/cd',
-        'git', 'github', 'gitlab', 'bitbucket', 'jira', 'agile', 'scrum', 'kanban',
-        'machine learning', 'ai', 'data science', 'big data', 'hadoop', 'spark',
-        'tensorflow', 'pytorch', 'nlp', 'computer vision', 'deep learning',
-        'react native', 'flutter', 'mobile development', 'ios', 'android',
-        'web development', 'frontend', 'backend', 'full-stack', 'ui/ux',
-        'restful api', 'graphql', 'microservices', 'serverless', 'linux',
-        'windows', 'macos', 'bash', 'shell scripting', 'powershell',
-        'blockchain', 'ethereum', 'solidity', 'smart contracts',
-        'cybersecurity', 'penetration testing', 'network security',
-        'data analysis', 'data visualization', 'tableau', 'power bi',
-        'excel', 'vba', 'sap', 'erp', 'crm', 'salesforce'
-    ]
-    
-    # Common soft skills (expanded list)
-    soft_skills = [
-        'communication', 'teamwork', 'leadership', 'problem-solving', 'critical thinking',
-        'time management', 'organization', 'creativity', 'adaptability', 'flexibility',
-        'project management', 'attention to detail', 'analytical', 'interpersonal',
-        'presentation', 'negotiation', 'conflict resolution', 'decision making',
-        'customer service', 'mentoring', 'coaching', 'collaboration', 'multitasking',
-        'strategic thinking', 'innovation', 'emotional intelligence', 'public speaking',
-        'research', 'writing', 'editing', 'design thinking', 'user research',
-        'stakeholder management', 'client relations', 'sales', 'marketing',
-        'budgeting', 'financial planning', 'resource allocation', 'risk management',
-        'quality assurance', 'continuous improvement', 'people management',
-        'cross-functional collaboration', 'international experience', 'cultural awareness'
-    ]
-    
-    # Combine all skills
-    all_skills = tech_skills + soft_skills
-    
-    # Extract skills from text with improved algorithm
-    found_skills = []
-    text_lower = text.lower()
-    
-    # Direct skill matching
-    for skill in all_skills:
-        # Look for whole word matches
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill.title())  # Capitalize for display
-    
-    # Skills in bullet points or semicolon-separated lists
-    lines = text_lower.split('\n')
-    for line in lines:
-        # Check for bullet points
-        if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*'):
-            # Split by commas
-            parts = [p.strip() for p in line.split(',')]
-            for part in parts:
-                # Clean up the part
-                part = re.sub(r'[•\-*]', '', part).strip()
-                # Check if it's a skill
-                if part in [s.lower() for s in all_skills]:
-                    found_skills.append(part.title())
-    
-    # Remove duplicates
-    found_skills = list(set(found_skills))
-    
-    return found_skills
-
 def enhance_resume_for_job(sections, job_description):
-    """Use AI to enhance resume sections for a specific job"""
-    # This is a placeholder implementation - in a real app, this would call an AI service
-    
-    # For demonstration purposes, we'll create mock enhanced sections
-    enhanced_sections = {}
-    
-    # Extract skills from job description
-    job_skills = extract_skills_from_text(job_description.lower())
-    
-    # Enhance summary
-    if 'Summary' in sections:
-        original_summary = sections['Summary']
-        # In a real implementation, this would call an AI service
-        enhanced_summary = f"Results-driven professional with expertise in {', '.join(job_skills[:3])}. {original_summary}"
-        enhanced_sections['Summary'] = enhanced_summary
-    
-    # Enhance skills
-    if 'Skills' in sections:
-        original_skills = sections['Skills']
-        # Add job-specific skills that might be missing
-        enhanced_skills = original_skills
-        for skill in job_skills:
-            if skill.lower() not in original_skills.lower():
-                enhanced_skills += f", {skill}"
-        enhanced_sections['Skills'] = enhanced_skills
-    
-    # Enhance experience
-    if 'Experience' in sections:
-        original_experience = sections['Experience']
-        # In a real implementation, this would call an AI service to rewrite experience
-        # For now, we'll just highlight keywords from the job
-        enhanced_experience = original_experience
-        for skill in job_skills:
-            # Simple highlighting by adding emphasis
-            if skill.lower() in enhanced_experience.lower():
-                enhanced_experience = enhanced_experience.replace(
-                    skill, f"<strong>{skill}</strong>"
-                ).replace(
-                    skill.lower(), f"<strong>{skill.lower()}</strong>"
-                ).replace(
-                    skill.upper(), f"<strong>{skill.upper()}</strong>"
-                )
-        enhanced_sections['Experience'] = enhanced_experience
-    
-    return enhanced_sections
+    """Tailor resume sections for a specific job with the local tailoring engine.
+
+    Returns (tailored sections, job skill ids for highlighting).
+    """
+    return tailor_resume(sections, job_description)
 
 def main():
     # DO NOT put st.set_page_config() here - it must be at the top level
@@ -4200,12 +4048,10 @@ def main():
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    color_scheme = st.selectbox("Color Scheme", 
-                                              ["Professional Blue", "Modern Gray", "Bold Black", "Creative Green", "Elegant Purple"])
+                    color_scheme = st.selectbox("Color Scheme", list(COLOR_SCHEMES))
                 
                 with col2:
-                    font_choice = st.selectbox("Font Style", 
-                                             ["Default", "Modern", "Classic", "Elegant", "Bold"])
+                    font_choice = st.selectbox("Font Style", list(FONT_FAMILIES))
                 
                 # Additional options
                 include_qr = st.checkbox("Include QR Code for LinkedIn/Portfolio", value=False)
@@ -4217,35 +4063,18 @@ def main():
                     "include_qr": include_qr
                 }
                 
-                # Generate and download button
+                # Generate and download button: the render runs in the worker pool, the page does not wait on it
                 if st.button("Generate and Download Resume", key="generate_pdf_btn", use_container_width=True):
-                    with st.spinner("Generating PDF resume..."):
-                        # Generate PDF
-                        pdf_bytes = generate_pdf_from_sections(st.session_state['sections'], template, options)
-                        
-                        if pdf_bytes:
-                            # Store PDF in session state for preview
-                            st.session_state['pdf_preview'] = pdf_bytes
-                            
-                            # Provide download button
-                            st.download_button(
-                                label="Download Resume PDF",
-                                data=pdf_bytes,
-                                file_name=f"optimized_resume_{template.lower().replace(' ', '_')}.pdf",
-                                mime="application/pdf",
-                                use_container_width=True
-                            )
-                            
-                            # Show success message
-                            st.success("Resume PDF generated successfully!")
-                        else:
-                            st.error("Failed to generate PDF. Please try again.")
+                    request_pdf_render('pdf_render', st.session_state['sections'], template, options)
+                if 'pdf_render' in st.session_state:
+                    display_pdf_render()
                 
                 # Preview section
                 if 'pdf_preview' in st.session_state:
                     st.markdown('<div class="subsection-header">Preview</div>', unsafe_allow_html=True)
                     st.markdown('<div class="pdf-preview-container">', unsafe_allow_html=True)
-                    display_pdf(io.BytesIO(st.session_state['pdf_preview']))
+                    display_pdf(io.BytesIO(st.session_state['pdf_preview']),
+                                etag=st.session_state.get('pdf_preview_etag'))
                     st.markdown('</div>', unsafe_allow_html=True)
             else:
                 st.markdown("<div class='alert alert-info'><strong>No resume uploaded yet!</strong> Please upload your resume in the Upload Resume tab.</div>", unsafe_allow_html=True)
@@ -0,0 +1,121 @@
+"""Benchmark the local ATS format analyzer and show which checks fire.
+
+Renders resumes from the synthetic corpus with the app's own templates
+(single column, text layer, standard fonts) plus a few ATS-hostile
+layouts drawn directly with ReportLab: two text columns, a ruled table,
+a page that is only an image, and contact details only in the page
+header. Reports the time per analyze_pdf call and each layout's score
+with the checks it failed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ats [--count 50]
+"""
+import argparse
+import io
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core.ats import analyze_pdf
+from resume_core.rendering import render_pdf_from_sections
+
+TEMPLATES = ("Minimalist", "ATS-Friendly", "Project-Focused")
+
+
+def _canvas_pdf(draw):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    draw(pdf, *letter)
+    pdf.save()
+    return buffer.getvalue()
+
+
+def _write_lines(pdf, lines, x, y, step=14):
+    for line in lines:
+        pdf.drawString(x, y, line)
+        y -= step
+    return y
+
+
+def two_column_pdf(sections):
+    def draw(pdf, width, height):
+        left = [line[:45] for line in sections.get("Experience", "").splitlines() if line.strip()]
+        right = [line[:40] for line in (sections.get("Skills", "") + "\n" + sections.get("Education", "")).splitlines()
+                 if line.strip()]
+        right = (right * 10)[:len(left)]
+        _write_lines(pdf, ["jane.doe@example.com | 555-123-4567"], 50, height - 80)
+        _write_lines(pdf, left, 50, height - 120)
+        _write_lines(pdf, [line + " and related tooling" for line in right], width / 2 + 20, height - 120)
+    return _canvas_pdf(draw)
+
+
+def table_pdf(sections):
+    def draw(pdf, width, height):
+        _write_lines(pdf, ["jane.doe@example.com | 555-123-4567"], 50, height - 80)
+        rows = [line for line in sections.get("Experience", "").splitlines() if line.strip()][:8]
+        top = height - 120
+        for row, line in enumerate(rows):
+            y = top - row * 20
+            pdf.line(50, y, width - 50, y)
+            pdf.drawString(55, y - 14, line[:60])
+        bottom = top - len(rows) * 20
+        pdf.line(50, bottom, width - 50, bottom)
+        for x in (50, 200, width - 50):
+            pdf.line(x, top, x, bottom)
+    return _canvas_pdf(draw)
+
+
+def image_pdf(sections):
+    from reportlab.lib.utils import ImageReader
+
+    def draw(pdf, width, height):
+        # A blank 800x1000 RGB image standing in for a scanned resume
+        raw = b'\xff' * (800 * 1000 * 3)
+        header = b'P6 800 1000 255\n'
+        pdf.drawImage(ImageReader(io.BytesIO(header + raw)), 0, 0, width, height)
+        pdf.drawString(50, height - 60, "Jane Doe")
+    return _canvas_pdf(draw)
+
+
+def header_contact_pdf(sections):
+    def draw(pdf, width, height):
+        pdf.setFont("Helvetica", 8)
+        pdf.drawString(50, height - 20, "jane.doe@example.com | 555-123-4567")
+        pdf.setFont("Helvetica", 10)
+        body = [f"{name.upper()}\n{text}" for name, text in sections.items() if name != "Contact Information"]
+        _write_lines(pdf, "\n".join(body).splitlines()[:45], 50, height - 80)
+    return _canvas_pdf(draw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=50, help="number of resumes per layout")
+    args = parser.parse_args()
+
+    corpus = [resume['sections'] for resume in generate_corpus(args.count, seed=46)]
+    layouts = {template: (lambda sections, template=template: render_pdf_from_sections(sections, template))
+               for template in TEMPLATES}
+    layouts.update({'two columns': two_column_pdf, 'table': table_pdf, 'image only': image_pdf,
+                    'header contact': header_contact_pdf})
+
+    print(f"{'layout':16} {'ms/pdf':>7} {'score':>6}  failed checks")
+    for name, render in layouts.items():
+        pdfs = [render(sections) for sections in corpus]
+        start = time.perf_counter()
+        reports = [analyze_pdf(pdf) for pdf in pdfs]
+        elapsed = (time.perf_counter() - start) / len(pdfs) * 1e3
+        score = sum(report['ats_score'] for report in reports) / len(reports)
+        failed = {}
+        for report in reports:
+            for check in report['checks']:
+                if not check['passed']:
+                    failed[check['check']] = failed.get(check['check'], 0) + 1
+        summary = ", ".join(f"{check} {count}/{len(reports)}" for check, count in sorted(failed.items())) or "-"
+        print(f"{name:16} {elapsed:7.1f} {score:6.1f}  {summary}")
+
+
+if __name__ == "__main__":
+    main()
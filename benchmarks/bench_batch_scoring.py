@@ -0,0 +1,52 @@
+"""Benchmark batch resume scoring against calling calculate_resume_scores per resume.
+
+Streams a synthetic corpus (cycled to the requested size) through
+score_batches from a generator, so memory stays at one batch, and checks
+that every column equals the per-resume result on a sample.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch_scoring [--count 100000]
+"""
+import argparse
+import itertools
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core import scoring
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=100000, help="number of resumes to score")
+    parser.add_argument('--batch-size', type=int, default=scoring.SCORE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    distinct = [resume['sections'] for resume in generate_corpus(2000, seed=31)]
+
+    def stream():
+        return itertools.islice(itertools.cycle(distinct), args.count)
+
+    start = time.perf_counter()
+    scored = 0
+    for batch in scoring.score_batches(stream(), args.batch_size):
+        scored += len(batch['overall'])
+    batched = time.perf_counter() - start
+    print(f"score_batches:           {batched:6.2f} s for {scored} resumes "
+          f"({batched / scored * 1e6:.1f} us each, NumPy: {scoring.NUMPY_AVAILABLE})")
+
+    sample = distinct * 5
+    start = time.perf_counter()
+    rows = [scoring.calculate_resume_scores(sections) for sections in sample]
+    per_resume = (time.perf_counter() - start) / len(sample)
+    print(f"calculate_resume_scores: {per_resume * args.count:6.2f} s for {args.count} resumes "
+          f"({per_resume * 1e6:.1f} us each, extrapolated from {len(sample)})")
+
+    columns = next(scoring.score_batches(sample, len(sample)))
+    mismatches = sum(1 for position, row in enumerate(rows)
+                     if any(int(columns[name][position]) != row[name] for name in scoring.SCORE_COLUMNS))
+    print(f"Rows differing from calculate_resume_scores: {mismatches} of {len(rows)}")
+
+
+if __name__ == "__main__":
+    main()
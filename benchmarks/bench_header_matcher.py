@@ -0,0 +1,91 @@
+"""Benchmark the single-lookup section header matcher against the old per-pattern regex loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_header_matcher
+"""
+import re
+import timeit
+
+from resume_core.parsing import SECTION_HEADER_ALIASES, match_section_header
+
+# The pattern table parse_resume_sections used before the lookup matcher
+LEGACY_SECTION_PATTERNS = {
+    r'(?i)^\s*(contact|personal|info|contact information|personal information|contact details|personal details|contact info)\s*:?\s*$': "Contact Information",
+    r'(?i)^\s*(summary|professional summary|profile|about me|career summary|executive summary|professional profile)\s*:?\s*$': "Summary",
+    r'(?i)^\s*(objective|career objective|professional objective|career goal|job objective)\s*:?\s*$': "Objective",
+    r'(?i)^\s*(skills|technical skills|core skills|key skills|competencies|areas of expertise|areas of knowledge)\s*:?\s*$': "Skills",
+    r'(?i)^\s*(technical skills|hard skills|technical competencies|technical expertise)\s*:?\s*$': "Technical Skills",
+    r'(?i)^\s*(soft skills|interpersonal skills|people skills|communication skills)\s*:?\s*$': "Soft Skills",
+    r'(?i)^\s*(experience|work experience|employment|employment history|work history|career history|professional experience)\s*:?\s*$': "Experience",
+    r'(?i)^\s*(education|academic background|qualifications|academic qualifications|educational background)\s*:?\s*$': "Education",
+    r'(?i)^\s*(projects|project experience|key projects|relevant projects|personal projects)\s*:?\s*$': "Projects",
+    r'(?i)^\s*(certifications|certificates|professional certifications|credentials|qualifications)\s*:?\s*$': "Certifications",
+    r'(?i)^\s*(publications|papers|research papers|articles|published works)\s*:?\s*$': "Publications",
+    r'(?i)^\s*(patents|patent applications|inventions)\s*:?\s*$': "Patents",
+    r'(?i)^\s*(awards|honors|recognitions|achievements)\s*:?\s*$': "Awards",
+    r'(?i)^\s*(achievements|accomplishments|key achievements)\s*:?\s*$': "Achievements",
+    r'(?i)^\s*(languages|language skills|language proficiency|foreign languages)\s*:?\s*$': "Languages",
+    r'(?i)^\s*(interests|hobbies|activities|personal interests)\s*:?\s*$': "Interests",
+    r'(?i)^\s*(volunteer|volunteering|volunteer experience|community service)\s*:?\s*$': "Volunteer Experience",
+    r'(?i)^\s*(affiliations|professional affiliations|memberships|professional memberships)\s*:?\s*$': "Professional Affiliations",
+    r'(?i)^\s*(references|professional references|character references)\s*:?\s*$': "References"
+}
+
+
+def legacy_match_section_header(line):
+    """The old matcher: try every pattern in order until one matches."""
+    for pattern, section in LEGACY_SECTION_PATTERNS.items():
+        if re.match(pattern, line):
+            return section
+    return None
+
+
+def sample_lines():
+    """Header variants for every alias plus typical body lines."""
+    lines = []
+    for _, names in SECTION_HEADER_ALIASES:
+        for name in names:
+            lines.extend([name, name.upper(), name.title() + ":", f"  {name} :  ", name + "::",
+                          f"1. {name.upper()}", f"{name.upper()} —"])
+    lines.extend([
+        "Jane Doe",
+        "jane.doe@example.com | (555) 123-4567",
+        "Senior Software Engineer, Acme Corp (2019 - Present)",
+        "- Built a data pipeline processing 2M events/day with Python and Kafka",
+        "- Led a team of 5 engineers across two product launches",
+        "BS in Computer Science, State University, 2015",
+        "Python, SQL, Docker, Kubernetes, AWS",
+        "Skills: Python, SQL",
+        "Work experience at a startup",
+    ])
+    return lines
+
+
+def main():
+    lines = sample_lines()
+
+    # Every header the legacy matcher recognized must map to the same section;
+    # the normalized matcher additionally accepts numbered and punctuated headers
+    mismatches = [line for line in lines
+                  if legacy_match_section_header(line.strip()) is not None
+                  and legacy_match_section_header(line.strip()) != match_section_header(line.strip())]
+    widened = [line for line in lines
+               if legacy_match_section_header(line.strip()) is None and match_section_header(line.strip())]
+    print(f"Equivalence check: {len(lines)} lines, {len(mismatches)} mismatches, "
+          f"{len(widened)} extra headers recognized")
+    for line in mismatches:
+        print(f"  {line!r}: legacy={legacy_match_section_header(line.strip())!r} "
+              f"new={match_section_header(line.strip())!r}")
+
+    repeat = 200
+    legacy = timeit.timeit(lambda: [legacy_match_section_header(l.strip()) for l in lines], number=repeat)
+    lookup = timeit.timeit(lambda: [match_section_header(l.strip()) for l in lines], number=repeat)
+    per_line = repeat * len(lines)
+    print(f"Legacy regex loop: {legacy / per_line * 1e6:8.2f} us/line")
+    print(f"Lookup matcher:    {lookup / per_line * 1e6:8.2f} us/line")
+    print(f"Speedup:           {legacy / lookup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark canonical-id skill matching against the nested synonym loops it replaced.
+
+Resumes and postings are built from random samples of the taxonomy, so
+each side carries up to a couple of hundred skills. Every job skill the
+skill-id matcher reports missing must also be missing for the old loops,
+except where the resume only names a broader skill: the old loops let
+"SQL" satisfy a MySQL requirement, the one-way specializations do not.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_job_match
+"""
+import random
+import timeit
+
+from resume_core.skills import canonical_skills, extract_enhanced_skills, match_skills, skill_generalizations
+from resume_core.taxonomy import get_skill_index
+
+SKILL_COUNTS = (20, 100, 180)
+
+# The synonym table analyze_job_match used to check in both directions
+LEGACY_TECH_SYNONYMS = {
+    "js": ["javascript"],
+    "react": ["reactjs", "react.js"],
+    "python": ["py"],
+    "node": ["nodejs", "node.js"],
+    "typescript": ["ts"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "ml": ["machine learning"],
+    "ai": ["artificial intelligence"],
+    "sql": ["mysql", "postgresql", "tsql", "database"],
+    "ui": ["user interface"],
+    "ux": ["user experience"],
+    "ci/cd": ["continuous integration", "continuous deployment"],
+    "api": ["rest", "rest api", "restful"],
+    "nlp": ["natural language processing"],
+    "cv": ["computer vision"],
+}
+
+
+def legacy_match(resume_skills, job_skills, tech_synonyms=LEGACY_TECH_SYNONYMS):
+    """The old analyze_job_match loops: (matched resume skills, missing job skills)."""
+    matched_skills = []
+    for resume_skill in resume_skills:
+        if resume_skill.lower() in [s.lower() for s in job_skills]:
+            matched_skills.append(resume_skill)
+            continue
+        resume_skill_lower = resume_skill.lower()
+        for job_skill in job_skills:
+            job_skill_lower = job_skill.lower()
+            if resume_skill_lower in tech_synonyms and job_skill_lower in tech_synonyms[resume_skill_lower]:
+                matched_skills.append(resume_skill)
+                break
+            if job_skill_lower in tech_synonyms and resume_skill_lower in tech_synonyms[job_skill_lower]:
+                matched_skills.append(resume_skill)
+                break
+
+    missing_skills = []
+    for job_skill in job_skills:
+        job_skill_lower = job_skill.lower()
+        if not any(job_skill_lower == skill.lower() for skill in matched_skills):
+            has_synonym_match = False
+            for matched_skill in matched_skills:
+                matched_skill_lower = matched_skill.lower()
+                if matched_skill_lower in tech_synonyms and job_skill_lower in tech_synonyms[matched_skill_lower]:
+                    has_synonym_match = True
+                    break
+                if job_skill_lower in tech_synonyms and matched_skill_lower in tech_synonyms[job_skill_lower]:
+                    has_synonym_match = True
+                    break
+            if not has_synonym_match:
+                missing_skills.append(job_skill)
+    return matched_skills, missing_skills
+
+
+def skill_text(rng, names, count):
+    """A comma-separated skill list of ``count`` random taxonomy skills."""
+    return ", ".join(rng.sample(names, count))
+
+
+def main():
+    index = get_skill_index()
+    names = [index.name(skill_id) for skill_id in range(index.skill_count)]
+    generalizations = skill_generalizations(index)
+    rng = random.Random(11)
+
+    print(f"{'skills':>7} {'nested loops us':>16} {'canonical ids us':>17} {'speedup':>8}")
+    for count in SKILL_COUNTS:
+        count = min(count, len(names))
+        pairs = [(skill_text(rng, names, count), skill_text(rng, names, count)) for _ in range(20)]
+        extracted = [(extract_enhanced_skills(resume), extract_enhanced_skills(job)) for resume, job in pairs]
+
+        for (resume, job), (resume_skills, job_skills) in zip(pairs, extracted):
+            _, legacy_missing = legacy_match(resume_skills, job_skills)
+            _, missing, _ = match_skills(resume, job)
+            resume_ids = canonical_skills(resume)
+            for name in set(missing) - set(legacy_missing):
+                assert generalizations.get(index.lookup(name), frozenset()) & resume_ids.keys(), \
+                    f"skill-id matching lost a match for {name}"
+
+        # Both timings include extracting the skills from the texts, as analyze_job_match does
+        legacy = timeit.timeit(lambda: [legacy_match(extract_enhanced_skills(r), extract_enhanced_skills(j))
+                                        for r, j in pairs], number=5) / (5 * len(pairs))
+        canonical = timeit.timeit(lambda: [match_skills(r, j) for r, j in pairs], number=5) / (5 * len(pairs))
+        print(f"{count:7d} {legacy * 1e6:16.1f} {canonical * 1e6:17.1f} {legacy / canonical:7.1f}x")
+
+    for resume, job in (("MySQL", "SQL"), ("SQL", "MySQL"), ("MySQL", "PostgreSQL")):
+        matched, _, _ = match_skills(f"Experience with {resume}", f"Must know {job}")
+        print(f"{resume} meets a {job} requirement: {bool(matched)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark job-seeker ranking: one resume against a bulk set of saved postings.
+
+Postings are synthesized from the corpus skill pools. Reports the cost
+of saving them (local feature extraction plus the coverage row), of
+ranking a resume against all of them, and of the per-posting
+match_skills loop the single product replaces.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_job_postings [--postings 500]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.corpus import SOFT_SKILLS, TECH_SKILLS, TITLES, generate_corpus
+from resume_core.jobs import JobPostingStore
+from resume_core.skills import match_skills
+
+
+def generate_posting(rng):
+    """A job posting with responsibilities, requirements and a culture line."""
+    skills = rng.sample(TECH_SKILLS, rng.randint(3, 8)) + rng.sample(SOFT_SKILLS, rng.randint(1, 2))
+    lines = [rng.choice(TITLES), "", "Responsibilities:"]
+    lines += [f"- Work with {skill} across the stack" for skill in skills[:3]]
+    lines += ["", "Requirements"]
+    lines += [f"- {rng.randint(1, 8)}+ years of experience with {skills[0]}", f"- Skills: {', '.join(skills)}"]
+    lines += ["- BS in Computer Science or related field", "", "We value an inclusive, curious culture."]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--postings', type=int, default=500, help="number of saved postings")
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    postings = [generate_posting(rng) for _ in range(args.postings)]
+    resumes = [resume['text'] for resume in generate_corpus(20, seed=3)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = JobPostingStore(os.path.join(workdir, "postings.json"))
+        start = time.perf_counter()
+        for text in postings:
+            store.add("", text)
+        store.save()
+        print(f"Saved {len(store)} postings in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+        store = JobPostingStore(store.path)
+        store.rank(resumes[0])  # builds the matrix
+        samples = []
+        for resume in resumes:
+            start = time.perf_counter()
+            store.rank(resume, 20)
+            samples.append(time.perf_counter() - start)
+        print(f"Ranking one resume:             {statistics.median(samples) * 1e3:8.2f} ms")
+
+        start = time.perf_counter()
+        for text in postings:
+            match_skills(resumes[0], text)
+        print(f"match_skills for every posting: {(time.perf_counter() - start) * 1e3:8.2f} ms")
+        print(f"Model calls per resume: {args.postings} before, RESUME_JOB_REFINE_TOP_N (default 3) now")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the one-pass keyword counter against the per-keyword str.count loop.
+
+The one-pass cost stays nearly flat as the vocabulary grows (the
+taxonomy's names and aliases serve as a larger vocabulary), while the
+count loop scans the text once per keyword. Also reports where the two
+disagree: substring counts include hits inside other words ("ai" in
+"maintain", "java" in "javascript", "design" in "designed"), which the
+token-based counter no longer reports.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_keywords
+"""
+import timeit
+from collections import Counter
+
+from benchmarks.corpus import generate_corpus
+from resume_core.keywords import KEYWORD_VOCABULARY, keyword_vector
+from resume_core.taxonomy import DEFAULT_TAXONOMY_PATH, load_taxonomy
+
+
+def legacy_keyword_counts(text_lower, vocabulary=KEYWORD_VOCABULARY):
+    """The old analyze_job_match loop: one substring count per keyword."""
+    return [text_lower.count(keyword) for keyword in vocabulary]
+
+
+def taxonomy_vocabulary():
+    """Every skill name and alias in the taxonomy, as a larger keyword vocabulary."""
+    terms = []
+    for skill, _, aliases in load_taxonomy(DEFAULT_TAXONOMY_PATH):
+        terms.extend(term.lower() for term in [skill] + aliases)
+    return tuple(dict.fromkeys(terms))
+
+
+def main():
+    texts = [resume['text'].lower() for resume in generate_corpus(200, seed=7)]
+
+    repeat = 5
+    per_text = repeat * len(texts)
+    print(f"{'vocabulary':>10} {'str.count us':>13} {'one-pass us':>12} {'speedup':>8}")
+    for vocabulary in (KEYWORD_VOCABULARY, taxonomy_vocabulary()):
+        legacy = timeit.timeit(lambda: [legacy_keyword_counts(t, vocabulary) for t in texts], number=repeat)
+        one_pass = timeit.timeit(lambda: [keyword_vector(t, vocabulary) for t in texts], number=repeat)
+        print(f"{len(vocabulary):10d} {legacy / per_text * 1e6:13.1f} {one_pass / per_text * 1e6:12.1f} "
+              f"{legacy / one_pass:7.1f}x")
+
+    over_counted = Counter()
+    for text in texts:
+        for keyword, old, new in zip(KEYWORD_VOCABULARY, legacy_keyword_counts(text), keyword_vector(text)):
+            if old != new:
+                over_counted[keyword] += old - new
+    print("\nKeywords whose substring count differed (old minus new, summed over the corpus)")
+    for keyword, difference in over_counted.most_common(10):
+        print(f"  {keyword:18} {difference:+6d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark the local match scorer that replaces the constant calculate_match_score fallbacks.
+
+Scores every resume of a synthetic corpus against a few postings (job
+features from extract_job_features_local) and reports the time per
+pair, per-component timings, the cost of a cached artifact lookup and
+the spread of each score, which the old fallback pinned at
+55/60/50/65/55. Postings requiring a master's or a PhD make the
+education score vary, and one posting names no skills, so skills_match
+is left out of its blend. Fails if a requirement text reads as the
+wrong required degree level.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_match_scorer [--count 500]
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core import matching
+from resume_core.jobs import extract_job_features_local
+from resume_core.model import as_resume_document
+
+JOB_POSTINGS = (
+    "Senior backend engineer\nRequirements\n- 5+ years of Python and SQL, Docker and Kubernetes on AWS\n"
+    "- Bachelor's degree in Computer Science\nResponsibilities\n- Build microservices, GraphQL and REST APIs\n"
+    "- Own CI/CD and mentor junior engineers",
+    "Machine learning engineer\n- PyTorch or TensorFlow, deep learning, NLP, computer vision\n"
+    "- 3+ years of experience with Spark and Hadoop\n- Master's degree or PhD preferred\n"
+    "We value curiosity, ownership and an inclusive culture.",
+    "Data analyst: SQL, Tableau, data analysis and PostgreSQL. 2+ years of experience. "
+    "Time management and teamwork. Degree in statistics or a related field.",
+    "Research scientist, machine learning\n- PhD in Computer Science or a related field required\n"
+    "- Publications in NLP or computer vision; 2+ years of PyTorch",
+    "Product analytics lead\n- Master's degree required; PhD a plus\n- 4+ years of experience\n"
+    "Scrum Master experience is a bonus.",
+    "Operations coordinator\nWe are looking for a reliable, organised person to join a friendly team. "
+    "Master's degree in business administration required.",
+)
+
+# (requirement text, required degree level): 2 bachelor's, 3 master's, 4 PhD, 0 none
+REQUIRED_LEVELS = (
+    ("Bachelor's degree in Computer Science", 2),
+    ("Bachelor's or Master's degree", 2),
+    ("Bachelor's required; Master's preferred", 2),
+    ("Master's degree or PhD preferred", 0),
+    ("Master's degree required; PhD a plus", 3),
+    ("PhD in Computer Science or a related field required", 4),
+    ("B.S. or M.S. in Computer Science", 2),
+    ("Looking for a Scrum Master", 0),
+    ("Associate Software Engineer", 0),
+    ("Degree in statistics or a related field", 2),
+)
+
+
+def per_pair_ms(function, pairs):
+    start = time.perf_counter()
+    for resume, job in pairs:
+        function(resume, job)
+    return (time.perf_counter() - start) / len(pairs) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=500, help="number of resumes")
+    args = parser.parse_args()
+
+    for text, expected in REQUIRED_LEVELS:
+        level = matching.required_degree_level(text)
+        assert level == expected, f"{text!r}: required level {level}, expected {expected}"
+    print(f"{len(REQUIRED_LEVELS)} requirement texts read as the expected degree levels")
+
+    resumes = [resume['sections'] for resume in generate_corpus(args.count, seed=41)]
+    jobs = [extract_job_features_local(posting) for posting in JOB_POSTINGS]
+    pairs = [(sections, job) for job in jobs for sections in resumes]
+    for sections in resumes:
+        as_resume_document(sections)  # parse once, as the app does before matching
+
+    print(f"{len(pairs)} resume/job pairs")
+    print(f"score_match_local: {per_pair_ms(matching.score_match_local, pairs):6.2f} ms per pair")
+    components = {
+        'build artifact': lambda sections, job: matching.build_match_artifact(sections, matching.job_text(job)),
+        'education': lambda sections, job: matching.education_score(
+            sections.get("Education", ""), job["Education Requirements"]),
+        'bm25 fit': lambda sections, job: matching.bm25_fit(
+            [matching.match_tokens(content) for content in sections.values()],
+            [matching.match_tokens(line) for line in matching.job_text(job).splitlines()]),
+    }
+    for name, function in components.items():
+        print(f"  {name:16} {per_pair_ms(function, pairs):6.2f} ms")
+    repeated = [(resumes[0], JOB_POSTINGS[0])] * 1000
+    print(f"Cached artifact:   {per_pair_ms(matching.get_match_artifact, repeated) * 1e3:6.1f} us per lookup")
+
+    results = [matching.score_match_local(sections, job) for sections, job in pairs]
+    print(f"\n{'score':18} {'min':>4} {'median':>6} {'max':>4}")
+    for name in ('match_score', 'skills_match', 'experience_match', 'education_match', 'overall_fit'):
+        values = [result[name] for result in results if result[name] is not None]
+        print(f"{name:18} {min(values):4d} {statistics.median(values):6.0f} {max(values):4d}")
+    unscored = sum(result['skills_match'] is None for result in results)
+    print(f"{unscored} pairs without job skills left skills_match out of the blend")
+    assert len({result['education_match'] for result in results}) > 1, "education_match never varied"
+
+
+if __name__ == "__main__":
+    main()
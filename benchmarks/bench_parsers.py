@@ -0,0 +1,211 @@
+"""Benchmark the local parsers on the synthetic corpus: throughput, latency percentiles and accuracy.
+
+Section parsers are scored per ground-truth section: a section counts as
+correct when the parser returns it (under its canonical name) with a word
+overlap (Jaccard) of at least ``SECTION_MATCH_THRESHOLD``; the corpus's
+hand-written regression resumes are reported as their own layout. The skill
+extractor is scored by precision and recall against the skills the
+generator placed in the text.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parsers [--count 300] [--seed 13] [--repeat 3]
+"""
+import argparse
+import re
+import statistics
+import time
+from collections import defaultdict
+
+from benchmarks.corpus import generate_corpus, regression_corpus
+from resume_core.parsing import (extract_sections_simple, parse_resume_sections_local, parse_sections_by_headers,
+                                 parse_sections_with_confidence)
+from resume_core.skills import extract_enhanced_skills
+
+SECTION_MATCH_THRESHOLD = 0.8
+ROUTING_THRESHOLDS = (0.4, 0.5, 0.6, 0.7, 0.8)
+WORD_PATTERN = re.compile(r'\w+')
+
+# Parser outputs that name a ground-truth section differently
+SECTION_EQUIVALENTS = {
+    "Personal Information": "Contact Information",
+    "Professional Summary": "Summary",
+    "Technical Skills": "Skills",
+    "Soft Skills": "Skills",
+    "Work Experience": "Experience",
+    "Employment History": "Experience",
+}
+
+SECTION_PARSERS = {
+    "parse_sections_by_headers": parse_sections_by_headers,
+    "parse_resume_sections_local": parse_resume_sections_local,
+    "extract_sections_simple": extract_sections_simple,
+}
+SKILL_EXTRACTORS = {
+    "extract_enhanced_skills": extract_enhanced_skills,
+}
+
+
+def canonical_sections(sections):
+    """Merge equivalent section names so parser output lines up with the ground truth."""
+    merged = defaultdict(list)
+    for name, content in sections.items():
+        if content:
+            merged[SECTION_EQUIVALENTS.get(name, name)].append(content)
+    return {name: "\n".join(contents) for name, contents in merged.items()}
+
+
+def jaccard(a, b):
+    """Word-set overlap of two texts."""
+    words_a = set(WORD_PATTERN.findall(a.lower()))
+    words_b = set(WORD_PATTERN.findall(b.lower()))
+    if not words_a and not words_b:
+        return 1.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def section_accuracy(predicted, truth):
+    """(correct sections, ground-truth sections, summed overlap) for one resume."""
+    predicted = canonical_sections(predicted)
+    correct = 0
+    overlap = 0.0
+    for name, content in truth.items():
+        score = jaccard(predicted.get(name, ""), content)
+        overlap += score
+        correct += score >= SECTION_MATCH_THRESHOLD
+    return correct, len(truth), overlap
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def time_parser(parser, corpus, repeat):
+    """Per-document latencies (best of ``repeat``) and the outputs of the last run."""
+    best = [float('inf')] * len(corpus)
+    outputs = [None] * len(corpus)
+    for _ in range(repeat):
+        for index, resume in enumerate(corpus):
+            start = time.perf_counter()
+            outputs[index] = parser(resume['text'])
+            best[index] = min(best[index], time.perf_counter() - start)
+    return best, outputs
+
+
+def latency_summary(latencies):
+    """Throughput and latency percentiles for one parser."""
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    return {
+        'throughput': len(ordered) / total if total else float('inf'),
+        'p50_ms': percentile(ordered, 0.50) * 1e3,
+        'p90_ms': percentile(ordered, 0.90) * 1e3,
+        'p99_ms': percentile(ordered, 0.99) * 1e3,
+        'mean_ms': statistics.fmean(ordered) * 1e3,
+    }
+
+
+def benchmark_section_parser(parser, corpus, repeat):
+    """Latency and section accuracy (overall and per header style) of a section parser."""
+    latencies, outputs = time_parser(parser, corpus, repeat)
+    result = latency_summary(latencies)
+
+    totals = defaultdict(lambda: [0, 0])
+    overlap_sum = 0.0
+    for resume, predicted in zip(corpus, outputs):
+        correct, expected, overlap = section_accuracy(predicted, resume['sections'])
+        overlap_sum += overlap
+        for group in ('all', resume['layout']['header_style'],
+                      'two-column' if resume['layout']['columns'] == 2 else None,
+                      'long' if resume['layout']['long'] else None):
+            if group:
+                totals[group][0] += correct
+                totals[group][1] += expected
+    result['accuracy'] = {group: correct / expected for group, (correct, expected) in totals.items()}
+    result['mean_overlap'] = overlap_sum / totals['all'][1]
+    return result
+
+
+def benchmark_skill_extractor(extractor, corpus, repeat):
+    """Latency, precision and recall of a skill extractor."""
+    latencies, outputs = time_parser(extractor, corpus, repeat)
+    result = latency_summary(latencies)
+
+    found_total = truth_total = hits = 0
+    for resume, found in zip(corpus, outputs):
+        found = {skill.lower() for skill in found}
+        truth = {skill.lower() for skill in resume['skills']}
+        hits += len(found & truth)
+        found_total += len(found)
+        truth_total += len(truth)
+    result['precision'] = hits / found_total if found_total else 0.0
+    result['recall'] = hits / truth_total if truth_total else 0.0
+    return result
+
+
+def routing_report(corpus, thresholds=ROUTING_THRESHOLDS):
+    """Share of the corpus sent to the model at each confidence threshold, and accuracy of what stays local."""
+    parsed = [(parse_sections_with_confidence(resume['text']), resume['sections']) for resume in corpus]
+    report = {}
+    for threshold in thresholds:
+        correct = expected = routed = 0
+        for (sections, confidence, _), truth in parsed:
+            if confidence < threshold:
+                routed += 1
+                continue
+            doc_correct, doc_expected, _ = section_accuracy(sections, truth)
+            correct += doc_correct
+            expected += doc_expected
+        report[threshold] = {
+            'ai_share': routed / len(corpus),
+            'local_accuracy': correct / expected if expected else 0.0,
+        }
+    return report
+
+
+def run(count=300, seed=13, repeat=3):
+    """Benchmark every registered parser; returns {parser name: result dict}."""
+    corpus = generate_corpus(count, seed) + regression_corpus()
+    results = {}
+    for name, parser in SECTION_PARSERS.items():
+        results[name] = benchmark_section_parser(parser, corpus, repeat)
+    for name, extractor in SKILL_EXTRACTORS.items():
+        results[name] = benchmark_skill_extractor(extractor, corpus[:count], repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=300, help="number of synthetic resumes")
+    parser.add_argument('--seed', type=int, default=13, help="corpus seed")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per document (best is kept)")
+    args = parser.parse_args()
+
+    results = run(args.count, args.seed, args.repeat)
+    print(f"Corpus: {args.count} resumes, seed {args.seed}, best of {args.repeat}")
+    print(f"{'parser':30} {'docs/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}  accuracy")
+    for name, result in results.items():
+        if 'accuracy' in result:
+            quality = f"sections {result['accuracy']['all']:.1%} (overlap {result['mean_overlap']:.2f})"
+        else:
+            quality = f"precision {result['precision']:.1%} recall {result['recall']:.1%}"
+        print(f"{name:30} {result['throughput']:9.0f} {result['p50_ms']:8.3f} {result['p90_ms']:8.3f} "
+              f"{result['p99_ms']:8.3f}  {quality}")
+
+    print("\nSection accuracy by layout")
+    groups = sorted({group for result in results.values() for group in result.get('accuracy', {})} - {'all'})
+    print(f"{'parser':30} " + " ".join(f"{group:>10}" for group in groups))
+    for name, result in results.items():
+        if 'accuracy' in result:
+            print(f"{name:30} " + " ".join(f"{result['accuracy'].get(group, 0):10.1%}" for group in groups))
+
+    print("\nAI routing by confidence threshold (parse_sections_with_confidence)")
+    print(f"{'threshold':>10} {'sent to AI':>11} {'local accuracy':>15}")
+    for threshold, row in routing_report(generate_corpus(args.count, args.seed) + regression_corpus()).items():
+        print(f"{threshold:10.2f} {row['ai_share']:11.1%} {row['local_accuracy']:15.1%}")
+
+
+if __name__ == "__main__":
+    main()
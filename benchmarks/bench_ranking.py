@@ -0,0 +1,92 @@
+"""Benchmark recruiter ranking: one job description against thousands of stored resumes.
+
+Indexes a synthetic corpus into a throwaway feature store, then times
+ranking the whole store with the CSR product (when NumPy/SciPy are
+installed) and with the pure-Python fallback, against calling
+match_skills on every resume text.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ranking [--count 10000]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core import ranking
+from resume_core.skills import match_skills
+
+JOB_POSTINGS = (
+    "Senior backend engineer. 5+ years of Python and SQL, Docker and Kubernetes on AWS. "
+    "Experience with microservices, GraphQL and CI/CD. Strong communication and mentoring.",
+    "Machine learning engineer: PyTorch or TensorFlow, deep learning, NLP, computer vision, "
+    "Spark and Hadoop for data pipelines. Leadership and stakeholder management a plus.",
+    "Data analyst with SQL, Tableau, data analysis and PostgreSQL. Time management and teamwork.",
+)
+
+
+def time_rankings(ranker, repeat=5):
+    """Median seconds to rank the store for each posting."""
+    timings = []
+    for posting in JOB_POSTINGS:
+        ranker.rank(posting)  # warm the matrix snapshot
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            ranker.rank(posting)
+            samples.append(time.perf_counter() - start)
+        timings.append(statistics.median(samples))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=10000, help="number of stored resumes")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, seed=21)
+    with tempfile.TemporaryDirectory() as workdir:
+        ranker = ranking.ResumeRanker(os.path.join(workdir, "features.json"))
+        start = time.perf_counter()
+        for position, resume in enumerate(corpus):
+            ranker.add(f"resume_{position:05d}.pdf", resume['text'])
+        ranker.save()
+        print(f"Indexed {len(ranker)} resumes in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(ranker.path) / 1024:.0f} KB on disk)")
+
+        # Reload from disk, as a fresh server process would
+        ranker = ranking.ResumeRanker(ranker.path)
+        start = time.perf_counter()
+        ranker.rank(JOB_POSTINGS[0])
+        print(f"First ranking after load (builds the matrix): {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+        numpy_available = ranking.NUMPY_AVAILABLE
+        if numpy_available:
+            print(f"CSR product + heap:        {time_rankings(ranker) * 1e3:8.1f} ms per ranking")
+        ranking.NUMPY_AVAILABLE = False
+        try:
+            fallback = ranking.ResumeRanker(ranker.path)
+            print(f"Pure-Python fallback:      {time_rankings(fallback, repeat=1) * 1e3:8.1f} ms per ranking")
+        finally:
+            ranking.NUMPY_AVAILABLE = numpy_available
+
+        sample = corpus[:500]
+        start = time.perf_counter()
+        for resume in sample:
+            match_skills(resume['text'], JOB_POSTINGS[0])
+        per_resume = (time.perf_counter() - start) / len(sample)
+        print(f"match_skills per resume:   {per_resume * len(corpus) * 1e3:8.1f} ms per ranking "
+              f"(extrapolated from {len(sample)})")
+
+        top = ranker.rank(JOB_POSTINGS[0], 3)
+        print("\nTop 3 for the first posting:")
+        for file_id, score in top:
+            matched, missing = ranker.explain(file_id, JOB_POSTINGS[0])
+            print(f"  {file_id} {score:5.1f}%  missing: {', '.join(missing) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
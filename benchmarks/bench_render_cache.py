@@ -0,0 +1,76 @@
+"""Benchmark the on-disk render cache against rendering every PDF.
+
+Renders corpus resumes with each template (cold), then requests the same
+renders again, which the cache serves as a file read. Reports the cost of
+computing the render key (the ETag) on its own, and shows the byte
+budget at work: a cache limited to a quarter of the rendered bytes keeps
+only the most recently used PDFs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render_cache [--count 50]
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core.render_cache import RenderCache, render_key
+from resume_core.rendering import render_pdf_from_sections
+
+TEMPLATES = ("Minimalist", "ATS-Friendly", "Project-Focused")
+OPTIONS = {"color_scheme": "Modern Gray", "font": "Classic", "include_qr": False}
+
+
+def cached_render(cache, sections, template, options):
+    key = render_key(sections, template, options)
+    pdf_bytes = cache.get(key)
+    if pdf_bytes is None:
+        pdf_bytes = render_pdf_from_sections(sections, template, options)
+        cache.put(key, pdf_bytes)
+    return pdf_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=50, help="number of resumes")
+    args = parser.parse_args()
+
+    corpus = [resume['sections'] for resume in generate_corpus(args.count, seed=49)]
+    renders = [(sections, template, OPTIONS) for sections in corpus for template in TEMPLATES]
+    render_pdf_from_sections(corpus[0], TEMPLATES[0], OPTIONS)  # import ReportLab and build the styles
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = RenderCache(directory)
+        start = time.perf_counter()
+        cold = [cached_render(cache, *render) for render in renders]
+        cold_ms = (time.perf_counter() - start) / len(renders) * 1e3
+        start = time.perf_counter()
+        warm = [cached_render(cache, *render) for render in renders]
+        warm_ms = (time.perf_counter() - start) / len(renders) * 1e3
+        start = time.perf_counter()
+        for render in renders:
+            render_key(*render)
+        key_us = (time.perf_counter() - start) / len(renders) * 1e6
+        stats = cache.stats()
+
+    print(f"{len(renders)} renders, {stats['bytes'] / len(renders) / 1024:.1f} KiB per PDF")
+    print(f"Render and store:  {cold_ms:7.2f} ms per PDF")
+    print(f"Cache hit:         {warm_ms:7.3f} ms per PDF ({cold_ms / warm_ms:.0f}x)")
+    print(f"Render key (ETag): {key_us:7.1f} us")
+    print(f"Identical bytes on hit: {all(a == b for a, b in zip(cold, warm))}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = RenderCache(directory, max_bytes=stats['bytes'] // 4)
+        for render in renders:
+            cached_render(cache, *render)
+        bounded = cache.stats()
+        reopened = RenderCache(directory, max_bytes=bounded['max_bytes']).stats()
+        recent = sum(cache.get(render_key(*render)) is not None for render in renders[-bounded['entries']:])
+    print(f"Budget {bounded['max_bytes'] / 1024:.0f} KiB: {bounded['entries']} PDFs kept "
+          f"({bounded['bytes'] / 1024:.0f} KiB), {recent} of them the most recent; "
+          f"{reopened['entries']} indexed after reopening")
+
+
+if __name__ == "__main__":
+    main()
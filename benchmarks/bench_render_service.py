@@ -0,0 +1,120 @@
+"""Benchmark PDF render throughput and interactivity, in threads versus the worker pool.
+
+Renders a burst of resumes the way concurrent sessions would: first in
+threads of the server process (ReportLab holds the GIL, so they
+serialize), then through WorkerService with growing pool sizes. While
+each burst runs, the main thread repeatedly times a small fixed piece of
+pure-Python work, standing in for another session's script run; its
+slowdown shows how much the renders hurt interactivity. Finally submits
+more renders than the queue depth allows and counts the rejections.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render_service [--count 48]
+"""
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.corpus import generate_corpus
+from resume_core import workers
+from resume_core.rendering import render_pdf_from_sections
+
+TEMPLATE = "Minimalist"
+
+
+def interactive_work():
+    """About ten milliseconds of pure-Python work, like a light script rerun."""
+    return sum(index * index for index in range(200000))
+
+
+def work_latency_ms(stop):
+    """Mean latency of interactive_work, sampled until ``stop`` is set."""
+    samples = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        interactive_work()
+        samples.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    return sum(samples) / len(samples) * 1e3 if samples else 0.0
+
+
+def run_burst(render_all):
+    """(seconds for the burst, mean interactive latency in ms while it ran)."""
+    stop = threading.Event()
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(elapsed=render_all()) or stop.set())
+    thread.start()
+    latency = work_latency_ms(stop)
+    thread.join()
+    return result['elapsed'], latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=48, help="renders per burst")
+    args = parser.parse_args()
+
+    corpus = [resume['sections'] for resume in generate_corpus(args.count, seed=50)]
+    render_pdf_from_sections(corpus[0], TEMPLATE)  # import ReportLab before timing
+    cores = os.cpu_count() or 2
+
+    stop = threading.Event()
+    timer = threading.Timer(1.0, stop.set)
+    timer.start()
+    idle = work_latency_ms(stop)
+    print(f"{args.count} renders per burst, {cores} cores; idle interactive work {idle:.1f} ms")
+    print(f"{'mode':18} {'seconds':>8} {'PDFs/s':>7} {'interactive ms':>15}")
+
+    def threaded():
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda sections: render_pdf_from_sections(sections, TEMPLATE), corpus))
+        return time.perf_counter() - start
+
+    elapsed, latency = run_burst(threaded)
+    print(f"{'4 threads':18} {elapsed:8.2f} {args.count / elapsed:7.1f} {latency:15.1f}")
+
+    pool_sizes = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+    for pool_size in pool_sizes:
+        service = workers.WorkerService(pool_size=pool_size, queue_limits={})
+        try:
+            # Start every worker process before timing
+            for task_id in [service.submit("render_pdf", corpus[0], TEMPLATE) for _ in range(pool_size)]:
+                service.result(task_id)
+                service.forget(task_id)
+
+            def pooled():
+                start = time.perf_counter()
+                task_ids = [service.submit("render_pdf", sections, TEMPLATE, timeout=workers.RENDER_TIMEOUT)
+                            for sections in corpus]
+                for task_id in task_ids:
+                    service.result(task_id)
+                    service.forget(task_id)
+                return time.perf_counter() - start
+
+            elapsed, latency = run_burst(pooled)
+            print(f"{f'pool of {pool_size}':18} {elapsed:8.2f} {args.count / elapsed:7.1f} {latency:15.1f}")
+        finally:
+            service.shutdown()
+
+    service = workers.WorkerService(pool_size=2, queue_limits={"render_pdf": 8})
+    try:
+        accepted, rejected = [], 0
+        for sections in corpus:
+            try:
+                accepted.append(service.submit("render_pdf", sections, TEMPLATE))
+            except workers.WorkerBusy:
+                rejected += 1
+        for task_id in accepted:
+            service.result(task_id)
+            service.forget(task_id)
+        print(f"\nQueue depth 8: {len(accepted)} accepted, {rejected} rejected with WorkerBusy")
+    finally:
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark rescoring a resume while one section is being edited.
+
+Simulates an editing session: each rerun appends a word to one section
+and rescores the whole resume. Compares the old from-scratch scoring
+(every section joined and lowercased) with calculate_resume_scores over
+cached per-section components and with a ResumeAnalysis graph, which
+recomputes only the edited section's components.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_score_components [--count 200] [--edits 50]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core import scoring
+from resume_core.incremental import ResumeAnalysis
+
+PADDING_SECTIONS = 8  # extra long sections so the untouched part of the resume dominates
+
+
+def legacy_scores(sections):
+    """The old calculate_resume_scores: presence, total length and keyword hits over the joined text."""
+    present_sections = sum(1 for section in scoring.SCORE_KEY_SECTIONS if sections.get(section, "").strip())
+    total_length = sum(len(content) for content in sections.values())
+    return scoring.combine_scores(present_sections, total_length,
+                                  len(scoring.keyword_hits(' '.join(sections.values()).lower())))
+
+
+def edit_session(sections, edits):
+    """Successive versions of a resume whose Summary grows by one word per rerun."""
+    versions = []
+    for step in range(edits):
+        sections = dict(sections, Summary=sections.get("Summary", "") + f" improved{step}")
+        versions.append(sections)
+    return versions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=200, help="number of resumes")
+    parser.add_argument('--edits', type=int, default=50, help="edits per resume")
+    args = parser.parse_args()
+
+    corpus = []
+    for resume in generate_corpus(args.count, seed=47):
+        sections = dict(resume['sections'])
+        for index in range(PADDING_SECTIONS):
+            sections[f"Project {index}"] = sections.get("Experience", "")
+        corpus.append(sections)
+    sessions = [edit_session(sections, args.edits) for sections in corpus]
+    reruns = args.count * args.edits
+
+    start = time.perf_counter()
+    expected = [[legacy_scores(version) for version in versions] for versions in sessions]
+    legacy = (time.perf_counter() - start) / reruns * 1e6
+
+    for sections in corpus:
+        scoring.calculate_resume_scores(sections)  # the upload warms every section's components
+    start = time.perf_counter()
+    cached = [[scoring.calculate_resume_scores(version) for version in versions] for versions in sessions]
+    components = (time.perf_counter() - start) / reruns * 1e6
+
+    graphs = []
+    for sections in corpus:
+        graph = ResumeAnalysis()
+        graph.update_sections(sections)
+        graph.get("scores")
+        graphs.append(graph)
+    start = time.perf_counter()
+    incremental = []
+    for graph, versions in zip(graphs, sessions):
+        scores = []
+        for version in versions:
+            graph.update_sections(version)
+            scores.append(graph.get("scores"))
+        incremental.append(scores)
+    graph_time = (time.perf_counter() - start) / reruns * 1e6
+
+    print(f"{reruns} reruns, {sum(map(len, corpus[0].values()))} characters in the first resume")
+    print(f"From scratch:             {legacy:8.1f} us per rerun")
+    print(f"Cached components:        {components:8.1f} us per rerun ({legacy / components:.1f}x)")
+    print(f"ResumeAnalysis graph:     {graph_time:8.1f} us per rerun ({legacy / graph_time:.1f}x)")
+    print(f"Mismatches: {sum(a != b for a, b in zip(expected, cached))} cached, "
+          f"{sum(a != b for a, b in zip(expected, incremental))} graph")
+
+
+if __name__ == "__main__":
+    main()
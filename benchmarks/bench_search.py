@@ -0,0 +1,74 @@
+"""Benchmark the persistent resume search index against scanning every resume text.
+
+Indexes a synthetic corpus into a throwaway SQLite index, reopens it as
+a fresh process would, and times boolean, phrase and skill-alias
+queries. The baseline is a regex scan over already extracted texts, so
+it leaves out the PDF download and extraction a scan of stored files
+would also pay for.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_search [--count 2000]
+"""
+import argparse
+import os
+import re
+import statistics
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core.search import ResumeSearchIndex
+
+QUERIES = (
+    ('kubernetes', r'\bkubernetes\b'),
+    ('k8s', r'\b(?:k8s|kubernetes)\b'),
+    ('"machine learning" -java', None),
+    ('docker aws OR gcp', None),
+    ('"data pipeline"', r'\bdata pipeline\b'),
+)
+
+
+def scan(texts, pattern):
+    """Baseline: regex search through every text."""
+    compiled = re.compile(pattern, re.IGNORECASE)
+    return [position for position, text in enumerate(texts) if compiled.search(text)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=2000, help="number of stored resumes")
+    args = parser.parse_args()
+
+    texts = [resume['text'] for resume in generate_corpus(args.count, seed=29)]
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "search.sqlite3")
+        search_index = ResumeSearchIndex(path)
+        start = time.perf_counter()
+        for position, text in enumerate(texts):
+            search_index.add(f"resume_{position:05d}.pdf", text)
+        elapsed = time.perf_counter() - start
+        search_index.close()
+        print(f"Indexed {len(texts)} resumes in {elapsed:.1f}s "
+              f"({elapsed / len(texts) * 1e3:.2f} ms each, {os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+        search_index = ResumeSearchIndex(path)
+        print(f"{'query':28} {'hits':>6} {'index ms':>9} {'scan ms':>8}")
+        for query, pattern in QUERIES:
+            samples = []
+            for _ in range(5):
+                start = time.perf_counter()
+                hits = search_index.search(query)
+                samples.append(time.perf_counter() - start)
+            scan_ms = ''
+            if pattern:
+                start = time.perf_counter()
+                scanned = scan(texts, pattern)
+                scan_ms = f"{(time.perf_counter() - start) * 1e3:8.1f}"
+                assert len(scanned) == len(hits), (query, len(scanned), len(hits))
+            print(f"{query:28} {len(hits):6d} {statistics.median(samples) * 1e3:9.1f} {scan_ms:>8}")
+        search_index.close()
+
+
+if __name__ == "__main__":
+    main()
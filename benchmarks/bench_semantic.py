@@ -0,0 +1,67 @@
+"""Benchmark hashed n-gram vectors: vectorizing, pairwise cosine and batch ranking.
+
+Reports the one-off cost of vectorizing a document (NumPy and pure
+Python), the cost of a cosine between two cached vectors, and the per-pair
+cost of scoring one posting against the whole corpus with
+batch_similarity. Also prints a few paraphrase pairs with their scores.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_semantic [--count 3000]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import generate_corpus
+from resume_core import semantic
+
+PAIRS = (
+    ("Built REST services and microservices in Python", "API development and micro-service design"),
+    ("Developed data pipelines on Spark", "Develop and maintain Spark data pipeline jobs"),
+    ("Led a team of five developers", "Leadership of engineering teams"),
+    ("Managed retail store inventory", "Build distributed backend services"),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--count', type=int, default=3000, help="number of resumes")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, seed=5)
+    texts = [resume['text'] for resume in corpus]
+    summaries = [resume['sections'].get("Summary", "") for resume in corpus]
+
+    start = time.perf_counter()
+    vectors = [semantic.text_vector(text) for text in texts]
+    print(f"Vectorize (NumPy):       {(time.perf_counter() - start) / len(texts) * 1e3:8.2f} ms per resume")
+    numpy_available = semantic.NUMPY_AVAILABLE
+    semantic.NUMPY_AVAILABLE = False
+    try:
+        sample = texts[:50]
+        start = time.perf_counter()
+        for text in sample:
+            semantic._python_vector(semantic.normalize_text(text))
+        print(f"Vectorize (pure Python): {(time.perf_counter() - start) / len(sample) * 1e3:8.2f} ms per resume")
+    finally:
+        semantic.NUMPY_AVAILABLE = numpy_available
+
+    for label, documents in (("full resumes", texts), ("summaries", summaries)):
+        cached = [semantic.text_vector(text) for text in documents]
+        start = time.perf_counter()
+        for vector in cached:
+            semantic.cosine(cached[0], vector)
+        print(f"Cosine, {label:13}    {(time.perf_counter() - start) / len(cached) * 1e6:8.1f} us per pair")
+
+    start = time.perf_counter()
+    semantic.batch_similarity(vectors[0], vectors)
+    print(f"batch_similarity:        {(time.perf_counter() - start) / len(vectors) * 1e6:8.1f} us per pair "
+          f"({len(vectors)} resumes)")
+
+    print("\nParaphrase pairs")
+    for first, second in PAIRS:
+        print(f"  {semantic.text_similarity(first, second):.2f}  {first!r} / {second!r}")
+
+
+if __name__ == "__main__":
+    main()
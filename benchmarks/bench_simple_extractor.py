@@ -0,0 +1,223 @@
+"""Benchmark the single-pass extract_sections_simple against the multi-scan version it replaced.
+
+Also serves as the regression check: every document in the corpus must
+produce identical sections from both implementations. Both look skills
+up in the taxonomy index (about half the single-pass time), so the
+speedup is also reported for the line classification and assembly
+alone.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_simple_extractor
+"""
+import random
+import re
+import timeit
+
+from resume_core.parsing import extract_sections_simple
+from resume_core.skills import extract_skill_names
+
+SAMPLE_RESUMES = [
+    """Jane Doe
+jane.doe@example.com | 555-123-4567 | www.janedoe.dev
+Professional Summary
+Data scientist with 6 years of experience in machine learning and NLP.
+Passionate about deep learning and data analysis.
+
+Skills
+Python, SQL, Docker, Kubernetes, AWS, TensorFlow, communication, leadership
+
+Experience
+Senior Data Scientist, Acme Corp 2019-present
+- Built NLP pipelines in Python serving 2M requests/day
+- Led a team of 4 data scientists
+
+Data Analyst, Beta LLC 2016–2019
+- Automated reporting with SQL and statistics
+
+Education
+MS in Computer Science, State University, GPA 3.9
+BS in Mathematics, City College
+
+Projects
+Resume parser - github.com/jane/resume-parser
+Built with Flask and React
+
+Certifications
+AWS Certified Solutions Architect
+Certificate in Deep Learning, 2020
+""",
+    """JOHN SMITH
+Objective: obtain a role in software engineering
+john@smith.io
+(555) 987-6543
+Experience 2012-2015 at Gamma, java and javascript developer
+worked on node and express services
+2015-2020 lead engineer, agile scrum teams
+Projects: portfolio site, django blog
+certification: scrum master
+reference available on request
+""",
+    """Alex Kim
+Profile
+About me: I love teamwork and problem solving.
+No dates here, just prose about a career in mongodb and postgresql.
+""",
+    """Edge Cases
+maintain email ai-driven node.js vue3 machine  learning data-science ms-office
+2019-20201 x2019-2020 20192020 1999—current 2019-presently
+Project reference: certification of skills
+certified in mongodb; education: bsc
+""",
+    "",
+    "single line resume with python",
+]
+
+
+def legacy_extract_sections_simple(resume_text):
+    """The multi-scan extract_sections_simple this module replaced, kept as the reference."""
+    # Basic extraction based on line breaks and capitalization patterns
+    sections = {}
+    lines = resume_text.split('\n')
+    
+    # Try to identify contact info (usually at the top)
+    contact_lines = []
+    for i, line in enumerate(lines[:10]):  # Check first 10 lines
+        if re.search(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', line) or re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', line):
+            contact_lines.append(line)
+    
+    # Add name (usually the first line)
+    if lines and lines[0].strip() and not re.search(r'@|www|\d{3}[-.]?\d{3}[-.]?\d{4}', lines[0]):
+        contact_lines.insert(0, lines[0].strip())
+            
+    if contact_lines:
+        sections["Personal Information"] = "\n".join(contact_lines)
+    
+    # Skills come from the shared taxonomy index in both implementations
+    skills = extract_skill_names(resume_text)
+    
+    if skills:
+        sections["Skills"] = ", ".join(sorted(skills))
+    
+    # Try to identify education (look for degree keywords)
+    education_lines = []
+    for i, line in enumerate(lines):
+        if re.search(r'\b(degree|bachelor|master|phd|mba|bsc|msc|ba|bs|ms|university|college|school|gpa)\b', line.lower()):
+            education_lines.append(line)
+    
+    if education_lines:
+        sections["Education"] = "\n".join(education_lines)
+    
+    # Try to identify experience (look for date patterns)
+    experience_lines = []
+    for i, line in enumerate(lines):
+        if re.search(r'\b(20\d\d|19\d\d)[-–—]?(20\d\d|19\d\d|present|current)\b', line.lower()):
+            # Include this line and the next few lines as they likely describe the role
+            experience_lines.append(line)
+            for j in range(1, 5):  # Include up to 5 lines after a date pattern
+                if i+j < len(lines) and lines[i+j].strip():
+                    experience_lines.append(lines[i+j])
+    
+    if experience_lines:
+        sections["Experience"] = "\n".join(experience_lines)
+    
+    # Try to identify projects (look for project keywords)
+    project_lines = []
+    in_project_section = False
+    for i, line in enumerate(lines):
+        if re.search(r'\b(project|projects|portfolio|github)\b', line.lower()):
+            in_project_section = True
+            project_lines.append(line)
+        elif in_project_section and line.strip():
+            project_lines.append(line)
+            # End project section if we hit another major section
+            if re.search(r'\b(education|experience|skills|certification|reference)\b', line.lower()):
+                in_project_section = False
+    
+    if project_lines:
+        sections["Projects"] = "\n".join(project_lines)
+    
+    # Try to identify certifications
+    cert_lines = []
+    in_cert_section = False
+    for i, line in enumerate(lines):
+        if re.search(r'\b(certification|certificate|certified|credential)\b', line.lower()):
+            in_cert_section = True
+            cert_lines.append(line)
+        elif in_cert_section and line.strip():
+            cert_lines.append(line)
+            # End certification section if we hit another major section
+            if re.search(r'\b(education|experience|skills|project|reference)\b', line.lower()):
+                in_cert_section = False
+    
+    if cert_lines:
+        sections["Certifications"] = "\n".join(cert_lines)
+    
+    # Try to identify summary/objective (usually near the top, after contact info)
+    summary_lines = []
+    for i, line in enumerate(lines[1:15]):  # Check lines 1-15
+        if re.search(r'\b(summary|objective|profile|about me)\b', line.lower()):
+            summary_lines.append(line)
+            # Include the next few lines as they likely contain the summary
+            for j in range(1, 5):
+                if i+j < len(lines) and lines[i+j].strip():
+                    summary_lines.append(lines[i+j])
+    
+    if summary_lines:
+        sections["Summary"] = "\n".join(summary_lines)
+    
+    # If we still don't have much, just split the text into chunks
+    if len(sections) <= 2:
+        chunk_size = max(5, len(lines) // 5)  # Divide into roughly 5 sections
+        for i in range(0, len(lines), chunk_size):
+            section_name = f"Section {i//chunk_size + 1}"
+            sections[section_name] = "\n".join(lines[i:i+chunk_size])
+    
+    # Add empty strings for important missing sections
+    important_sections = [
+        "Personal Information", "Summary", "Skills", "Experience", 
+        "Education", "Projects", "Certifications"
+    ]
+    
+    for section in important_sections:
+        if section not in sections:
+            sections[section] = ""
+    
+    return sections
+
+
+def build_corpus(seed=7, variants=40):
+    """Handwritten samples plus seeded line-shuffled and truncated variants."""
+    rng = random.Random(seed)
+    corpus = list(SAMPLE_RESUMES)
+    for _ in range(variants):
+        lines = rng.choice(SAMPLE_RESUMES).split('\n')
+        rng.shuffle(lines)
+        corpus.append('\n'.join(lines[:rng.randint(1, len(lines))]))
+    return corpus
+
+
+def main():
+    corpus = build_corpus()
+
+    mismatches = [text for text in corpus
+                  if legacy_extract_sections_simple(text) != extract_sections_simple(text)]
+    print(f"Regression check: {len(corpus)} documents, {len(mismatches)} mismatches")
+    for text in mismatches[:3]:
+        print("---")
+        print(text[:200])
+
+    repeat = 20
+    legacy = timeit.timeit(lambda: [legacy_extract_sections_simple(t) for t in corpus], number=repeat)
+    single = timeit.timeit(lambda: [extract_sections_simple(t) for t in corpus], number=repeat)
+    per_doc = repeat * len(corpus)
+    skills = timeit.timeit(lambda: [extract_skill_names(t) for t in corpus], number=repeat)
+    print(f"Multi-scan extractor:  {legacy / per_doc * 1e6:9.1f} us/resume")
+    print(f"Single-pass extractor: {single / per_doc * 1e6:9.1f} us/resume")
+    print(f"  shared skill pass:   {skills / per_doc * 1e6:9.1f} us/resume")
+    print(f"Speedup:               {legacy / single:9.1f}x")
+    print(f"  without skill pass:  {(legacy - skills) / (single - skills):9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
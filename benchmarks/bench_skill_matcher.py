@@ -0,0 +1,162 @@
+"""Benchmark skill extraction through the taxonomy index against the per-skill regex loop.
+
+Reports recall against the synthetic corpus ground truth, extraction
+speed, checks the per-skill counts from count_skills against a regex
+count of each found skill's name, and shows how matching time, index size and open time behave as the
+taxonomy grows to tens of thousands of skills.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_skill_matcher
+"""
+import csv
+import os
+import random
+import re
+import tempfile
+import time
+import timeit
+
+from benchmarks.corpus import generate_corpus
+from resume_core.skills import count_skills, extract_enhanced_skills
+from resume_core.taxonomy import DEFAULT_TAXONOMY_PATH, SkillIndex, compile_index, load_taxonomy
+
+# The hard-coded vocabulary extract_enhanced_skills used before the taxonomy
+LEGACY_TECH_SKILLS = (
+    'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
+    'html', 'css', 'sql', 'nosql', 'mongodb', 'mysql', 'postgresql', 'oracle',
+    'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'asp.net',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'cloud', 'devops', 'ci/cd',
+    'git', 'github', 'gitlab', 'bitbucket', 'jira', 'agile', 'scrum', 'kanban',
+    'machine learning', 'ai', 'data science', 'big data', 'hadoop', 'spark',
+    'tensorflow', 'pytorch', 'nlp', 'computer vision', 'deep learning',
+    'react native', 'flutter', 'mobile development', 'ios', 'android',
+    'web development', 'frontend', 'backend', 'full-stack', 'ui/ux',
+    'restful api', 'graphql', 'microservices', 'serverless', 'linux',
+    'windows', 'macos', 'bash', 'shell scripting', 'powershell',
+    'blockchain', 'ethereum', 'solidity', 'smart contracts',
+    'cybersecurity', 'penetration testing', 'network security',
+    'data analysis', 'data visualization', 'tableau', 'power bi',
+    'excel', 'vba', 'sap', 'erp', 'crm', 'salesforce'
+)
+LEGACY_SOFT_SKILLS = (
+    'communication', 'teamwork', 'leadership', 'problem-solving', 'critical thinking',
+    'time management', 'organization', 'creativity', 'adaptability', 'flexibility',
+    'project management', 'attention to detail', 'analytical', 'interpersonal',
+    'presentation', 'negotiation', 'conflict resolution', 'decision making',
+    'customer service', 'mentoring', 'coaching', 'collaboration', 'multitasking',
+    'strategic thinking', 'innovation', 'emotional intelligence', 'public speaking',
+    'research', 'writing', 'editing', 'design thinking', 'user research',
+    'stakeholder management', 'client relations', 'sales', 'marketing',
+    'budgeting', 'financial planning', 'resource allocation', 'risk management',
+    'quality assurance', 'continuous improvement', 'people management',
+    'cross-functional collaboration', 'international experience', 'cultural awareness'
+)
+
+
+def legacy_extract_enhanced_skills(text):
+    """The old extractor: one regex search per skill, then a bullet scan."""
+    if not text:
+        return []
+    all_skills = list(LEGACY_TECH_SKILLS + LEGACY_SOFT_SKILLS)
+    found_skills = []
+    text_lower = text.lower()
+    for skill in all_skills:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text_lower):
+            found_skills.append(skill.title())
+    for line in text_lower.split('\n'):
+        if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*'):
+            parts = [p.strip() for p in line.split(',')]
+            for part in parts:
+                part = re.sub(r'[•\-*]', '', part).strip()
+                if part in [s.lower() for s in all_skills]:
+                    found_skills.append(part.title())
+    return list(set(found_skills))
+
+
+def recall(extractor, corpus):
+    """Share of ground-truth skills the extractor finds."""
+    hits = total = 0
+    for resume in corpus:
+        found = {skill.lower() for skill in extractor(resume['text'])}
+        truth = {skill.lower() for skill in resume['skills']}
+        hits += len(found & truth)
+        total += len(truth)
+    return hits / total if total else 0.0
+
+
+def count_mismatches(corpus):
+    """Skills whose count_skills count differs from a whole-word regex count of their canonical name.
+
+    Only skills written under their canonical name are comparable: a regex
+    cannot know that "k8s" counts as Kubernetes.
+    """
+    mismatches = compared = 0
+    for resume in corpus:
+        text_lower = resume['text'].lower()
+        for skill, count in count_skills(resume['text']).items():
+            pattern = r'(?<![\w.+#])' + re.escape(skill.lower()) + r'(?![\w+#]|\.\w)'
+            expected = len(re.findall(pattern, text_lower))
+            if expected:
+                compared += 1
+                mismatches += expected != count
+    return mismatches, compared
+
+
+def write_synthetic_taxonomy(path, extra, seed=3):
+    """The shipped taxonomy plus ``extra`` random skill-like entries with aliases."""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+
+    def phrase():
+        return ' '.join(''.join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+                        for _ in range(rng.randint(1, 3)))
+
+    with open(path, 'w', newline='', encoding='utf-8') as taxonomy_file:
+        writer = csv.writer(taxonomy_file)
+        writer.writerow(['skill', 'category', 'aliases'])
+        for skill, category, aliases in load_taxonomy(DEFAULT_TAXONOMY_PATH):
+            writer.writerow([skill, category, '|'.join(aliases)])
+        for index in range(extra):
+            writer.writerow([phrase(), f"Synthetic {index % 50}", '|'.join(phrase() for _ in range(rng.randint(0, 2)))])
+
+
+def main():
+    corpus = generate_corpus(200, seed=5)
+    texts = [resume['text'] for resume in corpus]
+
+    print(f"Recall on {len(corpus)} synthetic resumes")
+    print(f"  Regex per skill:  {recall(legacy_extract_enhanced_skills, corpus):.1%}")
+    print(f"  Taxonomy index:   {recall(extract_enhanced_skills, corpus):.1%}")
+
+    repeat = 3
+    legacy = timeit.timeit(lambda: [legacy_extract_enhanced_skills(t) for t in texts], number=repeat)
+    indexed = timeit.timeit(lambda: [extract_enhanced_skills(t) for t in texts], number=repeat)
+    per_text = repeat * len(texts)
+    print(f"Regex per skill:   {legacy / per_text * 1e6:9.1f} us/text")
+    print(f"Taxonomy index:    {indexed / per_text * 1e6:9.1f} us/text")
+    print(f"Speedup:           {legacy / indexed:9.1f}x")
+    mismatches, compared = count_mismatches(corpus)
+    print(f"Per-skill counts:  {mismatches} of {compared} differ from a regex count")
+
+    print("\nTaxonomy size scaling")
+    print(f"{'skills':>8} {'index KB':>9} {'open ms':>8} {'us/text':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for extra in (0, 1000, 10000, 50000):
+            taxonomy_path = os.path.join(workdir, f"skills_{extra}.csv")
+            index_path = os.path.join(workdir, f"skills_{extra}.idx")
+            write_synthetic_taxonomy(taxonomy_path, extra)
+            compile_index(taxonomy_path, index_path)
+
+            start = time.perf_counter()
+            index = SkillIndex(index_path)
+            open_ms = (time.perf_counter() - start) * 1e3
+            seconds = timeit.timeit(lambda: [index.find_all(t) for t in texts], number=1)
+            print(f"{index.skill_count:8d} {os.path.getsize(index_path) / 1024:9.0f} {open_ms:8.2f} "
+                  f"{seconds / len(texts) * 1e6:8.1f}")
+            index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark local job tailoring and single-pass skill highlighting.
+
+The old enhance_resume_for_job highlighted each job skill with three
+chained str.replace calls (as written, lower and upper case), rescanning
+the Experience text three times per skill. highlight_skills finds the
+mentions with the taxonomy index and substitutes them in one regex pass,
+so its cost is flat in the number of skills (the index scan dominates).
+The chained loop is cheaper below a few dozen skills and grows linearly;
+the one-pass version is there for its output (escaped HTML, aliases,
+whole tokens only), not its speed.
+Also times the whole tailor_resume call (summary, skills and bullet
+reordering) over a synthetic corpus.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tailoring
+"""
+import random
+import timeit
+
+from benchmarks.corpus import generate_corpus
+from resume_core.skills import canonical_skills, extract_skill_names
+from resume_core.tailoring import highlight_skills, tailor_resume
+from resume_core.taxonomy import get_skill_index
+
+SKILL_COUNTS = (5, 25, 100)
+
+
+def legacy_highlight(experience, job_skills):
+    """The old chained-replace highlighting loop."""
+    for skill in job_skills:
+        if skill.lower() in experience.lower():
+            experience = experience.replace(
+                skill, f"<strong>{skill}</strong>"
+            ).replace(
+                skill.lower(), f"<strong>{skill.lower()}</strong>"
+            ).replace(
+                skill.upper(), f"<strong>{skill.upper()}</strong>"
+            )
+    return experience
+
+
+def main():
+    corpus = generate_corpus(200, seed=17)
+    experiences = [resume['sections'].get("Experience", "") for resume in corpus]
+    index = get_skill_index()
+    names = [index.name(skill_id) for skill_id in range(index.skill_count)]
+    rng = random.Random(3)
+
+    print(f"{'job skills':>10} {'chained us':>11} {'one-pass us':>12} {'speedup':>8}")
+    for count in SKILL_COUNTS:
+        # Half the job's skills come from the resumes, so there is something to highlight
+        common = sorted({name for text in experiences[:20] for name in extract_skill_names(text)})
+        job_skills = rng.sample(common, min(count // 2, len(common))) + rng.sample(names, count - count // 2)
+        job_ids = frozenset(canonical_skills(", ".join(job_skills)))
+        legacy = timeit.timeit(lambda: [legacy_highlight(text, job_skills) for text in experiences], number=3)
+        one_pass = timeit.timeit(lambda: [highlight_skills(text, job_ids) for text in experiences], number=3)
+        per_text = 3 * len(experiences)
+        print(f"{count:10d} {legacy / per_text * 1e6:11.1f} {one_pass / per_text * 1e6:12.1f} "
+              f"{legacy / one_pass:7.1f}x")
+
+    job = ("Backend engineer. 5+ years of experience with Python and SQL. Docker, Kubernetes, AWS. "
+           "Build REST APIs and microservices; mentor the team. Bachelor's degree.")
+    elapsed = timeit.timeit(lambda: [tailor_resume(resume['sections'], job) for resume in corpus], number=1)
+    print(f"\ntailor_resume: {elapsed / len(corpus) * 1e3:.2f} ms per resume")
+
+
+if __name__ == "__main__":
+    main()
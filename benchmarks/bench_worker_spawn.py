@@ -0,0 +1,91 @@
+"""Check that worker processes never re-run the app script, and time pool start-up.
+
+Streamlit runs Resume_Enshancer.py as ``__main__``, and a plain ``spawn``
+child re-imports the parent's main script before it runs a task. This
+writes a stand-in app script that logs every execution, runs it as a
+script (as Streamlit does), and has it start a process pool and a
+manager with the plain spawn context and with the
+ScriptFreeSpawnContext used by WorkerService. It reports how often the
+script ran and how long the first results took, and fails if a worker
+started by the service's context ran the script.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_worker_spawn [--workers 2]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The stand-in app: logs each execution, then (as the parent only) starts workers
+APP_SCRIPT = '''
+import os
+import sys
+import time
+
+with open(os.environ["APP_RUN_LOG"], "a") as log:
+    log.write(f"{__name__} {os.getpid()}\\n")
+time.sleep(0.2)  # stands in for the app's imports and top-level UI code
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.environ["REPOSITORY_ROOT"])
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from resume_core import workers
+
+    workers_count = int(sys.argv[2])
+    if sys.argv[1] == "spawn":
+        context = multiprocessing.get_context("spawn")
+    else:
+        context = workers.ScriptFreeSpawnContext()
+    start = time.perf_counter()
+    manager = context.Manager()
+    with ProcessPoolExecutor(max_workers=workers_count, mp_context=context) as pool:
+        list(pool.map(workers.parsing.parse_sections_by_headers, ["SKILLS\\nPython"] * workers_count * 4))
+    manager.shutdown()
+    print(f"{(time.perf_counter() - start) * 1e3:.0f}")
+'''
+
+
+def run_app(script_path, context_name, workers_count):
+    """(script executions, milliseconds to start the pool and manager and get results)."""
+    with tempfile.NamedTemporaryFile('r', suffix='.log', delete=False) as log:
+        log_path = log.name
+    try:
+        environment = dict(os.environ, APP_RUN_LOG=log_path, REPOSITORY_ROOT=REPOSITORY_ROOT)
+        output = subprocess.run([sys.executable, script_path, context_name, str(workers_count)],
+                                env=environment, capture_output=True, text=True, check=True).stdout
+        with open(log_path) as log:
+            runs = log.read().splitlines()
+    finally:
+        os.remove(log_path)
+    return len(runs), float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--workers', type=int, default=2, help="pool size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        script_path = os.path.join(directory, "app.py")
+        with open(script_path, 'w') as script:
+            script.write(APP_SCRIPT)
+        print(f"Pool of {args.workers} plus a manager, started from a script run as __main__")
+        print(f"{'context':22} {'script runs':>11} {'start-up ms':>12}")
+        results = {}
+        for context_name in ("spawn", "script-free"):
+            results[context_name] = run_app(script_path, context_name, args.workers)
+            runs, elapsed = results[context_name]
+            print(f"{context_name:22} {runs:11d} {elapsed:12.0f}")
+
+    assert results["script-free"][0] == 1, "a worker re-ran the app script"
+    print("Workers never ran the app script.")
+
+
+if __name__ == "__main__":
+    main()
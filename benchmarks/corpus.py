@@ -0,0 +1,277 @@
+"""Seeded synthetic resume corpus with ground-truth sections.
+
+Each generated resume is a dict:
+
+    {'text': ..., 'sections': {canonical section: content}, 'skills': set of
+     skill names placed in the text, 'layout': {...}}
+
+Layouts vary the header style (title case, all caps, trailing colon,
+alias, numbered, inline "SKILLS: Python, SQL"), the bullet character,
+single vs two-column text (as pypdf extracts it: both columns interleaved
+on one line) and length (long CVs with many roles). The same seed always
+produces the same corpus, so parser changes can be compared run to run.
+
+regression_corpus() adds hand-written resumes, in the same shape, for
+layouts a parser change once got wrong.
+"""
+import random
+
+from resume_core.parsing import SECTION_HEADER_ALIASES, SECTION_HEADER_LOOKUP
+
+HEADER_STYLES = ("title", "upper", "colon", "alias", "numbered", "inline")
+BULLET_STYLES = ("- ", "• ", "* ", "")
+COLUMN_GAP = "     "
+
+FIRST_NAMES = ("Jane", "John", "Priya", "Wei", "Carlos", "Amara", "Liam", "Sofia", "Kenji", "Fatima",
+               "Noah", "Elena", "Omar", "Hannah", "Ravi", "Grace")
+LAST_NAMES = ("Doe", "Smith", "Patel", "Chen", "Garcia", "Okafor", "Murphy", "Rossi", "Tanaka", "Khan",
+              "Johnson", "Novak", "Haddad", "Becker", "Iyer", "Kim")
+COMPANIES = ("Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Enterprises",
+             "Hooli", "Pied Piper", "Vandelay Industries", "Soylent Systems", "Cyberdyne", "Tyrell Analytics")
+TITLES = ("Software Engineer", "Senior Software Engineer", "Data Scientist", "Machine Learning Engineer",
+          "Backend Developer", "Frontend Developer", "DevOps Engineer", "Data Analyst", "Engineering Manager",
+          "Product Analyst", "Research Scientist", "Site Reliability Engineer")
+UNIVERSITIES = ("State University", "University of Technology", "City College", "Institute of Science",
+                "Northern University", "Polytechnic Institute")
+DEGREES = ("BS in Computer Science", "MS in Computer Science", "BSc in Mathematics", "MBA",
+           "PhD in Machine Learning", "BA in Economics", "MSc in Data Science")
+TECH_SKILLS = ("Python", "Java", "JavaScript", "SQL", "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "AWS",
+               "Azure", "GCP", "React", "Django", "Flask", "TensorFlow", "PyTorch", "Spark", "Hadoop",
+               "GraphQL", "Linux", "Git", "Tableau", "Machine Learning", "Deep Learning", "NLP",
+               "Computer Vision", "Data Analysis", "Microservices")
+SOFT_SKILLS = ("Communication", "Leadership", "Teamwork", "Mentoring", "Collaboration", "Public Speaking",
+               "Project Management", "Stakeholder Management", "Critical Thinking", "Time Management")
+VERBS = ("Built", "Designed", "Led", "Implemented", "Automated", "Migrated", "Optimized", "Launched",
+         "Scaled", "Refactored")
+OBJECTS = ("a data pipeline", "the billing service", "an internal dashboard", "a recommendation engine",
+           "the CI/CD workflow", "a search API", "the mobile backend", "a fraud detection model",
+           "the reporting stack", "a feature store")
+OUTCOMES = ("cutting latency by {n}%", "serving {n}M requests per day", "saving ${n}K per year",
+            "reducing incidents by {n}%", "for {n} internal teams", "improving accuracy by {n}%")
+SUMMARY_OPENERS = ("Results-driven {title} with {years} years of experience",
+                   "{title} with {years}+ years building production systems",
+                   "Curious {title} with {years} years of hands-on work")
+SUMMARY_CLOSERS = ("focused on reliable, well-tested software.", "who enjoys turning data into decisions.",
+                   "with a track record of shipping on time.", "and a passion for mentoring engineers.")
+PROJECT_NAMES = ("Resume Parser", "Budget Tracker", "Chess Engine", "Weather Dashboard", "Recipe Finder",
+                 "Trail Mapper", "Stock Screener", "Chat Bot")
+CERTIFICATIONS = ("AWS Certified Solutions Architect", "Certified Kubernetes Administrator",
+                  "Google Professional Data Engineer", "Certified Scrum Master", "Azure Fundamentals")
+LANGUAGES = ("English (native)", "Spanish (fluent)", "German (intermediate)", "Hindi (native)",
+             "Mandarin (conversational)", "French (basic)")
+PUBLICATION_VENUES = ("NeurIPS", "ICML", "KDD", "ACL", "VLDB")
+
+# Sections that go in the sidebar of a two-column layout
+SIDEBAR_SECTIONS = ("Skills", "Education", "Certifications", "Languages")
+
+
+def header_aliases():
+    """Canonical section -> header aliases that resolve back to that section."""
+    return {section: tuple(alias for alias in names if SECTION_HEADER_LOOKUP[alias] == section)
+            for section, names in SECTION_HEADER_ALIASES}
+
+
+HEADER_ALIASES = header_aliases()
+
+
+def format_header(section, style, index, rng):
+    """Render a section header in the given style."""
+    if style == "alias":
+        return rng.choice(HEADER_ALIASES[section]).title()
+    if style == "upper":
+        return section.upper()
+    if style == "colon":
+        return section + ":"
+    if style == "numbered":
+        return f"{index}. {section.upper()}"
+    if style == "inline":
+        return section.upper() + ":"
+    return section
+
+
+def _bullet(style, text):
+    return f"{style}{text}"
+
+
+def _sentence(rng, skills):
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(2, 90))
+    line = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {outcome}"
+    if rng.random() < 0.6:
+        skill = rng.choice(TECH_SKILLS)
+        skills.add(skill)
+        line += f" using {skill}"
+    return line
+
+
+def _date_range(rng, end_year, current=False):
+    start_year = end_year - rng.randint(1, 4)
+    style = rng.randrange(4)
+    if style == 0:
+        start, end = str(start_year), str(end_year)
+        separator = "-"
+    elif style == 1:
+        start, end = f"Jan {start_year}", f"Mar {end_year}"
+        separator = " – "
+    elif style == 2:
+        start, end = f"{rng.randint(1, 12):02d}/{start_year}", f"{rng.randint(1, 12):02d}/{end_year}"
+        separator = " to "
+    else:
+        start, end = str(start_year), str(end_year)
+        separator = " – "
+    return f"{start}{separator}{'Present' if current else end}", start_year
+
+
+def _section_bodies(rng, long_cv, bullet, skills):
+    """Ground-truth content lines per canonical section."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    bodies = {}
+    bodies["Contact Information"] = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | {rng.randint(200, 999)}-{rng.randint(200, 999)}-"
+        f"{rng.randint(1000, 9999)}",
+    ]
+    if rng.random() < 0.5:
+        bodies["Contact Information"].append(f"linkedin.com/in/{first.lower()}{last.lower()}")
+
+    title = rng.choice(TITLES)
+    years = rng.randint(2, 20)
+    bodies["Summary"] = [
+        rng.choice(SUMMARY_OPENERS).format(title=title, years=years) + " " + rng.choice(SUMMARY_CLOSERS)
+    ]
+
+    tech = rng.sample(TECH_SKILLS, rng.randint(5, 12))
+    soft = rng.sample(SOFT_SKILLS, rng.randint(1, 4))
+    skills.update(tech)
+    skills.update(soft)
+    bodies["Skills"] = [", ".join(tech), ", ".join(soft)] if rng.random() < 0.5 else [", ".join(tech + soft)]
+
+    roles = rng.randint(8, 15) if long_cv else rng.randint(2, 4)
+    end_year = 2024
+    experience = []
+    for role in range(roles):
+        dates, start_year = _date_range(rng, end_year, current=role == 0 and rng.random() < 0.5)
+        experience.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} {dates}")
+        for _ in range(rng.randint(2, 6 if long_cv else 4)):
+            experience.append(_bullet(bullet, _sentence(rng, skills)))
+        end_year = start_year
+    bodies["Experience"] = experience
+
+    bodies["Education"] = [
+        f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)}, {end_year - rng.randint(0, 4)}"
+        for _ in range(rng.randint(1, 2))
+    ]
+
+    if long_cv or rng.random() < 0.6:
+        projects = []
+        for name in rng.sample(PROJECT_NAMES, rng.randint(1, 4 if long_cv else 2)):
+            skill = rng.choice(TECH_SKILLS)
+            skills.add(skill)
+            projects.append(f"{name} - github.com/{first.lower()}/{name.lower().replace(' ', '-')}")
+            projects.append(_bullet(bullet, f"Written in {skill}, {rng.randint(10, 900)} stars"))
+        bodies["Projects"] = projects
+    if rng.random() < 0.5:
+        bodies["Certifications"] = rng.sample(CERTIFICATIONS, rng.randint(1, 3))
+    if long_cv or rng.random() < 0.3:
+        bodies["Languages"] = rng.sample(LANGUAGES, rng.randint(1, 3))
+    if long_cv:
+        bodies["Publications"] = [
+            f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} at scale, {rng.choice(PUBLICATION_VENUES)} {year}"
+            for year in rng.sample(range(2010, 2024), rng.randint(2, 6))
+        ]
+    return bodies
+
+
+def _section_block(section, lines, style, index, rng):
+    """Header plus content lines for one section."""
+    header = format_header(section, style, index, rng)
+    if style == "inline" and len(lines) == 1:
+        return [f"{header} {lines[0]}"]
+    return [header] + lines
+
+
+def _interleave_columns(left, right):
+    """Merge two columns line by line the way pypdf extracts a two-column page."""
+    merged = []
+    for row in range(max(len(left), len(right))):
+        left_line = left[row] if row < len(left) else ""
+        right_line = right[row] if row < len(right) else ""
+        merged.append(f"{left_line}{COLUMN_GAP}{right_line}".strip())
+    return merged
+
+
+def generate_resume(rng):
+    """Generate one resume with its ground truth from a random.Random instance."""
+    layout = {
+        'header_style': rng.choice(HEADER_STYLES),
+        'bullet': rng.choice(BULLET_STYLES),
+        'columns': 2 if rng.random() < 0.2 else 1,
+        'long': rng.random() < 0.15,
+    }
+    skills = set()
+    bodies = _section_bodies(rng, layout['long'], layout['bullet'], skills)
+
+    # Contact lines come first without a header, like almost every real resume
+    contact = bodies["Contact Information"]
+    blocks = {}
+    for index, (section, lines) in enumerate(
+            ((name, lines) for name, lines in bodies.items() if name != "Contact Information"), 1):
+        blocks[section] = _section_block(section, lines, layout['header_style'], index, rng)
+
+    if layout['columns'] == 2:
+        left = [line for section in SIDEBAR_SECTIONS if section in blocks for line in blocks[section] + [""]]
+        right = [line for section, block in blocks.items() if section not in SIDEBAR_SECTIONS
+                 for line in block + [""]]
+        body_lines = _interleave_columns(left, right)
+    else:
+        body_lines = []
+        for block in blocks.values():
+            body_lines.extend(block)
+            if rng.random() < 0.7:
+                body_lines.append("")
+
+    return {
+        'text': "\n".join(contact + [""] + body_lines),
+        'sections': {section: "\n".join(lines) for section, lines in bodies.items()},
+        'skills': skills,
+        'layout': layout,
+    }
+
+
+def generate_corpus(count=200, seed=13):
+    """Generate ``count`` resumes; the same seed always yields the same corpus."""
+    rng = random.Random(seed)
+    return [generate_resume(rng) for _ in range(count)]
+
+
+# Hand-written resumes that once broke a parser, with their ground truth
+REGRESSION_RESUMES = (
+    # Field labels inside sections ("Languages:", "Activities:") that are also header aliases
+    ("labelled-fields", {
+        "Contact Information": "Jane Doe\njane.doe@example.com | (555) 123-4567",
+        "Summary": "Backend engineer with eight years of experience building payment systems.",
+        "Skills": "Languages: Python, Go\nFrameworks: Django, React\nTools: Docker, Git",
+        "Experience": ("Senior Software Engineer, Acme Corp, 2019 - Present\n"
+                       "- Built the billing service serving 2M requests per day\n"
+                       "Activities: led the hiring committee\n"
+                       "- Mentored four junior engineers\n"
+                       "Software Engineer, Globex, 2015 - 2019\n"
+                       "- Migrated the reporting pipeline to Kafka"),
+        "Education": "BS in Computer Science, State University, 2015",
+    }),
+)
+
+
+def regression_corpus():
+    """The hand-written regression resumes, shaped like generate_corpus() entries."""
+    corpus = []
+    for name, sections in REGRESSION_RESUMES:
+        text = "\n".join([sections["Contact Information"], ""]
+                         + [line for section, content in sections.items() if section != "Contact Information"
+                            for line in [section.upper()] + content.split("\n") + [""]])
+        corpus.append({
+            'text': text,
+            'sections': dict(sections),
+            'skills': set(),
+            'layout': {'header_style': "regression", 'bullet': "- ", 'columns': 1, 'long': False, 'name': name},
+        })
+    return corpus
@@ -0,0 +1 @@
+"""Streamlit-free resume processing code shared by the app and its worker processes."""
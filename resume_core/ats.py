@@ -0,0 +1,274 @@
+"""Local, rubric-based ATS format analysis of a resume PDF.
+
+Applicant tracking systems read the PDF's text layer, not the rendered
+page, so the checks below look at the PDF structure with pypdf:
+
+- text layer: image-filled pages with (almost) no extractable text, e.g.
+  scans, or no text in the whole document
+- images as text: large images on pages whose text layer is thin
+- multi-column layout: rows of text that start in two separate columns
+- tables: ruled grids or side-by-side cell rectangles in the drawing ops
+- fonts: Type 3 fonts, composite fonts without a ToUnicode map, icon or
+  symbol fonts, non-embedded non-standard fonts, many font families
+- contact info: email/phone missing, or only in the header/footer band
+- text quality: garbled characters and run-together words in the
+  extracted text, and how confidently it parses into resume sections.
+  An uploaded PDF has no source to compare against, so this reads the
+  extracted text on its own; it is not a round trip against the
+  original sections.
+
+Every check reports whether it passed, a human-readable detail and the
+points it cost; ``ats_score`` is 100 minus the penalties.
+"""
+import io
+import re
+
+import pypdf
+from pypdf.generic import ContentStream
+
+from resume_core.parsing import EMAIL_PATTERN, PHONE_PATTERN, parse_sections_with_confidence
+
+# Maximum penalty of each check
+CHECK_WEIGHTS = {
+    'text_layer': 40,
+    'images_as_text': 15,
+    'multi_column': 15,
+    'tables': 10,
+    'fonts': 10,
+    'contact_info': 10,
+    'text_quality': 20,
+}
+CHECK_LABELS = {
+    'text_layer': "Selectable text layer",
+    'images_as_text': "No text inside images",
+    'multi_column': "Single-column layout",
+    'tables': "No tables",
+    'fonts': "Standard, extractable fonts",
+    'contact_info': "Contact info in the page body",
+    'text_quality': "Clean, parseable text layer",
+}
+MIN_PAGE_TEXT = 50  # characters below which a page has no usable text layer
+THIN_PAGE_TEXT = 500  # characters below which a page with a large image is suspicious
+LARGE_IMAGE_PIXELS = 200_000  # bigger than a headshot or an icon
+HEADER_BAND = 0.06  # share of the page height treated as header or footer
+ROW_TOLERANCE = 3.0  # points within which text runs share a row
+COLUMN_BIN = 10.0  # points; second-column starts are binned to this width
+MIN_COLUMN_ROWS = 6
+MIN_COLUMN_TEXT = 20  # average characters of a column's runs; right-aligned dates are shorter
+MIN_GRID_LINES = 3
+MAX_FONT_FAMILIES = 4
+STANDARD_FONT_FAMILIES = ('helvetica', 'times', 'courier', 'symbol', 'zapfdingbats', 'arial', 'calibri',
+                          'cambria', 'georgia', 'garamond', 'verdana', 'tahoma')
+ICON_FONT_PATTERN = re.compile(r'awesome|icon|wingding|dingbat|symbol', re.IGNORECASE)
+GARBLED_PATTERN = re.compile(r'[\ufffd\ue000-\uf8ff\x00-\x08\x0b\x0c\x0e-\x1f]|\(cid:\d+\)')
+LONG_TOKEN_LENGTH = 30
+
+
+def _check(name, passed, penalty, detail):
+    return {'check': name, 'label': CHECK_LABELS[name], 'passed': passed,
+            'penalty': round(penalty, 1), 'detail': detail}
+
+
+def _page_text(page):
+    """(text, [(x, y, run text)]) of a page, positions in page space from the page's lower-left corner."""
+    left, bottom = float(page.mediabox.left), float(page.mediabox.bottom)
+    runs = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4] - left
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5] - bottom
+            runs.append((x, y, text.strip()))
+
+    return page.extract_text(visitor_text=visit) or "", runs
+
+
+def _large_images(page):
+    """Image XObjects on a page bigger than LARGE_IMAGE_PIXELS."""
+    resources = page.get('/Resources')
+    xobjects = resources.get_object().get('/XObject') if resources else None
+    if not xobjects:
+        return 0
+    count = 0
+    for xobject in xobjects.get_object().values():
+        xobject = xobject.get_object()
+        if xobject.get('/Subtype') == '/Image' and \
+                int(xobject.get('/Width', 0)) * int(xobject.get('/Height', 0)) >= LARGE_IMAGE_PIXELS:
+            count += 1
+    return count
+
+
+def _second_column_rows(runs, width):
+    """Rows whose text starts again in a second column, grouped by that column's binned x."""
+    rows = {}
+    for x, y, text in runs:
+        rows.setdefault(round(y / ROW_TOLERANCE), []).append((x, text))
+    columns = {}
+    for row in rows.values():
+        row.sort()
+        first_x = row[0][0]
+        for x, text in row[1:]:
+            if x - first_x > 0.2 * width:
+                columns.setdefault(round(x / COLUMN_BIN), []).append(text)
+                break
+    return columns
+
+
+def _drawing_shapes(page, reader):
+    """(vertical lines, horizontal lines, rectangles) drawn on a page."""
+    contents = page.get_contents()
+    if contents is None:
+        return 0, 0, []
+    vertical = horizontal = 0
+    rectangles = []
+    current = None
+    for operands, operator in ContentStream(contents, reader).operations:
+        if operator == b'm' and len(operands) == 2:
+            current = (float(operands[0]), float(operands[1]))
+        elif operator == b'l' and len(operands) == 2 and current is not None:
+            end = (float(operands[0]), float(operands[1]))
+            dx, dy = abs(end[0] - current[0]), abs(end[1] - current[1])
+            if dx < 1 and dy > 8:
+                vertical += 1
+            elif dy < 1 and dx > 8:
+                horizontal += 1
+            current = end
+        elif operator == b're' and len(operands) == 4:
+            x, y, w, h = (float(value) for value in operands)
+            if abs(w) > 8 and abs(h) > 8:
+                rectangles.append((x, y, abs(w), abs(h)))
+    return vertical, horizontal, rectangles
+
+
+def _looks_like_table(vertical, horizontal, rectangles):
+    if vertical >= MIN_GRID_LINES and horizontal >= MIN_GRID_LINES:
+        return True
+    # Cells: two or more rectangles side by side in at least two rows
+    rows = {}
+    for x, y, w, h in rectangles:
+        rows.setdefault(round(y / ROW_TOLERANCE), []).append(x)
+    return sum(1 for xs in rows.values() if len(xs) >= 2) >= 2
+
+
+def _font_issues(reader):
+    """(severe issues, minor issues) found in the fonts of every page."""
+    severe, minor = set(), set()
+    families = set()
+    for page in reader.pages:
+        resources = page.get('/Resources')
+        fonts = resources.get_object().get('/Font') if resources else None
+        if not fonts:
+            continue
+        for font in fonts.get_object().values():
+            font = font.get_object()
+            subtype = font.get('/Subtype')
+            base = str(font.get('/BaseFont', '')).lstrip('/')
+            name = base.split('+', 1)[-1]
+            families.add(re.split(r'[-,]', name)[0].lower())
+            if subtype == '/Type3':
+                severe.add("Type 3 (bitmap/drawn) font")
+                continue
+            descriptor = font.get('/FontDescriptor')
+            if subtype == '/Type0':
+                if '/ToUnicode' not in font:
+                    severe.add(f"{name}: composite font without a ToUnicode map")
+                descendants = font.get('/DescendantFonts')
+                if descendants:
+                    descriptor = descendants.get_object()[0].get_object().get('/FontDescriptor')
+            if ICON_FONT_PATTERN.search(name):
+                minor.add(f"{name}: icon/symbol font")
+            descriptor = descriptor.get_object() if descriptor is not None else {}
+            embedded = any(key in descriptor for key in ('/FontFile', '/FontFile2', '/FontFile3'))
+            if not embedded and not name.lower().startswith(STANDARD_FONT_FAMILIES):
+                minor.add(f"{name}: not embedded")
+    if len(families) > MAX_FONT_FAMILIES:
+        minor.add(f"{len(families)} font families")
+    return sorted(severe), sorted(minor)
+
+
+def analyze_pdf(pdf_bytes):
+    """ATS format report of a PDF: {'ats_score', 'checks', 'page_count', 'text_chars'}.
+
+    Raises pypdf errors for files that cannot be read; callers report them.
+    """
+    reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+    pages = reader.pages
+    page_count = len(pages)
+    texts = []
+    empty_pages = []
+    image_pages = []
+    column_pages = []
+    table_pages = []
+    contact_positions = []
+    for number, page in enumerate(pages, 1):
+        width, height = float(page.mediabox.width), float(page.mediabox.height)
+        text, runs = _page_text(page)
+        texts.append(text)
+        characters = len(text.strip())
+        large_images = _large_images(page) if characters < THIN_PAGE_TEXT else 0
+        # A textless page is a scan when an image fills it; otherwise it is blank (e.g. overflow)
+        if characters < MIN_PAGE_TEXT and large_images:
+            empty_pages.append(number)
+        if large_images:
+            image_pages.append(number)
+
+        columns = _second_column_rows(runs, width)
+        if any(len(texts_) >= MIN_COLUMN_ROWS and sum(map(len, texts_)) / len(texts_) >= MIN_COLUMN_TEXT
+               for texts_ in columns.values()):
+            column_pages.append(number)
+        if _looks_like_table(*_drawing_shapes(page, reader)):
+            table_pages.append(number)
+        for x, y, run in runs:
+            if EMAIL_PATTERN.search(run) or PHONE_PATTERN.search(run):
+                contact_positions.append(y < HEADER_BAND * height or y > (1 - HEADER_BAND) * height)
+
+    full_text = "\n".join(texts)
+    if len(full_text.strip()) < MIN_PAGE_TEXT:
+        empty_pages = list(range(1, page_count + 1))
+    checks = []
+    share = len(empty_pages) / page_count if page_count else 1.0
+    checks.append(_check('text_layer', not empty_pages, CHECK_WEIGHTS['text_layer'] * share,
+                         f"No extractable text on page(s) {', '.join(map(str, empty_pages))}; likely scanned"
+                         if empty_pages else f"{len(full_text.strip())} characters of selectable text"))
+    checks.append(_check('images_as_text', not image_pages,
+                         CHECK_WEIGHTS['images_as_text'] * len(image_pages) / max(1, page_count),
+                         f"Large images with little text on page(s) {', '.join(map(str, image_pages))}"
+                         if image_pages else "No large images standing in for text"))
+    checks.append(_check('multi_column', not column_pages,
+                         CHECK_WEIGHTS['multi_column'] if column_pages else 0,
+                         f"Two text columns on page(s) {', '.join(map(str, column_pages))}; ATS may interleave them"
+                         if column_pages else "Text flows in a single column"))
+    checks.append(_check('tables', not table_pages, CHECK_WEIGHTS['tables'] if table_pages else 0,
+                         f"Table grid on page(s) {', '.join(map(str, table_pages))}; cell order may be lost"
+                         if table_pages else "No tables found"))
+
+    severe, minor = _font_issues(reader)
+    font_penalty = CHECK_WEIGHTS['fonts'] if severe else CHECK_WEIGHTS['fonts'] / 2 if minor else 0
+    checks.append(_check('fonts', not severe and not minor, font_penalty,
+                         "; ".join(severe + minor) if severe or minor else "All fonts are standard or embedded"))
+
+    if not contact_positions:
+        contact = (False, CHECK_WEIGHTS['contact_info'], "No email or phone number found in the text layer")
+    elif all(contact_positions):
+        contact = (False, CHECK_WEIGHTS['contact_info'],
+                   "Email/phone appear only in the header or footer band, which many ATS skip")
+    else:
+        contact = (True, 0, "Email/phone found in the page body")
+    checks.append(_check('contact_info', *contact))
+
+    garbled = len(GARBLED_PATTERN.findall(full_text))
+    tokens = full_text.split()
+    long_tokens = sum(1 for token in tokens if len(token) > LONG_TOKEN_LENGTH and '@' not in token and '/' not in token)
+    clean = max(0.0, 1 - 10 * (garbled + long_tokens) / max(1, len(tokens)))
+    _, confidence, _ = parse_sections_with_confidence(full_text)
+    quality = (clean + confidence) / 2
+    checks.append(_check('text_quality', quality >= 0.75, CHECK_WEIGHTS['text_quality'] * (1 - quality),
+                         f"{garbled} garbled characters, {long_tokens} run-together words; "
+                         f"section parse confidence {confidence:.0%}"))
+
+    return {
+        'ats_score': max(0, int(round(100 - sum(check['penalty'] for check in checks)))),
+        'checks': checks,
+        'page_count': page_count,
+        'text_chars': len(full_text.strip()),
+    }
@@ -0,0 +1,126 @@
+"""Incremental re-analysis of edited resume sections.
+
+Every text area edit reruns the Streamlit script. Rather than re-deriving
+everything from the full resume, ResumeAnalysis keeps a dependency graph
+from inputs (one per section, plus the raw resume text) to derived
+artifacts. Updating the inputs invalidates only the artifacts downstream of
+what changed; artifacts are recomputed lazily the next time they are read.
+"""
+from collections import defaultdict
+
+from resume_core.scoring import (SUGGESTION_SECTIONS, combine_section_components,
+                                 generate_improvement_suggestions, section_components)
+
+
+class DependencyGraph:
+    """Lazily evaluated artifacts with explicit dependencies on inputs and other artifacts."""
+
+    def __init__(self):
+        self._rules = {}
+        self._dependents = defaultdict(set)
+        self._inputs = {}
+        self._values = {}
+        self.recompute_count = defaultdict(int)
+
+    def define(self, name, dependencies, compute):
+        """Register (or replace) an artifact computed as ``compute(*dependency_values)``."""
+        previous = self._rules.get(name)
+        if previous is not None:
+            if previous[0] == tuple(dependencies):
+                self._rules[name] = (previous[0], compute)
+                return
+            for dependency in previous[0]:
+                self._dependents[dependency].discard(name)
+        self._rules[name] = (tuple(dependencies), compute)
+        for dependency in dependencies:
+            self._dependents[dependency].add(name)
+        self.invalidate(name)
+
+    def is_defined(self, name):
+        return name in self._rules
+
+    def set_input(self, name, value):
+        """Set an input value, invalidating dependents only if it actually changed."""
+        if name in self._inputs and self._inputs[name] == value:
+            return False
+        self._inputs[name] = value
+        for dependent in list(self._dependents.get(name, ())):
+            self.invalidate(dependent)
+        return True
+
+    def invalidate(self, name):
+        """Drop the cached value of an artifact and everything downstream of it."""
+        stack = [name]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            self._values.pop(node, None)
+            stack.extend(self._dependents.get(node, ()))
+
+    def get(self, name):
+        """Return an input or artifact value, computing stale artifacts on demand."""
+        if name in self._values:
+            return self._values[name]
+        if name not in self._rules:
+            return self._inputs.get(name, "")
+        dependencies, compute = self._rules[name]
+        value = compute(*(self.get(dependency) for dependency in dependencies))
+        self._values[name] = value
+        self.recompute_count[name] += 1
+        return value
+
+    def is_fresh(self, name):
+        """True when an artifact has a cached value."""
+        return name in self._values
+
+
+def section_input(name):
+    """Graph input name for a resume section."""
+    return f"section:{name}"
+
+
+class ResumeAnalysis(DependencyGraph):
+    """Dependency graph for the local feedback shown while editing resume sections.
+
+    Per-section score components (presence, length, keyword hits, see
+    ``scoring.section_components``) feed a cheap recombination, so editing
+    one section recomputes that section's components plus the score dict
+    above them; content seen before comes from the shared component cache.
+    Callers can register extra artifacts, e.g. model calls keyed on
+    ``resume_text``, which section edits never invalidate.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._section_names = ()
+        self.define("suggestions", ["scores"] + [section_input(name) for name in SUGGESTION_SECTIONS],
+                    lambda scores, *contents: generate_improvement_suggestions(
+                        dict(zip(SUGGESTION_SECTIONS, contents)), scores))
+        self._define_aggregates()
+
+    def update_sections(self, sections):
+        """Feed the current sections; returns the names of sections that changed."""
+        changed = [name for name, content in sections.items()
+                   if self.set_input(section_input(name), content if isinstance(content, str) else str(content))]
+        # Sections that disappeared count as emptied
+        for name in self._section_names:
+            if name not in sections and self.set_input(section_input(name), ""):
+                changed.append(name)
+
+        names = tuple(sorted(set(self._section_names) | set(sections)))
+        if names != self._section_names:
+            self._section_names = names
+            for name in names:
+                if not self.is_defined(f"components:{name}"):
+                    self.define(f"components:{name}", [section_input(name)], section_components)
+            self._define_aggregates()
+        return changed
+
+    def _define_aggregates(self):
+        """(Re)wire the whole-resume scores to the current per-section components."""
+        names = self._section_names
+        self.define("scores", [f"components:{name}" for name in names],
+                    lambda *components: combine_section_components(dict(zip(names, components))))
@@ -0,0 +1,171 @@
+"""Local job-posting features and the saved-postings store for job-seeker ranking.
+
+``extract_job_features_local`` is the offline equivalent of the Gemini
+``extract_job_features`` call: same keys, built from the skill taxonomy,
+the "N+ years" requirement parser and a few line patterns.
+
+``JobPostingStore`` keeps a user's saved postings with their features and
+a precomputed coverage row each (see resume_core.ranking), so one resume
+is ranked against hundreds of postings with a single sparse product.
+"""
+import csv
+import hashlib
+import io
+import json
+import re
+import time
+
+from resume_core.model import DEGREE_PATTERN
+from resume_core.ranking import DEFAULT_TOP_K, FeatureStore, get_store, job_weights, resume_features
+from resume_core.skills import canonical_skills, extract_skill_names, match_skill_ids
+from resume_core.tenure import REQUIREMENT_PATTERN
+
+RESPONSIBILITY_HEADER_PATTERN = re.compile(
+    r"^(?:key\s+)?(?:responsibilities|duties|what you(?:'|’)?ll do|what you will do|the role|your role|"
+    r"day to day|in this role)\b", re.IGNORECASE)
+# Headers that end a responsibilities block
+OTHER_HEADER_PATTERN = re.compile(
+    r"^(?:requirements|qualifications|about|benefits|perks|who you are|what you(?:'|’)?ll bring|"
+    r"what we offer|skills|nice to have|preferred|education|experience)\b", re.IGNORECASE)
+CULTURE_PATTERN = re.compile(r'\b(?:culture|values|mission|we value|diversity|inclusive|inclusion|team spirit)\b',
+                             re.IGNORECASE)
+BULLET_PREFIX = re.compile(r'^\s*(?:[-•*▪◦]|\d+[.)])\s*')
+HEADER_MAX_LENGTH = 40
+MAX_FEATURE_LINES = 8
+
+
+def _is_header(line):
+    return len(line) <= HEADER_MAX_LENGTH and not line.endswith('.')
+
+
+def _responsibilities(lines):
+    """Lines under a responsibilities-style header, or the posting's bullets when it has none."""
+    collected = []
+    in_block = False
+    for line in lines:
+        if _is_header(line) and RESPONSIBILITY_HEADER_PATTERN.match(line):
+            in_block = True
+            continue
+        if in_block and _is_header(line) and OTHER_HEADER_PATTERN.match(line):
+            break
+        if in_block:
+            collected.append(BULLET_PREFIX.sub('', line))
+    if not collected:
+        collected = [BULLET_PREFIX.sub('', line) for line in lines if BULLET_PREFIX.match(line)]
+    return collected[:MAX_FEATURE_LINES]
+
+
+def extract_job_features_local(job_description):
+    """Extract the same job features as the Gemini call, without a model."""
+    text = job_description or ""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+    skills = extract_skill_names(text)
+    requirements = [match.group(0).strip() for match in REQUIREMENT_PATTERN.finditer(text)]
+    education = [BULLET_PREFIX.sub('', line) for line in lines if DEGREE_PATTERN.search(line)][:MAX_FEATURE_LINES]
+    responsibilities = _responsibilities(lines)
+    culture = [line for line in lines if CULTURE_PATTERN.search(line)][:MAX_FEATURE_LINES]
+    return {
+        "Required Skills": ", ".join(sorted(skills)) if skills else "No specific skills extracted",
+        "Required Experience": "; ".join(requirements) if requirements else "Experience requirements not specified",
+        "Education Requirements": "\n".join(education) if education else "Education requirements not specified",
+        "Job Responsibilities": ("\n".join(responsibilities) if responsibilities
+                                 else "Review the job description for detailed responsibilities"),
+        "Company Values/Culture": ("\n".join(culture) if culture
+                                   else "Review the job description for company culture information"),
+    }
+
+
+def posting_id(text):
+    """Stable id of a posting: the same text is only stored once."""
+    return hashlib.sha1(text.strip().encode('utf-8')).hexdigest()[:12]
+
+
+class JobPostingStore(FeatureStore):
+    """Saved job postings with local features, ranked against one resume."""
+
+    def __init__(self, path):
+        self._postings = {}
+        super().__init__(path)
+
+    def _load(self, stored, current):
+        self._postings = stored.get('postings', {})
+        super()._load(stored, current)
+        # Postings keep their text, so rows from an older layout are simply rebuilt
+        for job_id in self.missing(self._postings):
+            self._rows[job_id] = self._row(self._postings[job_id]['text'])
+
+    def _payload(self):
+        payload = super()._payload()
+        payload['postings'] = self._postings
+        return payload
+
+    @staticmethod
+    def _row(text):
+        return sorted([column, weight] for column, weight in job_weights(text).items())
+
+    def add(self, title, text):
+        """Save a posting (or refresh one with the same text) and return its id."""
+        job_id = posting_id(text)
+        with self._lock:
+            self._postings[job_id] = {
+                'title': title or text.strip().splitlines()[0][:80],
+                'text': text,
+                'features': extract_job_features_local(text),
+                'added': time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        self._set_row(job_id, self._row(text))
+        return job_id
+
+    def remove(self, job_id):
+        with self._lock:
+            self._postings.pop(job_id, None)
+        super().remove(job_id)
+
+    def posting(self, job_id):
+        """Stored posting dict (title, text, features, added) or None."""
+        return self._postings.get(job_id)
+
+    def postings(self):
+        """(job id, posting) for every saved posting, newest first."""
+        return sorted(self._postings.items(), key=lambda item: item[1]['added'], reverse=True)
+
+    def rank(self, resume_text, k=DEFAULT_TOP_K):
+        """Top k (job id, score 0-100) postings for a resume: the share of each posting's requirements it covers."""
+        return self.top_k(dict.fromkeys(resume_features(resume_text), 1.0), k)
+
+    def explain(self, job_id, resume_text):
+        """(matched, missing) skill names of one posting against a resume."""
+        job = canonical_skills(self._postings[job_id]['text'])
+        _, missing = match_skill_ids(canonical_skills(resume_text), job)
+        return (sorted(name for skill_id, name in job.items() if skill_id not in missing),
+                sorted(job[skill_id] for skill_id in missing))
+
+
+def get_job_posting_store(path):
+    """Return the process-wide posting store for a path."""
+    return get_store(JobPostingStore, path)
+
+
+def read_postings(file_name, data):
+    """Parse an imported postings file into (title, text) pairs.
+
+    CSV needs a ``description`` (or ``text``) column and may have a
+    ``title`` column; JSON is a list of such objects; plain text holds
+    postings separated by lines of ``---``.
+    """
+    content = data.decode('utf-8-sig') if isinstance(data, bytes) else data
+    if file_name.lower().endswith('.csv'):
+        records = list(csv.DictReader(io.StringIO(content)))
+    elif file_name.lower().endswith('.json'):
+        records = json.loads(content)
+        if isinstance(records, dict):
+            records = [records]
+    else:
+        records = [{'description': block} for block in re.split(r'(?m)^\s*-{3,}\s*$', content)]
+    postings = []
+    for record in records:
+        text = str(record.get('description') or record.get('text') or '').strip()
+        if text:
+            postings.append((str(record.get('title') or '').strip(), text))
+    return postings
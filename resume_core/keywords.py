@@ -0,0 +1,116 @@
+"""One-pass keyword frequency counting.
+
+The whole vocabulary, single words and phrases alike, is compiled into
+one regular expression, so each document is scanned once no matter how
+many keywords there are. Keywords match whole tokens (as the taxonomy
+tokenizer splits them, so "c++", "node.js" and "ci/cd" stay intact):
+"ai" is not counted inside "maintain". A trailing plural
+"s" is folded ("projects" counts as "project"), and a keyword inside a
+longer matched one is not counted again ("react native" is not also
+"react").
+
+Counts come back as a compact ``array('I')`` aligned with the
+vocabulary, which is cheap to cache (``tobytes()``) and to compare.
+"""
+import functools
+import math
+import re
+from array import array
+from collections import Counter
+
+from resume_core.taxonomy import term_tokens
+
+# Keywords reported in the job-match keyword analysis
+KEYWORD_VOCABULARY = (
+    'python', 'javascript', 'java', 'c++', 'sql', 'database', 'web', 'api',
+    'cloud', 'aws', 'azure', 'docker', 'kubernetes', 'agile', 'team',
+    'leadership', 'project', 'development', 'software', 'engineering',
+    'problem-solving', 'communication', 'analysis', 'design', 'testing',
+    'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
+    'devops', 'ci/cd', 'git', 'github', 'jira', 'scrum', 'kanban',
+    'machine learning', 'ai', 'data science', 'tensorflow', 'pytorch',
+    'nlp', 'computer vision', 'deep learning', 'automation', 'security',
+    'linux', 'windows', 'macos', 'mobile', 'android', 'ios', 'swift',
+    'kotlin', 'react native', 'flutter', 'blockchain', 'cybersecurity'
+)
+
+
+def _phrase_fragments(phrase):
+    """Regex fragments of a normalized phrase, one per character or separator.
+
+    Words need whitespace between them; punctuation tokens ("node . js")
+    may be written with or without it.
+    """
+    tokens = phrase.split(' ')
+    fragments = [re.escape(char) for char in tokens[0]]
+    for previous, token in zip(tokens, tokens[1:]):
+        fragments.append(r'\s+' if previous[-1].isalnum() and token[0].isalnum() else r'\s*')
+        fragments.extend(re.escape(char) for char in token)
+    return fragments
+
+
+def _trie_pattern(node):
+    """Regex for a fragment trie; shared prefixes are tried once instead of once per keyword."""
+    branches = [fragment + _trie_pattern(child) for fragment, child in node.items() if fragment]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 and '' not in node else '(?:' + '|'.join(branches) + ')'
+    return pattern + '?' if '' in node else pattern
+
+
+@functools.lru_cache(maxsize=32)
+def compile_vocabulary(vocabulary):
+    """Single regex for a vocabulary tuple and its keyword -> position map.
+
+    The keywords are merged into a trie before being turned into one
+    pattern, which keeps the scan fast as the vocabulary grows. Regex
+    alternation is greedy per branch, so a phrase wins over the keyword
+    it starts with; the lookarounds make every keyword match whole tokens.
+    """
+    positions = {}
+    trie = {}
+    for position, keyword in enumerate(vocabulary):
+        phrase = ' '.join(term_tokens(keyword))
+        if not phrase or phrase in positions:
+            continue
+        positions[phrase] = positions[keyword.lower()] = position
+        node = trie
+        for fragment in _phrase_fragments(phrase):
+            node = node.setdefault(fragment, {})
+        node[''] = {}
+    pattern = re.compile(r'(?<![\w+#])(' + _trie_pattern(trie) + r')s?(?![\w+#])')
+    return pattern, positions
+
+
+def keyword_vector(text, vocabulary=KEYWORD_VOCABULARY):
+    """Count every vocabulary keyword in the text in a single pass."""
+    pattern, positions = compile_vocabulary(vocabulary)
+    counts = array('I', bytes(4 * len(vocabulary)))
+    if not text:
+        return counts
+    for matched, count in Counter(pattern.findall(text.lower())).items():
+        position = positions.get(matched)
+        if position is None:
+            position = positions[' '.join(term_tokens(matched))]
+        counts[position] += count
+    return counts
+
+
+def vector_similarity(first, second):
+    """Cosine similarity of two keyword vectors (0.0 when either is empty)."""
+    dot = sum(a * b for a, b in zip(first, second))
+    norm = math.sqrt(sum(a * a for a in first)) * math.sqrt(sum(b * b for b in second))
+    return dot / norm if norm else 0.0
+
+
+def keyword_analysis(job_vector, resume_vector, vocabulary=KEYWORD_VOCABULARY):
+    """Per-keyword job/resume counts for every keyword found in either document."""
+    keywords = {}
+    for keyword, job_count, resume_count in zip(vocabulary, job_vector, resume_vector):
+        if job_count or resume_count:
+            keywords[keyword] = {
+                'job_count': job_count,
+                'resume_count': resume_count,
+                'ratio': resume_count / max(1, job_count)
+            }
+    return keywords
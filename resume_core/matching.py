@@ -0,0 +1,230 @@
+"""Local resume-to-job match scoring.
+
+``score_match_local`` returns the same five scores as the Gemini
+``calculate_match_score`` call, computed deterministically in a few
+milliseconds:
+
+- ``skills_match``: share of the job's canonical skills the resume covers
+  (None when the job lists no skills the taxonomy knows)
+- ``experience_match``: tenure against the "N+ years" requirements
+- ``education_match``: highest resume degree level against the lowest
+  degree the job requires (degrees named as preferred are not required)
+- ``overall_fit``: BM25 score of the resume for the job's terms, relative
+  to an average-length document mentioning every job term once
+
+``match_score`` is a weighted blend of the four, renormalized over the
+ones that are not None. Hashed n-gram similarities of related section
+pairs (resume_core.semantic) come back alongside as
+``section_similarity``.
+
+The scores are one part of a match artifact: matched and missing skills,
+keyword vectors, tenure and scores for one (resume, job description)
+pair. ``get_match_artifact`` builds it once per pair of content hashes,
+and every matching view renders from the same artifact.
+"""
+import hashlib
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from resume_core.jobs import extract_job_features_local
+from resume_core.keywords import keyword_analysis, keyword_vector
+from resume_core.model import DEGREE_PATTERN, as_resume_document
+from resume_core.semantic import section_similarities
+from resume_core.skills import canonical_skills, match_skill_ids
+from resume_core.taxonomy import TOKEN_PATTERN
+from resume_core.tenure import analyze_tenure
+
+# Ordinal level of each degree mention; a bare "degree" is read as a bachelor's
+DEGREE_LEVELS = {
+    'diploma': 1, 'associate': 1,
+    'bachelor': 2, 'bsc': 2, 'bs': 2, 'ba': 2, 'degree': 2,
+    'master': 3, 'msc': 3, 'ms': 3, 'ma': 3, 'mba': 3,
+    'phd': 4, 'doctorate': 4,
+}
+# Requirement clauses: a period only ends one when it does not close an abbreviation like "B.S."
+CLAUSE_PATTERN = re.compile(r'[;,\n]|(?<!\b[a-z])\.\s', re.IGNORECASE)
+PREFERENCE_PATTERN = re.compile(r'\b(?:preferred|plus|bonus|desired|ideally|nice to have)\b', re.IGNORECASE)
+MATCH_WEIGHTS = {'skills_match': 0.4, 'experience_match': 0.25, 'education_match': 0.1, 'overall_fit': 0.25}
+MATCH_CACHE_SIZE = 128
+BM25_K1 = 1.2
+BM25_B = 0.75
+STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it', 'of', 'on',
+    'or', 'our', 'that', 'the', 'their', 'this', 'to', 'we', 'will', 'with', 'you', 'your',
+))
+
+
+def _text(value):
+    if isinstance(value, (list, tuple)):
+        return '\n'.join(str(item) for item in value)
+    return str(value or "")
+
+
+def job_text(job_features):
+    """All job feature values joined into one text."""
+    return '\n'.join(_text(value) for value in (job_features or {}).values())
+
+
+def content_tokens(tokens):
+    """Taxonomy tokens with stop words and punctuation dropped."""
+    return [token for token in tokens if token not in STOP_WORDS and token[0].isalnum()]
+
+
+def match_tokens(text):
+    """Lowercase content tokens of a text, stop words and punctuation dropped."""
+    return content_tokens(TOKEN_PATTERN.findall(text.lower()))
+
+
+def clause_degree_levels(clause):
+    """Degree levels named in one clause; a bare "degree" only counts when no specific one is named."""
+    names = [match.group(1).lower().replace('.', '') for match in DEGREE_PATTERN.finditer(clause)]
+    levels = [DEGREE_LEVELS[name] for name in names if name != 'degree']
+    return levels or [DEGREE_LEVELS['degree']] * ('degree' in names)
+
+
+def degree_level(text):
+    """Highest degree level (0-4) mentioned in the text."""
+    return max((level for clause in CLAUSE_PATTERN.split(text or "") for level in clause_degree_levels(clause)),
+               default=0)
+
+
+def required_degree_level(text):
+    """Lowest degree level (0-4) a requirement text asks for, 0 when none.
+
+    "Bachelor's or Master's" and "Bachelor's required; Master's preferred"
+    both require a bachelor's: clauses naming a preference are skipped.
+    """
+    return min((level for clause in CLAUSE_PATTERN.split(text or "") if not PREFERENCE_PATTERN.search(clause)
+                for level in clause_degree_levels(clause)), default=0)
+
+
+def education_score(resume_education, requirement_text):
+    """0-100: the resume's highest degree against the required level, 100 when none is required."""
+    required = required_degree_level(requirement_text)
+    if not required:
+        return 100
+    return min(100, int(100 * degree_level(resume_education) / required))
+
+
+def bm25_fit(resume_fields, job_fields):
+    """0-100 BM25 score of the resume for the job's terms.
+
+    Fields are lists of ``match_tokens``. The score is relative to an
+    average-length document that mentions every job term once, i.e. the
+    sum of the terms' IDFs. Document frequencies come from the resume
+    sections and job fields, so terms spread across every field weigh
+    little.
+    """
+    resume = Counter(token for field in resume_fields for token in field)
+    job = Counter(token for field in job_fields for token in field)
+    if not resume or not job:
+        return 0
+
+    fields = [set(field) for field in resume_fields + job_fields if field]
+    document_frequency = Counter(token for field in fields for token in field)
+    idf = {term: math.log(1 + (len(fields) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+           for term in job}
+    average_length = (sum(resume.values()) + sum(job.values())) / 2
+    length_norm = BM25_K1 * (1 - BM25_B + BM25_B * sum(resume.values()) / average_length)
+    score = sum(idf[term] * resume[term] * (BM25_K1 + 1) / (resume[term] + length_norm)
+                for term in job if term in resume)
+    best = sum(idf.values())
+    return min(100, int(100 * score / best)) if best else 0
+
+
+def resume_education_text(document):
+    """The degree lines of the resume's education entries, else its Education section, else all of it."""
+    return ('\n'.join(entry.degree for entry in document.education if entry.degree)
+            or document.get("Education") or document.text)
+
+
+def _scores(document, job_description, job_features, tenure, missing_skill_ids, job_skills):
+    """The five match scores plus ``total_years`` and ``section_similarity``."""
+    covered = len(job_skills) - len(missing_skill_ids)
+    resume_fields = [content_tokens(document.section_tokens(name)) for name in document.sections]
+    scores = {
+        'skills_match': int(100 * covered / len(job_skills)) if job_skills else None,
+        'experience_match': tenure['experience_match'],
+        'education_match': education_score(resume_education_text(document),
+                                           job_features["Education Requirements"]),
+        'overall_fit': bm25_fit(resume_fields, [match_tokens(line) for line in job_description.splitlines()]),
+    }
+    # A job with no known skills leaves skills_match out of the blend instead of scoring it 100
+    weights = {name: weight for name, weight in MATCH_WEIGHTS.items() if scores[name] is not None}
+    scores['match_score'] = int(sum(scores[name] * weight for name, weight in weights.items())
+                                / sum(weights.values()))
+    scores['total_years'] = tenure['total_years']
+    scores['section_similarity'] = section_similarities(document.sections, job_features)
+    return scores
+
+
+def build_match_artifact(resume_sections, job_description, today=None):
+    """Everything the matching views show for one resume and job description.
+
+    Job features are extracted locally from the text, so the artifact
+    depends only on the two documents.
+    """
+    document = as_resume_document(resume_sections)
+    job_description = job_description or ""
+    job_features = extract_job_features_local(job_description)
+    # The resume's skills and keyword counts are cached on its document, shared across jobs
+    resume_skills = document.skills.names()
+    job_skills = canonical_skills(job_description)
+    matched_ids, missing_ids = match_skill_ids(resume_skills, job_skills)
+    tenure = analyze_tenure(document, job_features["Required Experience"], today)
+    job_keywords = keyword_vector(job_description)
+    resume_keywords = document.keywords
+    return {
+        'job_features': job_features,
+        'matched_skills': sorted(resume_skills[skill_id] for skill_id in matched_ids),
+        'missing_skills': sorted(job_skills[skill_id] for skill_id in missing_ids),
+        'job_skill_count': len(job_skills),
+        'job_keywords': job_keywords,
+        'resume_keywords': resume_keywords,
+        'keyword_analysis': keyword_analysis(job_keywords, resume_keywords),
+        'tenure': tenure,
+        'scores': _scores(document, job_description, job_features, tenure, missing_ids, job_skills),
+    }
+
+
+def match_key(resume_sections, job_description):
+    """(resume hash, job hash) identifying a match artifact."""
+    resume_hash = hashlib.sha1(repr(as_resume_document(resume_sections).fingerprint()).encode('utf-8')).hexdigest()
+    job_hash = hashlib.sha1((job_description or "").strip().encode('utf-8')).hexdigest()
+    return resume_hash, job_hash
+
+
+_ARTIFACT_CACHE = OrderedDict()
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+
+
+def get_match_artifact(resume_sections, job_description):
+    """Return the match artifact for a resume and job, built once per (resume hash, job hash).
+
+    The artifact is shared between callers: read it, do not modify it.
+    """
+    key = match_key(resume_sections, job_description)
+    with _ARTIFACT_CACHE_LOCK:
+        artifact = _ARTIFACT_CACHE.get(key)
+        if artifact is not None:
+            _ARTIFACT_CACHE.move_to_end(key)
+            return artifact
+    artifact = build_match_artifact(resume_sections, job_description)
+    with _ARTIFACT_CACHE_LOCK:
+        artifact = _ARTIFACT_CACHE.setdefault(key, artifact)
+        if len(_ARTIFACT_CACHE) > MATCH_CACHE_SIZE:
+            _ARTIFACT_CACHE.popitem(last=False)
+    return artifact
+
+
+def score_match_local(resume_sections, job_features):
+    """Match scores between resume sections and job features, in the Gemini response shape.
+
+    The features are joined back into a job text; prefer
+    ``get_match_artifact`` with the original description when it is
+    available. Also returns ``total_years`` of dated experience found and
+    the per-section ``section_similarity``.
+    """
+    return dict(get_match_artifact(resume_sections, job_text(job_features))['scores'])
@@ -0,0 +1,286 @@
+"""Structured resume document model shared by parsing, scoring, matching and rendering.
+
+Sections still travel through the UI as plain ``{name: text}`` dicts. A
+ResumeDocument wraps one such dict and computes the derived views every
+consumer used to rebuild on its own (lowercase and token views, the
+skill set, keyword counts, experience and education entries) once, on
+first access; as_resume_document shares one document per content
+between parsing, matching, tenure and scoring.
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from resume_core.keywords import keyword_vector
+from resume_core.taxonomy import TOKEN_PATTERN, get_skill_index
+
+BULLET_PATTERN = re.compile(r'^\s*[•\-*▪●◦‣]\s*')
+MONTH_PATTERN = r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+DATE_RANGE_PATTERN = re.compile(
+    rf'(?P<start>(?:{MONTH_PATTERN}\s+)?(?:\d{{1,2}}/)?(?:19|20)\d\d)\s*(?:-|–|—|to)\s*'
+    rf'(?P<end>(?:{MONTH_PATTERN}\s+)?(?:\d{{1,2}}/)?(?:19|20)\d\d|\d\d(?!\d|%)|present|current|now)',
+    re.IGNORECASE
+)
+# Bare BA/BS/MA/MS only count next to degree context ("BS in", "BS/MS",
+# "BS or MS", "MS degree"), so "Boston, MA" and "MS Office" do not.
+# Bachelor, master and associate only count in degree phrasing ("master's",
+# "masters", "master of", "master degree"), so "Scrum Master" and
+# "Associate Engineer" do not.
+BARE_DEGREE = r'(?:ba|bs|ma|ms)'
+DEGREE_WORD = r"(?:bachelor|master|associate)(?=(?:s|['’]s|\s+of|\s+degree)\b)"
+DEGREE_PATTERN = re.compile(
+    r'\b((?:phd|ph\.d|doctorate|mba|bsc|msc|b\.s|m\.s|b\.a|m\.a|diploma|degree'
+    rf'|(?<=/){BARE_DEGREE}|(?<=\bor ){BARE_DEGREE}|{BARE_DEGREE}(?=\s*/|\s+(?:in|degree|or)\b))\b'
+    rf'|{DEGREE_WORD})',
+    re.IGNORECASE
+)
+
+INSTITUTION_PATTERN = re.compile(r'\b(university|college|institute|school|academy)\b', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'\b(?:19|20)\d\d\b')
+
+EXPERIENCE_SECTIONS = ("Experience", "Work Experience", "Employment History")
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    """One role from the Experience section."""
+    title: str
+    company: str = ""
+    start: str = ""
+    end: str = ""
+    bullets: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    """One degree or school from the Education section."""
+    degree: str
+    institution: str = ""
+    year: str = ""
+    details: list = field(default_factory=list)
+
+
+def normalize_skill(skill):
+    """Canonical taxonomy id of a skill name or alias, None when the taxonomy does not know it."""
+    return get_skill_index().lookup(skill)
+
+
+class SkillSet:
+    """An immutable set of canonical skill ids from the skill taxonomy."""
+    __slots__ = ('ids',)
+
+    def __init__(self, skill_ids=()):
+        self.ids = frozenset(skill_ids)
+
+    @classmethod
+    def from_text(cls, text):
+        """Skills mentioned anywhere in a text."""
+        return cls(get_skill_index().skill_ids(text) if text else ())
+
+    @classmethod
+    def from_names(cls, names):
+        """Skills from a list of names or aliases; names the taxonomy does not know are dropped."""
+        return cls(skill_id for skill_id in map(normalize_skill, names) if skill_id is not None)
+
+    def names(self):
+        """{skill id: canonical name}."""
+        index = get_skill_index()
+        return {skill_id: index.name(skill_id) for skill_id in self.ids}
+
+    def __contains__(self, skill):
+        return (skill if isinstance(skill, int) else normalize_skill(skill)) in self.ids
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __or__(self, other):
+        return SkillSet(self.ids | other.ids)
+
+    def __and__(self, other):
+        return SkillSet(self.ids & other.ids)
+
+    def __sub__(self, other):
+        return SkillSet(self.ids - other.ids)
+
+    def __eq__(self, other):
+        return isinstance(other, SkillSet) and self.ids == other.ids
+
+    def __hash__(self):
+        return hash(self.ids)
+
+    def __repr__(self):
+        return f"SkillSet({sorted(self.ids)!r})"
+
+
+def parse_experience_entries(text):
+    """Split Experience text into entries; a line with a date range starts a new role."""
+    entries = []
+    current = None
+    for raw_line in (text or "").split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+        date_match = DATE_RANGE_PATTERN.search(line)
+        is_bullet = bool(BULLET_PATTERN.match(raw_line))
+        if date_match and not is_bullet:
+            heading = (line[:date_match.start()] + line[date_match.end():]).strip(' ,|()-–—')
+            title, company = _split_title_company(heading)
+            current = ExperienceEntry(title, company, date_match.group('start').strip(),
+                                      date_match.group('end').strip())
+            entries.append(current)
+        elif current is None:
+            current = ExperienceEntry(line)
+            entries.append(current)
+        else:
+            current.bullets.append(BULLET_PATTERN.sub('', line))
+    return entries
+
+
+def _split_title_company(heading):
+    """Split 'Title, Company' / 'Title at Company' / 'Title | Company' / 'Title - Company'."""
+    for separator in (' at ', ', ', ' | ', ' - ', ' – ', ' @ '):
+        if separator in heading:
+            title, company = heading.split(separator, 1)
+            return title.strip(' ,|()'), company.strip(' ,|()')
+    return heading, ""
+
+
+def parse_education_entries(text):
+    """Split Education text into entries; a line naming a degree or institution starts a new entry."""
+    entries = []
+    current = None
+    for raw_line in (text or "").split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+        degree_match = DEGREE_PATTERN.search(line)
+        institution_match = INSTITUTION_PATTERN.search(line)
+        if (degree_match or institution_match) and not BULLET_PATTERN.match(raw_line):
+            year_match = YEAR_PATTERN.search(line)
+            parts = [part.strip() for part in re.split(r',|\||–|—| - ', line) if part.strip()]
+            institution = next((part for part in parts if INSTITUTION_PATTERN.search(part)), "")
+            degree = next((part for part in parts if DEGREE_PATTERN.search(part)), "")
+            current = EducationEntry(degree, institution, year_match.group() if year_match else "")
+            entries.append(current)
+        elif current is not None:
+            current.details.append(BULLET_PATTERN.sub('', line))
+    return entries
+
+
+class ResumeDocument:
+    """Resume sections plus lazily computed, cached lowercase, token, skill and entry views.
+
+    Treat a document as immutable: build a new one instead of editing
+    ``sections`` in place.
+    """
+    __slots__ = ('sections', '_text', '_lower', '_tokens', '_skills', '_keywords',
+                 '_experience', '_role_texts', '_education')
+
+    def __init__(self, sections):
+        self.sections = {name: content if isinstance(content, str) else str(content)
+                         for name, content in (sections or {}).items()}
+        self._text = None
+        self._lower = {}
+        self._tokens = {}
+        self._skills = None
+        self._keywords = None
+        self._experience = None
+        self._role_texts = None
+        self._education = None
+
+    def get(self, name, default=""):
+        """Raw text of a section."""
+        return self.sections.get(name, default)
+
+    def section_lower(self, name):
+        """Lowercased text of a section."""
+        lower = self._lower.get(name)
+        if lower is None:
+            lower = self._lower[name] = self.sections.get(name, "").lower()
+        return lower
+
+    def section_tokens(self, name):
+        """Taxonomy tokens (see resume_core.taxonomy) of a section's lowercased text."""
+        tokens = self._tokens.get(name)
+        if tokens is None:
+            tokens = self._tokens[name] = TOKEN_PATTERN.findall(self.section_lower(name))
+        return tokens
+
+    @property
+    def text(self):
+        """All section contents joined with spaces."""
+        if self._text is None:
+            self._text = ' '.join(self.sections.values())
+        return self._text
+
+    @property
+    def skills(self):
+        """SkillSet of every taxonomy skill the resume mentions."""
+        if self._skills is None:
+            self._skills = SkillSet.from_text(self.text)
+        return self._skills
+
+    @property
+    def keywords(self):
+        """``keyword_vector`` of the whole text."""
+        if self._keywords is None:
+            self._keywords = keyword_vector(self.text)
+        return self._keywords
+
+    @property
+    def experience(self):
+        """ExperienceEntry list parsed from the experience sections."""
+        if self._experience is None:
+            self._experience = parse_experience_entries(
+                '\n'.join(self.sections.get(name, "") for name in EXPERIENCE_SECTIONS))
+        return self._experience
+
+    @property
+    def role_texts(self):
+        """Lowercased title, company and bullets of each ``experience`` entry, in order."""
+        if self._role_texts is None:
+            self._role_texts = [' '.join([entry.title, entry.company] + entry.bullets).lower()
+                                for entry in self.experience]
+        return self._role_texts
+
+    @property
+    def education(self):
+        """EducationEntry list parsed from the Education section."""
+        if self._education is None:
+            self._education = parse_education_entries(self.sections.get("Education", ""))
+        return self._education
+
+    def fingerprint(self):
+        """Hashable key identifying the document's content."""
+        return tuple(self.sections.items())
+
+
+_DOCUMENT_CACHE = OrderedDict()
+_DOCUMENT_CACHE_SIZE = 64
+_DOCUMENT_CACHE_LOCK = threading.Lock()
+
+
+def as_resume_document(sections):
+    """Return a ResumeDocument for a sections dict, reusing the cached one for identical content.
+
+    Every consumer can call this on whatever it is handed; the second caller
+    with the same content gets the already-warmed document.
+    """
+    if isinstance(sections, ResumeDocument):
+        return sections
+    key = tuple((name, content if isinstance(content, str) else str(content))
+                for name, content in (sections or {}).items())
+    with _DOCUMENT_CACHE_LOCK:
+        document = _DOCUMENT_CACHE.get(key)
+        if document is None:
+            document = ResumeDocument(sections)
+            _DOCUMENT_CACHE[key] = document
+            if len(_DOCUMENT_CACHE) > _DOCUMENT_CACHE_SIZE:
+                _DOCUMENT_CACHE.popitem(last=False)
+        else:
+            _DOCUMENT_CACHE.move_to_end(key)
+        return document
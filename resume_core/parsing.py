@@ -0,0 +1,445 @@
+"""Resume text extraction and local (non-AI) section parsing."""
+import re
+import threading
+from collections import Counter
+
+import pypdf
+
+from resume_core.skills import extract_skill_names
+
+
+# Section header aliases in priority order. Some aliases appear under more
+# than one section ("technical skills", "qualifications", "achievements");
+# the first section listed wins.
+SECTION_HEADER_ALIASES = (
+    ("Contact Information", ("contact", "personal", "info", "contact information", "personal information",
+                             "contact details", "personal details", "contact info")),
+    ("Summary", ("summary", "professional summary", "profile", "about me", "career summary",
+                 "executive summary", "professional profile")),
+    ("Objective", ("objective", "career objective", "professional objective", "career goal", "job objective")),
+    ("Skills", ("skills", "technical skills", "core skills", "key skills", "competencies",
+                "areas of expertise", "areas of knowledge")),
+    ("Technical Skills", ("technical skills", "hard skills", "technical competencies", "technical expertise")),
+    ("Soft Skills", ("soft skills", "interpersonal skills", "people skills", "communication skills")),
+    ("Experience", ("experience", "work experience", "employment", "employment history", "work history",
+                    "career history", "professional experience")),
+    ("Education", ("education", "academic background", "qualifications", "academic qualifications",
+                   "educational background")),
+    ("Projects", ("projects", "project experience", "key projects", "relevant projects", "personal projects")),
+    ("Certifications", ("certifications", "certificates", "professional certifications", "credentials",
+                        "qualifications")),
+    ("Publications", ("publications", "papers", "research papers", "articles", "published works")),
+    ("Patents", ("patents", "patent applications", "inventions")),
+    ("Awards", ("awards", "honors", "recognitions", "achievements")),
+    ("Achievements", ("achievements", "accomplishments", "key achievements")),
+    ("Languages", ("languages", "language skills", "language proficiency", "foreign languages")),
+    ("Interests", ("interests", "hobbies", "activities", "personal interests")),
+    ("Volunteer Experience", ("volunteer", "volunteering", "volunteer experience", "community service")),
+    ("Professional Affiliations", ("affiliations", "professional affiliations", "memberships",
+                                   "professional memberships")),
+    ("References", ("references", "professional references", "character references")),
+)
+
+
+def _build_header_lookup(aliases):
+    """Flatten the alias table into a normalized-header -> section dict, first section wins."""
+    lookup = {}
+    for section, names in aliases:
+        for name in names:
+            lookup.setdefault(name, section)
+    return lookup
+
+
+SECTION_HEADER_LOOKUP = _build_header_lookup(SECTION_HEADER_ALIASES)
+
+
+# Numbering ("1.", "II)", "3 -") and bullet or markdown markers in front of a header
+HEADER_PREFIX_PATTERN = re.compile(r'^(?:[#*•▪●◦‣>]+\s*|(?:\d{1,2}|[ivx]{1,4})\s*[.):\-–—]\s*)')
+# Trailing punctuation and rules after a header ("SKILLS:", "EXPERIENCE —", "Education ___")
+HEADER_SUFFIX_PATTERN = re.compile(r'[\s:;.,|_=*#\-–—]+$')
+# "SKILLS: Python, SQL" - a header and its first content on one line
+INLINE_HEADER_PATTERN = re.compile(r'^\s*([^:]{2,40}?)\s*:\s*(\S.*)$')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HEADER_MAX_LENGTH = 60
+
+
+def normalize_header(line):
+    """Normalize a candidate header line: lowercase, drop numbering, markers and trailing punctuation."""
+    header = line.strip().lower()
+    if len(header) > HEADER_MAX_LENGTH:
+        return header
+    # Most lines start and end with a letter; skip the regexes for them
+    if not header[:1].isalpha() or header[:1] in 'ivx':
+        header = HEADER_PREFIX_PATTERN.sub('', header)
+    if not header[-1:].isalpha():
+        header = HEADER_SUFFIX_PATTERN.sub('', header)
+    if '  ' in header or '\t' in header:
+        header = WHITESPACE_PATTERN.sub(' ', header)
+    return header
+
+
+def match_section_header(line):
+    """Return the canonical section name for a header line, or None if it is not a header."""
+    return SECTION_HEADER_LOOKUP.get(normalize_header(line))
+
+
+def match_inline_header(line, capitals_only=False):
+    """Split an inline header line ("SKILLS: Python, SQL") into (section, content), or None.
+
+    With ``capitals_only``, only labels written in capitals count, so that
+    field labels inside a section ("Languages: Python, Go") are left alone.
+    """
+    match = INLINE_HEADER_PATTERN.match(line) if ':' in line else None
+    if match is None or (capitals_only and not match.group(1).isupper()):
+        return None
+    section = match_section_header(match.group(1))
+    if section is None:
+        return None
+    return section, match.group(2).strip()
+
+
+def extract_text_from_pdf(file):
+    """Extract text from a PDF file-like object using pypdf."""
+    if hasattr(file, 'seek'):
+        file.seek(0)
+
+    pdf_reader = pypdf.PdfReader(file)
+    text = []
+    for page in pdf_reader.pages:
+        content = page.extract_text()
+        if content:
+            text.append(content)
+    return "\n".join(text)
+
+
+def parse_sections_by_headers(resume_text):
+    """Parse resume text into sections by detecting common section headers."""
+    return _parse_sections_by_headers(resume_text)[0]
+
+
+def _parse_sections_by_headers(resume_text):
+    """Header parse plus the line statistics parse confidence is computed from."""
+    # First try to identify common section headers
+    common_sections = {
+        "Contact Information": [],
+        "Summary": [],
+        "Professional Summary": [],
+        "Objective": [],
+        "Skills": [],
+        "Technical Skills": [],
+        "Soft Skills": [],
+        "Experience": [],
+        "Work Experience": [],
+        "Employment History": [],
+        "Education": [],
+        "Projects": [],
+        "Certifications": [],
+        "Publications": [],
+        "Patents": [],
+        "Awards": [],
+        "Achievements": [],
+        "Languages": [],
+        "Interests": [],
+        "Hobbies": [],
+        "Volunteer Experience": [],
+        "Professional Affiliations": [],
+        "References": []
+    }
+    
+    # Walk the lines, switching section whenever a header line is seen
+    lines = resume_text.split('\n')
+    current_section = "Contact Information"  # Default first section
+    stats = {'content_lines': 0, 'headers': 0, 'inline_headers': 0, 'unassigned_lines': 0}
+    
+    # Process each line
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+            
+        # Check if this line is a section header
+        section = match_section_header(line)
+        if section is not None:
+            current_section = section
+            stats['headers'] += 1
+            continue
+        
+        # Before the first real header an inline header opens its section; under
+        # a real header it claims only its own line, and only when written in
+        # capitals, so labels like "Activities:" stay in the open section
+        section = current_section
+        inline = match_inline_header(line, capitals_only=bool(stats['headers']))
+        if inline is not None:
+            section, line = inline
+            if not stats['headers']:
+                current_section = section
+            stats['inline_headers'] += 1
+        
+        common_sections[section].append(line)
+        stats['content_lines'] += 1
+        if not (stats['headers'] or stats['inline_headers']):
+            stats['unassigned_lines'] += 1
+    
+    # Convert lists to strings
+    parsed_sections = {}
+    for section, content in common_sections.items():
+        if content:
+            parsed_sections[section] = "\n".join(content)
+
+    return parsed_sections, stats
+
+
+# Parse confidence: how much of the document the header parse accounts for
+CONTACT_LINE_ALLOWANCE = 6  # Lines before the first header that are plausibly contact details
+CONFIDENCE_SECTION_TARGET = 4  # Distinct sections at which the section-count component saturates
+CONFIDENCE_KEY_SECTIONS = (
+    ("Experience", "Work Experience", "Employment History"),
+    ("Education",),
+    ("Skills", "Technical Skills", "Soft Skills"),
+)
+
+
+def parse_confidence(sections, stats):
+    """Score (0-1) how likely a header parse captured the resume's structure.
+
+    Combines the number of distinct sections found, whether the key
+    sections (experience, education, skills) are among them, and how many
+    content lines were left before the first header beyond what contact
+    details account for.
+    """
+    if not stats['content_lines']:
+        return 0.0
+    found = len(set(sections) - {"Contact Information"})
+    key_sections = sum(1 for names in CONFIDENCE_KEY_SECTIONS if any(name in sections for name in names))
+    stranded = max(0, stats['unassigned_lines'] - CONTACT_LINE_ALLOWANCE)
+    coverage = 1 - stranded / stats['content_lines']
+    confidence = (0.3 * min(1, found / CONFIDENCE_SECTION_TARGET)
+                  + 0.3 * key_sections / len(CONFIDENCE_KEY_SECTIONS)
+                  + 0.4 * coverage)
+    return round(confidence, 3)
+
+
+def parse_sections_with_confidence(resume_text):
+    """Parse sections locally and return (sections, confidence, header_section_count).
+
+    When the header parse finds two sections or fewer, the simple extractor's
+    sections are returned instead (with the header parse's low confidence).
+    """
+    header_sections, stats = _parse_sections_by_headers(resume_text)
+    confidence = parse_confidence(header_sections, stats)
+    if len(header_sections) <= 2:
+        return extract_sections_simple(resume_text), confidence, len(header_sections)
+    return header_sections, confidence, len(header_sections)
+
+
+def parse_resume_sections_local(resume_text):
+    """Parse resume sections without AI, falling back to simple extraction."""
+    return parse_sections_with_confidence(resume_text)[0]
+
+
+# Parse routing: share of parses that needed the model, per server process
+PARSE_ROUTES = ('local', 'ai')
+_parse_route_counts = Counter()
+_parse_route_lock = threading.Lock()
+
+
+def record_parse_route(route):
+    """Count one parse as handled locally ('local') or sent to the model ('ai')."""
+    with _parse_route_lock:
+        _parse_route_counts[route] += 1
+
+
+def parse_route_stats():
+    """Parse counts per route and the share that went to the network."""
+    with _parse_route_lock:
+        counts = {route: _parse_route_counts[route] for route in PARSE_ROUTES}
+    total = sum(counts.values())
+    return {'counts': counts, 'total': total, 'ai_share': counts['ai'] / total if total else 0.0}
+
+
+# Token classes for the single-pass simple extractor. A token may belong to
+# several classes (e.g. "project" starts a project block and ends a
+# certification block). Skills come from the shared taxonomy index instead.
+SIMPLE_LINE_CLASSES = {
+    "education": ("degree", "bachelor", "master", "phd", "mba", "bsc", "msc", "ba", "bs", "ms",
+                  "university", "college", "school", "gpa"),
+    "project_start": ("project", "projects", "portfolio", "github"),
+    "project_end": ("education", "experience", "skills", "certification", "reference"),
+    "cert_start": ("certification", "certificate", "certified", "credential"),
+    "cert_end": ("education", "experience", "skills", "project", "reference"),
+    "summary": ("summary", "objective", "profile", "about me"),
+}
+
+# Line classes are bit flags so a line's classification is a single int
+EDUCATION, PROJECT_START, PROJECT_END, CERT_START, CERT_END, SUMMARY, EXPERIENCE = (
+    1 << bit for bit in range(7)
+)
+_CLASS_FLAGS = {
+    "education": EDUCATION, "project_start": PROJECT_START, "project_end": PROJECT_END,
+    "cert_start": CERT_START, "cert_end": CERT_END, "summary": SUMMARY,
+}
+
+
+def _build_token_flags(line_classes):
+    """Invert the class table into token -> OR of class flags."""
+    token_flags = {}
+    for line_class, tokens in line_classes.items():
+        for token in tokens:
+            token_flags[token] = token_flags.get(token, 0) | _CLASS_FLAGS[line_class]
+    return token_flags
+
+
+SIMPLE_TOKEN_FLAGS = _build_token_flags(SIMPLE_LINE_CLASSES)
+
+
+def _trie_alternation(tokens):
+    """Build a regex alternation for tokens factored by common prefix.
+
+    re tries alternatives one by one, so a prefix-factored alternation fails
+    after far fewer comparisons than a flat one at non-matching positions.
+    """
+    trie = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        if list(node) == ['']:
+            return ''
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: the longer token is tried first
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+# One pattern scans the whole text for newlines, date ranges (experience) and
+# class tokens; everything else is skipped inside the regex engine. The
+# lookahead lets most positions fail on a single character test.
+SIMPLE_LINE_PATTERN = re.compile(
+    r'\n|(?=[' + re.escape(''.join(sorted({token[0] for token in SIMPLE_TOKEN_FLAGS} | {'1', '2'}))) + r'])\b'
+    r'(?:(?P<date>(?:20\d\d|19\d\d)[-–—]?(?:20\d\d|19\d\d|present|current))'
+    r'|(?P<token>' + _trie_alternation(SIMPLE_TOKEN_FLAGS) + r'))\b'
+)
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+NAME_EXCLUDE_PATTERN = re.compile(r'@|www|\d{3}[-.]?\d{3}[-.]?\d{4}')
+
+
+def classify_lines(text):
+    """Return per-line class flags from one scan of the lowercased text."""
+    flags = [0]
+    for date, token in SIMPLE_LINE_PATTERN.findall(text.lower()):
+        if token:
+            flags[-1] |= SIMPLE_TOKEN_FLAGS[token]
+        elif date:
+            flags[-1] |= EXPERIENCE
+        else:
+            flags.append(0)
+    return flags
+
+
+def extract_sections_simple(resume_text):
+    """Simple fallback method to extract resume sections without AI.
+
+    Classifies every line in one scan and assigns it to sections with a small
+    state machine for the open-ended project and certification blocks.
+    Skills come from a separate taxonomy index pass, about half the run
+    time; benchmarks/bench_simple_extractor.py measures the classification
+    and assembly at about 2x the old multi-scan loops, the whole function
+    at about 1.5x.
+    """
+    sections = {}
+    lines = resume_text.split('\n')
+    line_flags = classify_lines(resume_text)
+    skills = extract_skill_names(resume_text)
+    
+    contact_lines = []
+    education_lines = []
+    experience_lines = []
+    project_lines = []
+    cert_lines = []
+    summary_lines = []
+    in_project_section = False
+    in_cert_section = False
+    
+    for i, (line, flags) in enumerate(zip(lines, line_flags)):
+        # Contact info is usually in the first 10 lines
+        if i < 10 and (EMAIL_PATTERN.search(line) or PHONE_PATTERN.search(line)):
+            contact_lines.append(line)
+        
+        if not flags and not (in_project_section or in_cert_section):
+            continue
+        
+        if flags & EDUCATION:
+            education_lines.append(line)
+        
+        # A date range starts a role; take it and up to 4 following non-empty lines
+        if flags & EXPERIENCE:
+            experience_lines.append(line)
+            experience_lines.extend(next_line for next_line in lines[i + 1:i + 5] if next_line.strip())
+        
+        if flags & PROJECT_START:
+            in_project_section = True
+            project_lines.append(line)
+        elif in_project_section and line.strip():
+            project_lines.append(line)
+            # End project section if we hit another major section
+            if flags & PROJECT_END:
+                in_project_section = False
+        
+        if flags & CERT_START:
+            in_cert_section = True
+            cert_lines.append(line)
+        elif in_cert_section and line.strip():
+            cert_lines.append(line)
+            # End certification section if we hit another major section
+            if flags & CERT_END:
+                in_cert_section = False
+        
+        # Summary headers are looked for near the top; the window of up to 4
+        # non-empty lines starts at the header line itself
+        if flags & SUMMARY and 1 <= i < 15:
+            summary_lines.append(line)
+            summary_lines.extend(next_line for next_line in lines[i:i + 4] if next_line.strip())
+    
+    # Add name (usually the first line)
+    if lines and lines[0].strip() and not NAME_EXCLUDE_PATTERN.search(lines[0]):
+        contact_lines.insert(0, lines[0].strip())
+    
+    if contact_lines:
+        sections["Personal Information"] = "\n".join(contact_lines)
+    if skills:
+        sections["Skills"] = ", ".join(sorted(skills))
+    if education_lines:
+        sections["Education"] = "\n".join(education_lines)
+    if experience_lines:
+        sections["Experience"] = "\n".join(experience_lines)
+    if project_lines:
+        sections["Projects"] = "\n".join(project_lines)
+    if cert_lines:
+        sections["Certifications"] = "\n".join(cert_lines)
+    if summary_lines:
+        sections["Summary"] = "\n".join(summary_lines)
+    
+    # If we still don't have much, just split the text into chunks
+    if len(sections) <= 2:
+        chunk_size = max(5, len(lines) // 5)  # Divide into roughly 5 sections
+        for i in range(0, len(lines), chunk_size):
+            section_name = f"Section {i//chunk_size + 1}"
+            sections[section_name] = "\n".join(lines[i:i+chunk_size])
+    
+    # Add empty strings for important missing sections
+    important_sections = [
+        "Personal Information", "Summary", "Skills", "Experience", 
+        "Education", "Projects", "Certifications"
+    ]
+    
+    for section in important_sections:
+        if section not in sections:
+            sections[section] = ""
+    
+    return sections
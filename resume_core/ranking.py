@@ -0,0 +1,245 @@
+"""Batch ranking of stored resumes against one job description.
+
+Every stored resume is reduced once to a sparse binary feature row: the
+skill ids it covers (the ones it mentions plus the broader skills those
+satisfy, see resume_core.skills) followed by the job-match keywords it
+contains (see resume_core.keywords). The rows are
+persisted to disk, so a resume is only downloaded and extracted the first
+time it is indexed, and stacked into a CSR matrix when ranking.
+
+A job description becomes a weight vector over the same columns, scaled
+so that the product of a row with it is the share of the job's skills
+(``SKILL_WEIGHT``) and keywords (``KEYWORD_WEIGHT``) the resume covers.
+Scoring every resume is then one sparse matrix-vector product, and the
+top k come off a heap. Matched and missing skills are only worked out
+for the rows that are shown.
+
+NumPy/SciPy are optional: without them the same scores are computed
+row by row in pure Python.
+"""
+import heapq
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+from resume_core.keywords import KEYWORD_VOCABULARY, keyword_vector
+from resume_core.skills import SKILL_SPECIALIZATIONS, canonical_skills, covered_skill_ids, skill_generalizations
+from resume_core.taxonomy import get_skill_index
+
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    from scipy import sparse
+    NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+FEATURE_STORE_VERSION = 1
+DEFAULT_TOP_K = 50
+# Minimum seconds between the batched saves of save_if_stale
+SAVE_INTERVAL = float(os.environ.get("RESUME_FEATURE_SAVE_INTERVAL", "30"))
+# Share of the score coming from skill coverage; keyword coverage makes up the rest
+SKILL_WEIGHT = 0.8
+KEYWORD_WEIGHT = 1 - SKILL_WEIGHT
+
+
+def feature_signature(index):
+    """Identify the column layout: rows built against another taxonomy, vocabulary or skill hierarchy are stale."""
+    vocabulary = KEYWORD_VOCABULARY + (json.dumps(SKILL_SPECIALIZATIONS, sort_keys=True),)
+    vocabulary_crc = zlib.crc32('\n'.join(vocabulary).encode('utf-8'))
+    return f"{FEATURE_STORE_VERSION}:{index.fingerprint():08x}:{vocabulary_crc:08x}"
+
+
+def skill_columns(text, index, generalizations=None):
+    """Sorted skill ids mentioned in the text, plus the broader ids they satisfy when given ``generalizations``."""
+    skill_ids = index.skill_ids(text)
+    if generalizations is not None:
+        skill_ids = covered_skill_ids(skill_ids, generalizations)
+    return sorted(skill_ids)
+
+
+def keyword_columns(text, index):
+    """Column ids of the vocabulary keywords present in the text."""
+    return [index.skill_count + position for position, count in enumerate(keyword_vector(text)) if count]
+
+
+def resume_features(text):
+    """Sparse binary feature row of a resume: sorted column ids."""
+    if not text:
+        return []
+    index = get_skill_index()
+    return skill_columns(text, index, skill_generalizations(index)) + keyword_columns(text, index)
+
+
+def job_weights(text):
+    """{column id: weight} for a job description; a row's dot product with it is its 0-1 coverage."""
+    if not text:
+        return {}
+    index = get_skill_index()
+    skills = skill_columns(text, index)
+    keywords = keyword_columns(text, index)
+    skill_share = SKILL_WEIGHT if keywords else 1.0
+    keyword_share = KEYWORD_WEIGHT if skills else 1.0
+    weights = {column: skill_share / len(skills) for column in skills}
+    weights.update((column, keyword_share / len(keywords)) for column in keywords)
+    return weights
+
+
+class FeatureStore:
+    """Sparse feature rows keyed by id, persisted as JSON and scored as a CSR matrix.
+
+    A row is a list of column ids (binary features) or of [column, weight]
+    pairs. Subclasses decide what a row and a query vector are.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        index = get_skill_index()
+        self.column_count = index.skill_count + len(KEYWORD_VOCABULARY)
+        self.signature = feature_signature(index)
+        self._rows = {}
+        self._matrix = None
+        self._ids = []
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as store_file:
+                    stored = json.load(store_file)
+                self._load(stored, stored.get('signature') == self.signature)
+            except (OSError, ValueError):
+                self._rows = {}
+
+    def _load(self, stored, current):
+        """Restore rows from disk; rows built for another column layout are dropped."""
+        self._rows = stored.get('rows', {}) if current else {}
+
+    def _payload(self):
+        return {'signature': self.signature, 'rows': self._rows}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, row_id):
+        return row_id in self._rows
+
+    def missing(self, row_ids):
+        """The given ids that have no feature row yet."""
+        return [row_id for row_id in row_ids if row_id not in self._rows]
+
+    def _set_row(self, row_id, row):
+        with self._lock:
+            self._rows[row_id] = row
+            self._matrix = None
+            self._dirty = True
+
+    def remove(self, row_id):
+        with self._lock:
+            if self._rows.pop(row_id, None) is not None:
+                self._matrix = None
+                self._dirty = True
+
+    def save(self):
+        """Write the store to disk atomically."""
+        with self._lock:
+            payload = json.dumps(self._payload())
+            self._dirty = False
+        store_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(store_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=store_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as store_file:
+                store_file.write(payload)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            self._dirty = True
+            raise
+        self._saved_at = time.monotonic()
+
+    def save_if_stale(self, interval=SAVE_INTERVAL):
+        """Save when rows changed and the last save is at least ``interval`` seconds old.
+
+        Batches the full rewrite across many adds. Rows added after the
+        last save are lost on a crash, but they show up in ``missing`` and
+        are simply indexed again.
+        """
+        if self._dirty and time.monotonic() - self._saved_at >= interval:
+            self.save()
+            return True
+        return False
+
+    def _snapshot(self):
+        """(row ids, CSR matrix or {column: weight} dicts) for the current rows, rebuilt only after changes."""
+        with self._lock:
+            if self._matrix is None:
+                self._ids = list(self._rows)
+                rows = [[entry if isinstance(entry, list) else (entry, 1.0) for entry in self._rows[row_id]]
+                        for row_id in self._ids]
+                if NUMPY_AVAILABLE:
+                    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+                    np.cumsum([len(row) for row in rows], out=indptr[1:])
+                    nonzero = int(indptr[-1])
+                    indices = np.fromiter((column for row in rows for column, _ in row), dtype=np.int32, count=nonzero)
+                    data = np.fromiter((weight for row in rows for _, weight in row), dtype=np.float32, count=nonzero)
+                    self._matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(rows), self.column_count))
+                else:
+                    self._matrix = [dict(row) for row in rows]
+            return self._ids, self._matrix
+
+    def top_k(self, weights, k):
+        """Top k (row id, score 0-100) of the rows against a {column: weight} query, best first."""
+        row_ids, matrix = self._snapshot()
+        if not weights or not row_ids:
+            return []
+        if NUMPY_AVAILABLE:
+            query = np.zeros(self.column_count, dtype=np.float32)
+            query[list(weights)] = list(weights.values())
+            scores = (matrix @ query).tolist()
+        else:
+            scores = [sum(weight * row.get(column, 0.0) for column, weight in weights.items()) for row in matrix]
+        top = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        return [(row_ids[row], round(100 * scores[row], 1)) for row in top]
+
+
+class ResumeRanker(FeatureStore):
+    """Binary feature rows of stored resumes, ranked against a job description."""
+
+    def add(self, file_id, text):
+        """Index (or re-index) one resume from its extracted text."""
+        self._set_row(file_id, resume_features(text))
+
+    def rank(self, job_text, k=DEFAULT_TOP_K):
+        """Top k (file id, score 0-100) for a job description, best first."""
+        return self.top_k(job_weights(job_text), k)
+
+    def explain(self, file_id, job_text):
+        """(matched, missing) job skill names for one indexed resume."""
+        row = set(self._rows.get(file_id, ()))
+        matched, missing = [], []
+        for skill_id, name in canonical_skills(job_text).items():
+            (matched if skill_id in row else missing).append(name)
+        return sorted(matched), sorted(missing)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(store_class, path):
+    """Return the process-wide store of a class for a path, loading it on first use."""
+    with _stores_lock:
+        store = _stores.get((store_class, path))
+        if store is None:
+            store = _stores[(store_class, path)] = store_class(path)
+        return store
+
+
+def get_resume_ranker(path):
+    """Return the process-wide resume ranker for a feature store path."""
+    return get_store(ResumeRanker, path)
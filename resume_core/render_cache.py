@@ -0,0 +1,155 @@
+"""On-disk cache of rendered resume PDFs.
+
+A render is keyed by a hash of its normalized inputs (sections, template
+name, the style options the renderer reads and RENDER_CACHE_VERSION), so
+the key doubles as an ETag: two renders with the same key produce the
+same PDF. Cached PDFs are files named after their key; the cache keeps
+the most recently used ones within a byte budget and evicts the least
+recently used first.
+Use order survives restarts through the files' modification times.
+
+Bump RENDER_CACHE_VERSION whenever the renderer's output changes.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from resume_core.rendering import style_options
+
+RENDER_CACHE_VERSION = 1
+RENDER_CACHE_BYTES = int(os.environ.get("RESUME_RENDER_CACHE_BYTES", str(256 * 1024 * 1024)))
+PDF_SUFFIX = ".pdf"
+
+
+def normalize_sections(sections):
+    """Sections with string contents and Unix newlines; the renderer ignores dict order."""
+    normalized = {}
+    for name, content in (sections or {}).items():
+        content = content if isinstance(content, str) else str(content)
+        normalized[str(name)] = content.replace('\r\n', '\n').replace('\r', '\n')
+    return normalized
+
+
+def render_key(sections, template_name, options=None):
+    """Hex digest identifying a render: its cache file name and ETag.
+
+    Only the options that change the PDF count, as the renderer resolves
+    them (``style_options``); the rest of a UI options dict
+    (include_qr, add_achievements, ...) does not split the cache.
+    """
+    payload = json.dumps([RENDER_CACHE_VERSION, template_name, list(style_options(options)),
+                          normalize_sections(sections)],
+                         sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """Byte-size-bounded LRU of rendered PDFs in a directory."""
+
+    def __init__(self, directory, max_bytes=RENDER_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> size in bytes, least recently used first
+        self._total = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + PDF_SUFFIX)
+
+    def _load(self):
+        """Index the PDFs already on disk, oldest modification first."""
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(PDF_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, file_name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, file_name[:-len(PDF_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._total += size
+        self._evict()
+
+    def get(self, key):
+        """Cached PDF bytes for a render key, or None.
+
+        A file whose size no longer matches the index (changed or
+        truncated outside the cache) is dropped rather than served.
+        """
+        with self._lock:
+            size = self._entries.get(key)
+            if size is None:
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as pdf_file:
+                pdf_bytes = pdf_file.read()
+            os.utime(path)
+        except OSError:
+            pdf_bytes = None
+        if pdf_bytes is None or len(pdf_bytes) != size:
+            self.discard(key)
+            return None
+        return pdf_bytes
+
+    def put(self, key, pdf_bytes):
+        """Store a rendered PDF (written atomically) and evict down to the byte budget."""
+        if len(pdf_bytes) > self.max_bytes:
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as pdf_file:
+                pdf_file.write(pdf_bytes)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        with self._lock:
+            self._total += len(pdf_bytes) - self._entries.pop(key, 0)
+            self._entries[key] = len(pdf_bytes)
+            self._evict()
+
+    def discard(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        size = self._entries.pop(key, None)
+        if size is None:
+            return
+        self._total -= size
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        while self._total > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    def stats(self):
+        """{'entries', 'bytes', 'max_bytes'} of the cache."""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._total, 'max_bytes': self.max_bytes}
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_render_cache(directory):
+    """Return the process-wide render cache for a directory, indexing it on first use."""
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = _caches[directory] = RenderCache(directory)
+        return cache
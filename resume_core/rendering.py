@@ -0,0 +1,198 @@
+"""ReportLab rendering of resume sections into PDF bytes.
+
+Paragraph styles depend only on the color scheme and font options, so
+each combination's style sheet is built once per process and shared by
+every render. Shared sheets are read-only: Paragraph never changes its
+style, and nothing here adds to or edits a sheet after it is built.
+"""
+import functools
+import io
+import re
+import types
+
+# UI option names -> ReportLab colors and built-in font families
+COLOR_SCHEMES = {
+    "Professional Blue": "#00008B",  # ReportLab's darkblue, the original look
+    "Modern Gray": "#4A4A4A",
+    "Bold Black": "#000000",
+    "Creative Green": "#006400",
+    "Elegant Purple": "#5B2A86",
+}
+FONT_FAMILIES = {  # (body font, heading font)
+    "Default": ("Helvetica", "Helvetica-Bold"),
+    "Modern": ("Helvetica", "Helvetica-Bold"),
+    "Classic": ("Times-Roman", "Times-Bold"),
+    "Elegant": ("Times-Italic", "Times-BoldItalic"),
+    "Bold": ("Helvetica-Bold", "Helvetica-Bold"),
+}
+DEFAULT_COLOR_SCHEME = "Professional Blue"
+DEFAULT_FONT = "Default"
+# Section order of the templates that list sections in a fixed order
+TEMPLATE_SECTIONS = ("Summary", "Skills", "Experience", "Education", "Projects", "Certifications")
+PROJECT_TEMPLATE_SECTIONS = ("Summary", "Skills", "Experience", "Education", "Certifications")
+
+
+def style_options(options):
+    """(color scheme, font) of render options, unknown names mapped to the defaults."""
+    options = options or {}
+    color_scheme = options.get("color_scheme")
+    font = options.get("font")
+    return (color_scheme if color_scheme in COLOR_SCHEMES else DEFAULT_COLOR_SCHEME,
+            font if font in FONT_FAMILIES else DEFAULT_FONT)
+
+
+@functools.lru_cache(maxsize=None)
+def get_style_sheet(color_scheme=DEFAULT_COLOR_SCHEME, font=DEFAULT_FONT):
+    """Read-only {style name: ParagraphStyle} for a color scheme and font, built once per process."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+
+    accent = colors.HexColor(COLOR_SCHEMES[color_scheme])
+    body_font, heading_font = FONT_FAMILIES[font]
+    sample = getSampleStyleSheet()
+    styles = {
+        'Name': ParagraphStyle(name='Name',
+                               parent=sample['Heading1'],
+                               fontName=heading_font,
+                               fontSize=24,
+                               spaceAfter=12,
+                               alignment=TA_CENTER,
+                               textColor=accent),
+        'ContactInfo': ParagraphStyle(name='ContactInfo',
+                                      parent=sample['Normal'],
+                                      fontName=body_font,
+                                      fontSize=10,
+                                      alignment=TA_CENTER,
+                                      spaceAfter=12),
+        'SectionHeader': ParagraphStyle(name='SectionHeader',
+                                        parent=sample['Heading2'],
+                                        fontName=heading_font,
+                                        fontSize=14,
+                                        spaceAfter=6,
+                                        textColor=accent,
+                                        borderWidth=1,
+                                        borderColor=accent,
+                                        borderPadding=5,
+                                        borderRadius=0),
+        'Content': ParagraphStyle(name='Content',
+                                  parent=sample['Normal'],
+                                  fontName=body_font,
+                                  fontSize=10,
+                                  spaceAfter=6),
+    }
+    return types.MappingProxyType(styles)
+
+
+def render_pdf_from_sections(sections, template_name, options=None, progress=None):
+    """Render resume sections to PDF bytes using the named template.
+
+    ``options`` may name a ``color_scheme`` and a ``font`` (see
+    COLOR_SCHEMES and FONT_FAMILIES). ``progress`` is an optional
+    ``callable(fraction)`` fed from ReportLab's build progress. Raises on
+    failure; callers in the UI report errors.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.units import inch
+    
+    buffer = io.BytesIO()
+    
+    # Set up the document with consistent margins
+    doc = SimpleDocTemplate(buffer, pagesize=letter, 
+                           leftMargin=0.75*inch, rightMargin=0.75*inch,
+                           topMargin=0.75*inch, bottomMargin=0.75*inch)
+    
+    styles = get_style_sheet(*style_options(options))
+    
+    # Build the document
+    elements = []
+    
+    # Add name if available (usually in contact info)
+    name = ""
+    if "Contact Information" in sections:
+        # Try to extract name from first line of contact info
+        name_line = sections["Contact Information"].split('\n')[0]
+        if not re.search(r'@|www|\d{3}[-.]?\d{3}[-.]?\d{4}', name_line):
+            name = name_line
+    
+    if name:
+        elements.append(Paragraph(name, styles['Name']))
+        elements.append(Spacer(1, 6))
+    
+    # Add contact information
+    if "Contact Information" in sections:
+        contact_info = sections["Contact Information"].replace('\n', ' | ')
+        elements.append(Paragraph(contact_info, styles['ContactInfo']))
+        elements.append(Spacer(1, 12))
+    
+    # Template-specific formatting
+    if template_name == "Minimalist":
+        # Clean, simple design with focus on content
+        for section in TEMPLATE_SECTIONS:
+            if section in sections and sections[section]:
+                elements.append(Paragraph(section.upper(), styles['SectionHeader']))
+                elements.append(Paragraph(sections[section].replace('\n', '<br/>'), styles['Content']))
+                elements.append(Spacer(1, 12))
+                
+    elif template_name == "ATS-Friendly":
+        # Optimized for Applicant Tracking Systems
+        for section in TEMPLATE_SECTIONS:
+            if section in sections and sections[section]:
+                elements.append(Paragraph(section.upper(), styles['SectionHeader']))
+                # Format content for ATS
+                content = sections[section].replace('\n', '<br/>')
+                if section == "Skills":
+                    # Format skills as bullet points for better ATS parsing
+                    skills_list = content.split(',')
+                    content = "<br/>".join(f"• {skill.strip()}" for skill in skills_list if skill.strip())
+                elements.append(Paragraph(content, styles['Content']))
+                elements.append(Spacer(1, 12))
+                
+    elif template_name == "Project-Focused":
+        # Highlights projects and technical skills
+        # First add Projects section if available
+        if "Projects" in sections and sections["Projects"]:
+            elements.append(Paragraph("PROJECTS", styles['SectionHeader']))
+            projects_text = sections["Projects"]
+            # Split by newlines and format each project
+            project_entries = projects_text.split('\n\n')
+            for entry in project_entries:
+                lines = entry.split('\n')
+                if lines:
+                    # First line as project title
+                    elements.append(Paragraph(lines[0], styles['SectionHeader']))
+                    if len(lines) > 1:
+                        # Remaining lines as project description
+                        project_desc = '<br/>'.join(lines[1:])
+                        elements.append(Paragraph(project_desc, styles['Content']))
+                elements.append(Spacer(1, 8))
+            elements.append(Spacer(1, 4))
+        
+        # Then add other sections
+        for section in PROJECT_TEMPLATE_SECTIONS:
+            if section in sections and sections[section]:
+                elements.append(Paragraph(section.upper(), styles['SectionHeader']))
+                elements.append(Paragraph(sections[section].replace('\n', '<br/>'), styles['Content']))
+                elements.append(Spacer(1, 12))
+    
+    # Build the PDF
+    if progress is not None:
+        doc.setProgressCallBack(_build_progress_reporter(progress))
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def _build_progress_reporter(progress):
+    """Adapt ReportLab's (kind, value) build callbacks to a 0-1 fraction."""
+    state = {'total': 0}
+
+    def report(kind, value):
+        if kind == 'SIZE_EST':
+            state['total'] = max(1, value)
+        elif kind == 'PROGRESS' and state['total']:
+            progress(min(1.0, value / state['total']))
+        elif kind == 'FINISHED':
+            progress(1.0)
+
+    return report
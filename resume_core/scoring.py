@@ -0,0 +1,209 @@
+"""Local (non-AI) resume scoring and improvement suggestions.
+
+Scores are recombined from per-section components (presence, length,
+keyword hits) that are cached by section content hash, so rescoring a
+resume after one section changed only recomputes that section's
+components.
+
+``score_batches`` scores many resumes at once: each batch becomes a
+section presence bitmask, a length vector and a keyword hit matrix, and
+every score column is computed from those with NumPy arithmetic (the
+same formulas as ``combine_scores``). NumPy is optional; without it each
+row goes through ``combine_scores``.
+"""
+import hashlib
+import itertools
+import os
+import threading
+from collections import OrderedDict
+
+from resume_core.model import ResumeDocument
+
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+# Sections whose presence drives the section score
+SCORE_KEY_SECTIONS = ('Personal Information', 'Summary', 'Skills', 'Experience', 'Education')
+# Keywords counted (as substrings) for keyword richness
+SCORE_KEYWORDS = ('experience', 'skill', 'project', 'develop', 'manage', 'create', 'team',
+                  'lead', 'analyze', 'implement', 'design', 'collaborate', 'achieve')
+OPTIMAL_CONTENT_LENGTH = 2000  # Assuming 2000 chars is optimal
+SCORE_COLUMNS = ('overall', 'ats_compatibility', 'content_quality', 'section_score', 'length_score',
+                 'keyword_score', 'format_score')
+SCORE_BATCH_SIZE = 4096
+# Per-section score components kept in the process-wide cache
+COMPONENT_CACHE_SIZE = int(os.environ.get("RESUME_SCORE_COMPONENT_CACHE_SIZE", "4096"))
+# Sections generate_improvement_suggestions reads
+SUGGESTION_SECTIONS = ('Personal Information', 'Summary', 'Skills', 'Experience', 'Education', 'Projects')
+
+
+def keyword_hits(text_lower):
+    """Return the SCORE_KEYWORDS that occur in the (lowercased) text."""
+    return frozenset(keyword for keyword in SCORE_KEYWORDS if keyword in text_lower)
+
+
+def combine_scores(present_sections, total_content, keyword_count):
+    """Turn the three score components into the score dict shown in the UI."""
+    section_score = min(100, (present_sections / len(SCORE_KEY_SECTIONS)) * 100)
+    length_score = min(100, (total_content / OPTIMAL_CONTENT_LENGTH) * 100)
+    keyword_score = min(100, (keyword_count / len(SCORE_KEYWORDS)) * 100)
+    
+    # Calculate ATS compatibility score
+    ats_score = (section_score * 0.5) + (keyword_score * 0.5)
+    
+    # Calculate content quality score (simplified)
+    content_score = (section_score * 0.4) + (length_score * 0.3) + (keyword_score * 0.3)
+    
+    # Calculate overall score
+    overall_score = int((ats_score * 0.5) + (content_score * 0.5))
+    
+    return {
+        'overall': overall_score,
+        'ats_compatibility': int(ats_score),
+        'content_quality': int(content_score),
+        'section_score': int(section_score),
+        'length_score': int(length_score),
+        'keyword_score': int(keyword_score),
+        'format_score': int(min(100, section_score + 10))  # Simplified format score
+    }
+
+
+_COMPONENT_CACHE = OrderedDict()
+_COMPONENT_CACHE_LOCK = threading.Lock()
+
+
+def section_components(content, lowercase=str.lower):
+    """(has content, length, keyword hits) of one section's text, cached by content hash.
+
+    ``lowercase(content)`` folds the text on a cache miss; pass a view of
+    a document's cached lowercase text to reuse it.
+    """
+    content = content if isinstance(content, str) else str(content)
+    key = hashlib.sha1(content.encode('utf-8')).digest()
+    with _COMPONENT_CACHE_LOCK:
+        components = _COMPONENT_CACHE.get(key)
+        if components is not None:
+            _COMPONENT_CACHE.move_to_end(key)
+            return components
+    components = (bool(content.strip()), len(content), keyword_hits(lowercase(content)))
+    with _COMPONENT_CACHE_LOCK:
+        _COMPONENT_CACHE[key] = components
+        if len(_COMPONENT_CACHE) > COMPONENT_CACHE_SIZE:
+            _COMPONENT_CACHE.popitem(last=False)
+    return components
+
+
+def combine_section_components(components):
+    """Score dict from {section name: section_components(...)}.
+
+    Keywords never contain spaces, so the union of per-section hits equals
+    the hits over the sections joined with spaces.
+    """
+    present_sections = sum(1 for name in SCORE_KEY_SECTIONS if name in components and components[name][0])
+    total_length = sum(length for _, length, _ in components.values())
+    hits = frozenset().union(*(section_hits for _, _, section_hits in components.values()))
+    return combine_scores(present_sections, total_length, len(hits))
+
+
+def calculate_resume_scores(sections):
+    """Calculate various scores for the resume based on content analysis"""
+    # A document's cached lowercase text is reused on a cache miss; a plain dict
+    # is lowercased directly, which is cheaper than looking a document up
+    if isinstance(sections, ResumeDocument):
+        return combine_section_components({
+            name: section_components(content, lambda _, name=name: sections.section_lower(name))
+            for name, content in sections.sections.items()})
+    return combine_section_components({name: section_components(content)
+                                       for name, content in (sections or {}).items()})
+
+
+def score_features(sections_batch):
+    """(presence bitmask, total lengths, keyword hit matrix) arrays for a list of sections dicts."""
+    presence = []
+    lengths = []
+    hits = []
+    for sections in sections_batch:
+        contents = [content if isinstance(content, str) else str(content) for content in sections.values()]
+        presence.extend(bool(str(sections.get(name) or "").strip()) for name in SCORE_KEY_SECTIONS)
+        lengths.append(sum(map(len, contents)))
+        text_lower = ' '.join(contents).lower()
+        hits.extend(keyword in text_lower for keyword in SCORE_KEYWORDS)
+    count = len(lengths)
+    return (np.array(presence, dtype=bool).reshape(count, len(SCORE_KEY_SECTIONS)),
+            np.array(lengths, dtype=np.int64),
+            np.array(hits, dtype=bool).reshape(count, len(SCORE_KEYWORDS)))
+
+
+def combine_score_matrices(presence, lengths, hits):
+    """``combine_scores`` over whole feature arrays: {score column: int array}."""
+    section_score = np.minimum(100, (presence.sum(axis=1) / len(SCORE_KEY_SECTIONS)) * 100)
+    length_score = np.minimum(100, (lengths / OPTIMAL_CONTENT_LENGTH) * 100)
+    keyword_score = np.minimum(100, (hits.sum(axis=1) / len(SCORE_KEYWORDS)) * 100)
+    ats_score = (section_score * 0.5) + (keyword_score * 0.5)
+    content_score = (section_score * 0.4) + (length_score * 0.3) + (keyword_score * 0.3)
+    columns = {
+        'overall': (ats_score * 0.5) + (content_score * 0.5),
+        'ats_compatibility': ats_score,
+        'content_quality': content_score,
+        'section_score': section_score,
+        'length_score': length_score,
+        'keyword_score': keyword_score,
+        'format_score': np.minimum(100, section_score.astype(np.int32) + 10),
+    }
+    return {name: column.astype(np.int32) for name, column in columns.items()}
+
+
+def score_batches(sections_iterable, batch_size=SCORE_BATCH_SIZE):
+    """Score an iterable (e.g. a generator) of sections dicts, yielding one {score column: values} per batch.
+
+    Only one batch is held in memory at a time. Values are int32 arrays
+    with NumPy, lists of ints without it.
+    """
+    iterator = iter(sections_iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        if NUMPY_AVAILABLE:
+            yield combine_score_matrices(*score_features(batch))
+        else:
+            rows = [calculate_resume_scores(sections) for sections in batch]
+            yield {name: [row[name] for row in rows] for name in SCORE_COLUMNS}
+
+
+def generate_improvement_suggestions(sections, scores):
+    """Generate personalized improvement suggestions based on resume content and scores"""
+    suggestions = []
+    
+    # Check for missing sections
+    for section in SUGGESTION_SECTIONS:
+        if not sections.get(section, '').strip():
+            suggestions.append(f"<strong>Add a {section} section</strong> to your resume. This is a critical section that recruiters look for.")
+    
+    # Check content quality
+    if scores['content_quality'] < 70:
+        suggestions.append("<strong>Enhance your content quality</strong> by adding more specific achievements and quantifiable results to your experience section.")
+    
+    # Check ATS compatibility
+    if scores['ats_compatibility'] < 70:
+        suggestions.append("<strong>Improve ATS compatibility</strong> by including more industry-specific keywords relevant to your target positions.")
+    
+    # Check for skills section quality
+    skills = sections.get('Skills', '')
+    if len(skills) < 100:
+        suggestions.append("<strong>Expand your skills section</strong> with both technical and soft skills relevant to your industry.")
+    
+    # Check for summary quality
+    summary = sections.get('Summary', '')
+    if len(summary) < 200:
+        suggestions.append("<strong>Enhance your professional summary</strong> with a compelling statement that highlights your unique value proposition.")
+    
+    # If no suggestions were generated, add a generic one
+    if not suggestions:
+        suggestions.append("<strong>Continue refining your resume</strong> by tailoring it to specific job descriptions and highlighting relevant achievements.")
+    
+    return suggestions
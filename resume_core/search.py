@@ -0,0 +1,212 @@
+"""Persistent inverted index over stored resumes for term, skill and phrase search.
+
+Each stored file is tokenized once (with the taxonomy tokenizer) into a
+posting per term: the file id plus the token positions where the term
+occurs. Skill mentions get postings too, under ``skill:<skill id>``,
+so a search for "k8s" finds resumes that only say "Kubernetes". The index
+lives in an SQLite file, so adding one file touches only that file's
+postings and nothing is rebuilt on startup.
+
+Queries are boolean over terms and quoted phrases::
+
+    kubernetes "machine learning" -java OR rust
+
+Terms within a clause are ANDed, ``NOT``/``-`` excludes, and ``OR``
+separates clauses. Phrases are checked against the stored positions.
+"""
+import bisect
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import defaultdict
+
+from resume_core.taxonomy import TOKEN_PATTERN, get_skill_index
+
+INDEX_SCHEMA_VERSION = 1
+SKILL_TERM_PREFIX = "skill:"
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, indexed_at TEXT);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file_id);
+"""
+
+
+def _pack(positions):
+    return array('I', positions).tobytes()
+
+
+def _unpack(blob):
+    positions = array('I')
+    positions.frombytes(blob)
+    return positions
+
+
+def document_postings(text):
+    """{term: [token positions]} for a document, including skill:<skill id> terms."""
+    matches = list(TOKEN_PATTERN.finditer(text.lower()))
+    postings = defaultdict(list)
+    for position, match in enumerate(matches):
+        postings[match.group()].append(position)
+
+    starts = [match.start() for match in matches]
+    for start, _, skill_id in get_skill_index().find_all(text):
+        postings[SKILL_TERM_PREFIX + str(skill_id)].append(bisect.bisect_left(starts, start))
+    return postings
+
+
+def parse_query(query):
+    """Parse a query into OR-clauses of (negated, [tokens]) items."""
+    clauses = [[]]
+    negate_next = False
+    for match in QUERY_PATTERN.finditer(query):
+        phrase, word = match.groups()
+        if word == 'OR':
+            clauses.append([])
+            continue
+        if word == 'NOT':
+            negate_next = True
+            continue
+        negated = negate_next
+        if word and word.startswith('-') and len(word) > 1:
+            negated, word = True, word[1:]
+        tokens = TOKEN_PATTERN.findall((phrase if phrase is not None else word).lower())
+        if tokens:
+            clauses[-1].append((negated, tokens))
+        negate_next = False
+    return [clause for clause in clauses if clause]
+
+
+class ResumeSearchIndex:
+    """Inverted index of stored resumes, backed by SQLite."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+            # Skill ids depend on the taxonomy: a different one invalidates every skill posting
+            signature = f"{INDEX_SCHEMA_VERSION}:{get_skill_index().fingerprint():08x}"
+            stored = self._connection.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+            if stored is None or stored[0] != signature:
+                self._connection.execute("DELETE FROM files")
+                self._connection.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (signature,))
+
+    def add(self, file_name, text):
+        """Index (or re-index) one file from its extracted text."""
+        postings = document_postings(text or "")
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM files WHERE name = ?", (file_name,))
+            file_id = self._connection.execute(
+                "INSERT INTO files (name, indexed_at) VALUES (?, ?)",
+                (file_name, time.strftime("%Y-%m-%d %H:%M:%S"))).lastrowid
+            self._connection.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?)",
+                ((term, file_id, _pack(positions)) for term, positions in postings.items()))
+
+    def remove(self, file_name):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM files WHERE name = ?", (file_name,))
+
+    def indexed_files(self):
+        """Names of every indexed file."""
+        with self._lock:
+            return {name for (name,) in self._connection.execute("SELECT name FROM files")}
+
+    def missing(self, file_names):
+        """The given file names that are not indexed yet."""
+        indexed = self.indexed_files()
+        return [name for name in file_names if name not in indexed]
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def _postings(self, term):
+        """{file id: positions} for one term."""
+        with self._lock:
+            rows = self._connection.execute("SELECT file_id, positions FROM postings WHERE term = ?", (term,))
+            return {file_id: _unpack(blob) for file_id, blob in rows}
+
+    def _phrase_files(self, tokens):
+        """File ids containing the tokens as consecutive positions."""
+        first = self._postings(tokens[0])
+        if len(tokens) == 1:
+            return set(first)
+        candidates = first
+        for offset, token in enumerate(tokens[1:], 1):
+            postings = self._postings(token)
+            next_candidates = {}
+            for file_id, starts in candidates.items():
+                if file_id in postings:
+                    following = set(postings[file_id])
+                    starts = [start for start in starts if start + offset in following]
+                    if starts:
+                        next_candidates[file_id] = starts
+            candidates = next_candidates
+            if not candidates:
+                break
+        return set(candidates)
+
+    def _item_files(self, tokens):
+        """Files matching a term or phrase, literally or as a taxonomy skill alias."""
+        files = self._phrase_files(tokens)
+        skill_id = get_skill_index().lookup(' '.join(tokens))
+        if skill_id is not None:
+            files |= set(self._postings(SKILL_TERM_PREFIX + str(skill_id)))
+        return files
+
+    def search(self, query):
+        """Names of the files matching a boolean/phrase query, sorted."""
+        matched = set()
+        all_files = None
+        for clause in parse_query(query):
+            included = None
+            excluded = set()
+            for negated, tokens in clause:
+                files = self._item_files(tokens)
+                if negated:
+                    excluded |= files
+                else:
+                    included = files if included is None else included & files
+            if included is None:
+                if all_files is None:
+                    with self._lock:
+                        all_files = {file_id for (file_id,) in self._connection.execute("SELECT id FROM files")}
+                included = all_files
+            matched |= included - excluded
+        if not matched:
+            return []
+        with self._lock:
+            rows = self._connection.execute("SELECT id, name FROM files")
+            return sorted(name for file_id, name in rows if file_id in matched)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(path):
+    """Return the process-wide search index for a path, opening it on first use."""
+    with _indexes_lock:
+        search_index = _indexes.get(path)
+        if search_index is None:
+            search_index = _indexes[path] = ResumeSearchIndex(path)
+        return search_index
@@ -0,0 +1,206 @@
+"""Hashed n-gram vectors for model-free text similarity.
+
+A text becomes a fixed-width sparse vector: its character 3- and 4-grams
+(over the lowercased, punctuation-collapsed text) and its word unigrams
+and bigrams are hashed into ``2 ** VECTOR_BITS`` signed buckets, weighted
+``1 + log(count)`` and L2-normalized. Character n-grams make
+"microservices", "micro-services" and "microservice" or "develop",
+"developer" and "development" land close together without a stemmer or
+synonym list; word bigrams keep some phrase order.
+
+Vectors are cached per text hash, so comparing a resume against many
+postings (or the reverse) vectorizes each document once, and cosine
+similarity of two cached vectors is a sorted-index intersection.
+``batch_similarity`` scores one vector against many in a single NumPy
+pass for ranking.
+
+NumPy is optional: without it vectors are {bucket: weight} dicts built
+with the same hash, so scores are identical, only slower.
+"""
+import hashlib
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+
+from resume_core.model import EXPERIENCE_SECTIONS
+
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+VECTOR_BITS = int(os.environ.get("RESUME_NGRAM_VECTOR_BITS", "18"))
+CHAR_NGRAMS = (3, 4)
+WORD_NGRAMS = (1, 2)
+# Word n-grams use their own seeds so they never collide systematically with character n-grams
+WORD_SEED_OFFSET = 16
+NON_WORD_PATTERN = re.compile(r'[^\w+#]+')
+VECTOR_CACHE_SIZE = 512
+# (name, resume sections, job features) compared by section_similarities
+SECTION_PAIRS = (
+    ('summary_vs_responsibilities', ("Summary",), ("Job Responsibilities",)),
+    ('experience_vs_requirements', EXPERIENCE_SECTIONS, ("Required Experience", "Required Skills")),
+)
+
+_MASK64 = (1 << 64) - 1
+_PRIME = 1099511628211
+_MIX_SEED = 0x9E3779B97F4A7C15
+_MIX_MULTIPLIER = 0xBF58476D1CE4E5B9
+
+
+def normalize_text(text):
+    """Lowercased text with every run of punctuation and whitespace collapsed to one space, padded."""
+    return ' ' + NON_WORD_PATTERN.sub(' ', (text or "").lower()).strip() + ' '
+
+
+def _mix(value, seed):
+    value = ((value ^ (seed * _MIX_SEED)) * _MIX_MULTIPLIER) & _MASK64
+    return value ^ (value >> 29)
+
+
+def _python_hashes(codes, n, seed):
+    """Mixed 64-bit hashes of every n-gram of a code sequence."""
+    hashes = []
+    for start in range(len(codes) - n + 1):
+        value = 0
+        for code in codes[start:start + n]:
+            value = (value * _PRIME + code) & _MASK64
+        hashes.append(_mix(value, seed))
+    return hashes
+
+
+def _numpy_hashes(codes, n, seed):
+    """``_python_hashes`` for a uint64 code array, computed with wrapping uint64 arithmetic."""
+    count = len(codes) - n + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    values = np.zeros(count, dtype=np.uint64)
+    for offset in range(n):
+        values = values * np.uint64(_PRIME) + codes[offset:offset + count]
+    values ^= np.uint64((seed * _MIX_SEED) & _MASK64)
+    values *= np.uint64(_MIX_MULTIPLIER)
+    return values ^ (values >> np.uint64(29))
+
+
+def _word_codes(text):
+    return [zlib.crc32(word.encode('utf-8')) for word in text.split()]
+
+
+def _finish(buckets):
+    """{bucket: signed count} -> L2-normalized {bucket: 1 + log|count|} with the count's sign."""
+    weights = {bucket: math.copysign(1 + math.log(abs(count)), count) for bucket, count in buckets.items() if count}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {bucket: weight / norm for bucket, weight in weights.items()} if norm else {}
+
+
+def _python_vector(text):
+    buckets = Counter()
+    mask = (1 << VECTOR_BITS) - 1
+    char_codes = [ord(character) for character in text]
+    word_codes = _word_codes(text)
+    groups = [(char_codes, n, n) for n in CHAR_NGRAMS] + [(word_codes, n, WORD_SEED_OFFSET + n) for n in WORD_NGRAMS]
+    for codes, n, seed in groups:
+        for value in _python_hashes(codes, n, seed):
+            buckets[value & mask] += -1 if value >> 63 else 1
+    return _finish(buckets)
+
+
+def _numpy_vector(text):
+    char_codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    word_codes = np.array(_word_codes(text), dtype=np.uint64)
+    hashes = np.concatenate([_numpy_hashes(char_codes, n, n) for n in CHAR_NGRAMS]
+                            + [_numpy_hashes(word_codes, n, WORD_SEED_OFFSET + n) for n in WORD_NGRAMS])
+    if not len(hashes):
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    buckets = (hashes & np.uint64((1 << VECTOR_BITS) - 1)).astype(np.int32)
+    signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+    indices, inverse = np.unique(buckets, return_inverse=True)
+    counts = np.bincount(inverse, weights=signs)
+    nonzero = counts != 0
+    indices, counts = indices[nonzero], counts[nonzero]
+    weights = np.copysign(1 + np.log(np.abs(counts)), counts)
+    norm = np.sqrt(np.dot(weights, weights))
+    if not norm:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    return indices, (weights / norm).astype(np.float32)
+
+
+_VECTOR_CACHE = OrderedDict()
+_VECTOR_CACHE_LOCK = threading.Lock()
+
+
+def text_vector(text):
+    """Hashed n-gram vector of a text, cached by content hash.
+
+    With NumPy a vector is (sorted int32 bucket indices, float32 weights);
+    without it, a {bucket: weight} dict.
+    """
+    key = hashlib.sha1((text or "").encode('utf-8')).digest()
+    with _VECTOR_CACHE_LOCK:
+        vector = _VECTOR_CACHE.get(key)
+        if vector is not None:
+            _VECTOR_CACHE.move_to_end(key)
+            return vector
+    normalized = normalize_text(text)
+    vector = _numpy_vector(normalized) if NUMPY_AVAILABLE else _python_vector(normalized)
+    with _VECTOR_CACHE_LOCK:
+        _VECTOR_CACHE[key] = vector
+        if len(_VECTOR_CACHE) > VECTOR_CACHE_SIZE:
+            _VECTOR_CACHE.popitem(last=False)
+    return vector
+
+
+def cosine(first, second):
+    """Cosine similarity (-1 to 1) of two text vectors."""
+    if NUMPY_AVAILABLE:
+        if not len(first[0]) or not len(second[0]):
+            return 0.0
+        positions = np.minimum(np.searchsorted(second[0], first[0]), len(second[0]) - 1)
+        shared = second[0][positions] == first[0]
+        return float(np.dot(first[1][shared], second[1][positions[shared]]))
+    if len(first) > len(second):
+        first, second = second, first
+    return sum(weight * second.get(bucket, 0.0) for bucket, weight in first.items())
+
+
+def text_similarity(first, second):
+    """Cosine similarity (0-1) of two texts; 0 when either is empty."""
+    return max(0.0, cosine(text_vector(first), text_vector(second)))
+
+
+def batch_similarity(query, vectors):
+    """Cosine similarity of one text vector against many, in order."""
+    if not NUMPY_AVAILABLE:
+        return [cosine(query, vector) for vector in vectors]
+    if not vectors:
+        return []
+    dense = np.zeros(1 << VECTOR_BITS, dtype=np.float32)
+    dense[query[0]] = query[1]
+    lengths = np.fromiter((len(indices) for indices, _ in vectors), dtype=np.int64, count=len(vectors))
+    rows = np.repeat(np.arange(len(vectors)), lengths)
+    indices = np.concatenate([indices for indices, _ in vectors])
+    weights = np.concatenate([weights for _, weights in vectors])
+    return np.bincount(rows, weights=weights * dense[indices], minlength=len(vectors)).tolist()
+
+
+def _joined(mapping, names):
+    parts = []
+    for name in names:
+        value = mapping.get(name) or ""
+        parts.append('\n'.join(map(str, value)) if isinstance(value, (list, tuple)) else str(value))
+    return '\n'.join(part for part in parts if part.strip())
+
+
+def section_similarities(resume_sections, job_features):
+    """{pair name: 0-100 similarity} for the SECTION_PAIRS; None where either side is missing."""
+    similarities = {}
+    for name, resume_names, job_names in SECTION_PAIRS:
+        resume_text = _joined(resume_sections or {}, resume_names)
+        job_text = _joined(job_features or {}, job_names)
+        similarities[name] = int(round(100 * text_similarity(resume_text, job_text))) if resume_text and job_text else None
+    return similarities
@@ -0,0 +1,108 @@
+"""Local skill extraction from free text.
+
+All extractors share the skill taxonomy index (see resume_core.taxonomy):
+one tokenized pass over the text finds every skill name and alias, so
+extraction cost grows with the text, not with the number of skills. The
+same pass yields the position of each mention (find_skill_mentions) and
+per-skill mention counts (count_skills).
+"""
+from collections import Counter
+
+from resume_core.model import SkillSet
+from resume_core.taxonomy import get_skill_index
+
+
+def extract_skill_names(text):
+    """Canonical names of the taxonomy skills mentioned in the text."""
+    if not text:
+        return set()
+    return get_skill_index().skill_names(text)
+
+
+def find_skill_mentions(text):
+    """(start, end, canonical name) for every skill mention, positions into the lowercased text."""
+    if not text:
+        return []
+    index = get_skill_index()
+    return [(start, end, index.name(skill_id)) for start, end, skill_id in index.find_all(text)]
+
+
+def count_skills(text):
+    """Counter of mentions per canonical skill name in the text."""
+    if not text:
+        return Counter()
+    index = get_skill_index()
+    return Counter({index.name(skill_id): count for skill_id, count in index.count(text).items()})
+
+
+def extract_enhanced_skills(text):
+    """Extract skills from text using a more sophisticated approach"""
+    return list(extract_skill_names(text))
+
+
+# Specific skills that also satisfy a broader requirement, as {broader
+# skill: [more specific skills]}. The relation is one way: MySQL meets a
+# "SQL" requirement, but SQL does not meet "MySQL" and MySQL does not meet
+# "PostgreSQL". Spellings of one skill are aliases in the taxonomy already
+# (and terms the taxonomy does not know are ignored).
+SKILL_SPECIALIZATIONS = {
+    "sql": ["mysql", "postgresql", "sql server", "sqlite", "oracle"],
+    "nosql": ["mongodb", "cassandra", "dynamodb", "redis", "neo4j"],
+}
+
+
+def build_skill_generalizations(index, specializations=SKILL_SPECIALIZATIONS):
+    """Map skill id -> frozenset of the broader skill ids it also satisfies."""
+    broader = {}
+    for term, specific_terms in specializations.items():
+        broad_id = index.lookup(term)
+        if broad_id is None:
+            continue
+        for skill_id in map(index.lookup, specific_terms):
+            if skill_id is not None and skill_id != broad_id:
+                broader.setdefault(skill_id, set()).add(broad_id)
+    return {skill_id: frozenset(ids) for skill_id, ids in broader.items()}
+
+
+_skill_generalizations = {}
+
+
+def skill_generalizations(index):
+    """The generalization map of an index, built once per index file."""
+    generalizations = _skill_generalizations.get(index.path)
+    if generalizations is None:
+        generalizations = _skill_generalizations[index.path] = build_skill_generalizations(index)
+    return generalizations
+
+
+def covered_skill_ids(skill_ids, generalizations):
+    """Requirement ids a set of skills satisfies: the skills plus everything they generalize to."""
+    covered = set(skill_ids)
+    for skill_id in skill_ids:
+        covered.update(generalizations.get(skill_id, ()))
+    return covered
+
+
+def canonical_skills(text):
+    """Skills mentioned in the text as {skill id: canonical name}."""
+    return SkillSet.from_text(text).names()
+
+
+def match_skill_ids(resume_ids, job_ids):
+    """(resume skill ids meeting a job requirement, job skill ids no resume skill meets)."""
+    generalizations = skill_generalizations(get_skill_index())
+    job_ids = set(job_ids)
+    matched = {skill_id for skill_id in resume_ids
+               if skill_id in job_ids or generalizations.get(skill_id, frozenset()) & job_ids}
+    return matched, job_ids - covered_skill_ids(resume_ids, generalizations)
+
+
+def match_skills(resume_text, job_text):
+    """Compare resume and job skills by skill id.
+
+    Returns (matched resume skills, missing job skills, job skill count).
+    """
+    resume = canonical_skills(resume_text)
+    job = canonical_skills(job_text)
+    matched, missing = match_skill_ids(resume, job)
+    return sorted(resume[skill_id] for skill_id in matched), sorted(job[skill_id] for skill_id in missing), len(job)
@@ -0,0 +1,144 @@
+"""Local, deterministic tailoring of resume sections to a job description.
+
+Everything is driven by the taxonomy index's skill mentions (see
+resume_core.taxonomy) and the shared match artifact (see
+resume_core.matching):
+
+- Summary: leads with the job's skills the resume already shows
+- Skills: the job's missing skills are appended, in the list's own style
+- Experience: within each role, bullets are reordered so the ones naming
+  the job's skills and terms come first
+
+Highlighting the job's skills for display finds the mentions with the
+taxonomy index (aliases and whole tokens included) and wraps them in one
+regular-expression pass. The index scan dominates its cost, so for a
+handful of skills it is slower than the chained str.replace calls it
+replaced; it is kept for its output, not its speed. No model is called.
+"""
+import functools
+import html
+import re
+
+from resume_core.matching import get_match_artifact, match_tokens
+from resume_core.model import BULLET_PATTERN, EXPERIENCE_SECTIONS
+from resume_core.skills import canonical_skills, covered_skill_ids, skill_generalizations
+from resume_core.taxonomy import get_skill_index
+
+SUMMARY_SKILL_COUNT = 3
+
+
+def _join_names(names):
+    return names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def tailor_summary(summary, matched_skills):
+    """Summary led by a sentence naming the job skills the resume shows."""
+    if not matched_skills:
+        return summary
+    lead = f"Professional with hands-on experience in {_join_names(matched_skills[:SUMMARY_SKILL_COUNT])}."
+    return f"{lead} {summary.strip()}" if summary.strip() else lead
+
+
+def tailor_skills(skills_text, missing_skills):
+    """Skills list with the missing job skills appended, one per line or comma separated like the list."""
+    if not missing_skills:
+        return skills_text
+    if not skills_text.strip():
+        return ", ".join(missing_skills)
+    if '\n' in skills_text.strip() and ',' not in skills_text:
+        bullet = BULLET_PATTERN.match(skills_text.strip().splitlines()[-1])
+        prefix = bullet.group() if bullet else ""
+        return skills_text.rstrip() + '\n' + '\n'.join(prefix + skill for skill in missing_skills)
+    return skills_text.rstrip().rstrip(',') + ", " + ", ".join(missing_skills)
+
+
+def bullet_relevance(line, job_skill_ids, job_terms, index, generalizations):
+    """(job skills met, job terms used) by one line; higher sorts first."""
+    skills = covered_skill_ids(index.skill_ids(line), generalizations) & job_skill_ids
+    return len(skills), len(set(match_tokens(line)) & job_terms)
+
+
+def reorder_bullets(text, job_skill_ids, job_terms):
+    """Experience text with each role's consecutive bullets sorted by relevance to the job.
+
+    Non-bullet lines (role headers, blank lines) stay where they are; the
+    sort is stable, so equally relevant bullets keep their order.
+    """
+    index = get_skill_index()
+    generalizations = skill_generalizations(index)
+    lines = text.split('\n')
+    reordered = []
+    run = []
+    for line in lines + [None]:
+        if line is not None and BULLET_PATTERN.match(line):
+            run.append(line)
+            continue
+        if run:
+            reordered.extend(sorted(
+                run, key=lambda bullet: bullet_relevance(bullet, job_skill_ids, job_terms, index, generalizations),
+                reverse=True))
+            run = []
+        if line is not None:
+            reordered.append(line)
+    return '\n'.join(reordered)
+
+
+def _original_offsets(text, lower):
+    """Map offsets into ``lower`` (text.lower()) back to offsets into ``text``.
+
+    They differ only after a character that lowercases to several ("İ"
+    becomes "i" plus a combining dot); None when the lengths match.
+    """
+    if len(lower) == len(text):
+        return None
+    offsets = []
+    for position, char in enumerate(text):
+        offsets.extend([position] * len(char.lower()))
+    offsets.append(len(text))
+    return offsets
+
+
+@functools.lru_cache(maxsize=64)
+def _highlight_pattern(terms):
+    alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf'(?<![\w+#])(?:{alternatives})(?![\w+#])', re.IGNORECASE)
+
+
+def highlight_skills(text, job_skill_ids, tag="strong"):
+    """HTML-escaped text with every mention of the job's skills wrapped in ``tag``.
+
+    The mentions come from the taxonomy index; their spellings, sliced
+    from the original text, are then substituted case-insensitively in a
+    single regular-expression pass.
+    """
+    index = get_skill_index()
+    generalizations = skill_generalizations(index)
+    # find_all positions refer to the lowercased text
+    offsets = _original_offsets(text, text.lower())
+    terms = frozenset(html.escape(text[start:end] if offsets is None else text[offsets[start]:offsets[end]])
+                      for start, end, skill_id in index.find_all(text)
+                      if covered_skill_ids((skill_id,), generalizations) & job_skill_ids)
+    escaped = html.escape(text)
+    if not terms:
+        return escaped
+    return _highlight_pattern(terms).sub(lambda match: f"<{tag}>{match.group()}</{tag}>", escaped)
+
+
+def tailor_resume(sections, job_description):
+    """Tailored Summary, Skills and experience sections for a job, plus the job's canonical skill ids.
+
+    Returns (tailored sections, job skill ids); only sections present in
+    the resume are tailored.
+    """
+    artifact = get_match_artifact(sections, job_description)
+    job_skill_ids = frozenset(canonical_skills(job_description))
+    tailored = {}
+    if 'Summary' in sections:
+        tailored['Summary'] = tailor_summary(sections['Summary'], artifact['matched_skills'])
+    if 'Skills' in sections:
+        tailored['Skills'] = tailor_skills(sections['Skills'], artifact['missing_skills'])
+    job_terms = frozenset(match_tokens(job_description))
+    for name in EXPERIENCE_SECTIONS:
+        if sections.get(name):
+            tailored[name] = reorder_bullets(sections[name], job_skill_ids, job_terms)
+    return tailored, job_skill_ids
@@ -0,0 +1,290 @@
+"""Skill taxonomy compiled into a memory-mapped binary index.
+
+The taxonomy is a CSV file (``skill,category,aliases`` with aliases
+separated by ``|``) that can hold tens of thousands of skills. It is
+compiled once into a compact binary index; every server and worker process
+memory-maps the same file, so the operating system shares one copy of the
+pages between them and nothing is parsed at startup.
+
+Index layout (little-endian):
+
+    header      magic, version, counts and section offsets
+    strings     UTF-8 blob holding skill names, category names and terms
+    skills      (name offset, name length, category id) per skill
+    categories  (name offset, name length) per category
+    table       open-addressing hash table of normalized terms
+
+A term is a skill name or alias normalized to space-joined tokens (see
+``term_tokens``). Every proper token prefix of a term is stored as well,
+flagged as a prefix, so text is matched one token at a time: a lookup miss
+on the first token ends the attempt at that position. Matching therefore
+costs O(tokens in the text) regardless of how many skills the taxonomy has.
+"""
+import csv
+import functools
+from collections import Counter
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import zlib
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "data", "skills.csv")
+# Both can be overridden per deployment
+TAXONOMY_PATH_ENV = "RESUME_SKILL_TAXONOMY"
+INDEX_PATH_ENV = "RESUME_SKILL_INDEX"
+
+INDEX_MAGIC = b"RSKI"
+INDEX_VERSION = 1
+HEADER = struct.Struct('<4sIIIIIIIII')
+SKILL_RECORD = struct.Struct('<IHH')
+CATEGORY_RECORD = struct.Struct('<IH2x')
+SLOT = struct.Struct('<IIHHI')
+TERM, PREFIX = 1, 2
+NO_SKILL = 0xFFFFFFFF
+# Bounded per-process cache of recent token lookups; text vocabulary is
+# Zipfian, so a few thousand entries absorb most probes
+PROBE_CACHE_SIZE = 8192
+
+# Words, optionally followed by + or # (c++, c#), and the punctuation that
+# joins compound skills (node.js, ci/cd, full-stack, r&d) as separate tokens
+TOKEN_PATTERN = re.compile(r"\w+[+#]*|[./\-&]")
+
+
+def term_tokens(text):
+    """Normalized tokens of a skill name, alias or text span."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_term(text):
+    """The key a skill name or alias is stored under."""
+    return ' '.join(term_tokens(text))
+
+
+def load_taxonomy(path):
+    """Read the taxonomy CSV into a list of (skill, category, aliases)."""
+    entries = []
+    with open(path, newline='', encoding='utf-8') as taxonomy_file:
+        for row in csv.DictReader(taxonomy_file):
+            skill = (row.get('skill') or '').strip()
+            if not skill:
+                continue
+            aliases = [alias.strip() for alias in (row.get('aliases') or '').split('|') if alias.strip()]
+            entries.append((skill, (row.get('category') or '').strip(), aliases))
+    return entries
+
+
+def compile_index(taxonomy_path, index_path):
+    """Compile a taxonomy CSV into a binary index file (written atomically)."""
+    entries = load_taxonomy(taxonomy_path)
+
+    strings = bytearray()
+    string_offsets = {}
+
+    def intern(text):
+        encoded = text.encode('utf-8')
+        if encoded not in string_offsets:
+            string_offsets[encoded] = len(strings)
+            strings.extend(encoded)
+        return string_offsets[encoded], len(encoded)
+
+    categories = {}
+    skill_records = []
+    terms = {}
+    for skill_id, (skill, category, aliases) in enumerate(entries):
+        category_id = categories.setdefault(category, len(categories))
+        skill_records.append((*intern(skill), category_id))
+        for term in [skill] + aliases:
+            tokens = term_tokens(term)
+            if not tokens:
+                continue
+            # The first skill to claim a term keeps it
+            flags, _ = terms.get(' '.join(tokens), (0, NO_SKILL))
+            if not flags & TERM:
+                terms[' '.join(tokens)] = (flags | TERM, skill_id)
+            for length in range(1, len(tokens)):
+                prefix = ' '.join(tokens[:length])
+                flags, owner = terms.get(prefix, (0, NO_SKILL))
+                terms[prefix] = (flags | PREFIX, owner)
+    category_records = [intern(name) for name in categories]
+    max_tokens = max((len(term.split(' ')) for term in terms), default=1)
+
+    # Power-of-two table at most half full keeps probe chains short
+    slot_count = 1
+    while slot_count < max(2, 2 * len(terms)):
+        slot_count *= 2
+    slots = [None] * slot_count
+    for term, (flags, skill_id) in terms.items():
+        encoded = term.encode('utf-8')
+        term_hash = zlib.crc32(encoded)
+        slot = term_hash & (slot_count - 1)
+        while slots[slot] is not None:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = (term_hash, *intern(term), flags, skill_id)
+
+    strings_offset = HEADER.size
+    skills_offset = strings_offset + len(strings)
+    categories_offset = skills_offset + SKILL_RECORD.size * len(skill_records)
+    table_offset = categories_offset + CATEGORY_RECORD.size * len(category_records)
+
+    blob = bytearray(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(skill_records), len(category_records),
+                                 slot_count, max_tokens, strings_offset, skills_offset, categories_offset,
+                                 table_offset))
+    blob += strings
+    for record in skill_records:
+        blob += SKILL_RECORD.pack(*record)
+    for record in category_records:
+        blob += CATEGORY_RECORD.pack(*record)
+    empty_slot = SLOT.pack(0, 0, 0, 0, NO_SKILL)
+    for slot in slots:
+        blob += SLOT.pack(*slot) if slot is not None else empty_slot
+
+    index_dir = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(index_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as index_file:
+            index_file.write(blob)
+        os.replace(temp_path, index_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return index_path
+
+
+class SkillIndex:
+    """Read-only view of a compiled skill index, backed by a shared memory map."""
+
+    def __init__(self, index_path):
+        with open(index_path, 'rb') as index_file:
+            self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.skill_count, self.category_count, slot_count, self.max_tokens,
+         self._strings_offset, self._skills_offset, self._categories_offset,
+         self._table_offset) = HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise ValueError(f"{index_path} is not a version {INDEX_VERSION} skill index")
+        self._mask = slot_count - 1
+        self.path = index_path
+        self._probe = functools.lru_cache(maxsize=PROBE_CACHE_SIZE)(self._probe_table)
+
+    def _string(self, offset, length):
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def name(self, skill_id):
+        """Canonical display name of a skill."""
+        offset, length, _ = SKILL_RECORD.unpack_from(self._map, self._skills_offset + skill_id * SKILL_RECORD.size)
+        return self._string(offset, length)
+
+    def category(self, skill_id):
+        """Category name of a skill."""
+        _, _, category_id = SKILL_RECORD.unpack_from(self._map, self._skills_offset + skill_id * SKILL_RECORD.size)
+        offset, length = CATEGORY_RECORD.unpack_from(
+            self._map, self._categories_offset + category_id * CATEGORY_RECORD.size)
+        return self._string(offset, length)
+
+    def _probe_table(self, key):
+        """(flags, skill id) stored for an encoded normalized term; flags is 0 when absent."""
+        data = self._map
+        key_hash = zlib.crc32(key)
+        slot = key_hash & self._mask
+        while True:
+            stored_hash, offset, length, flags, skill_id = SLOT.unpack_from(data, self._table_offset + slot * SLOT.size)
+            if not flags:
+                return 0, NO_SKILL
+            if stored_hash == key_hash and length == len(key):
+                start = self._strings_offset + offset
+                if data[start:start + length] == key:
+                    return flags, skill_id
+            slot = (slot + 1) & self._mask
+
+    def lookup(self, term):
+        """Skill id for a skill name or alias, or None."""
+        flags, skill_id = self._probe(normalize_term(term).encode('utf-8'))
+        return skill_id if flags & TERM else None
+
+    def find_all(self, text):
+        """Return (start, end, skill id) for every skill mention in the text.
+
+        Positions refer to the lowercased text. A mention inside a longer one
+        is dropped: "node.js" is Node.js, not also JavaScript, and "react
+        native" is React Native, not also React.
+        """
+        tokens = [(match.start(), match.end(), match.group().encode('utf-8'))
+                  for match in TOKEN_PATTERN.finditer(text.lower())]
+        token_count = len(tokens)
+        probe = self._probe
+        mentions = []
+        covered_until = 0
+        for first in range(token_count):
+            start, _, key = tokens[first]
+            flags, skill_id = probe(key)
+            longest = None
+            last = first
+            while flags:
+                if flags & TERM:
+                    longest = (start, tokens[last][1], skill_id)
+                last += 1
+                if not flags & PREFIX or last >= token_count or last - first >= self.max_tokens:
+                    break
+                key += b' ' + tokens[last][2]
+                flags, skill_id = probe(key)
+            # Scanning left to right, a mention is contained iff an earlier one reaches past its end
+            if longest is not None and longest[1] > covered_until:
+                mentions.append(longest)
+                covered_until = longest[1]
+        return mentions
+
+    def skill_ids(self, text):
+        """Set of skill ids mentioned in the text."""
+        return {skill_id for _, _, skill_id in self.find_all(text)}
+
+    def skill_names(self, text):
+        """Set of canonical names of the skills mentioned in the text."""
+        return {self.name(skill_id) for skill_id in self.skill_ids(text)}
+
+    def count(self, text):
+        """Counter of mentions per skill id in the text."""
+        return Counter(skill_id for _, _, skill_id in self.find_all(text))
+
+    def fingerprint(self):
+        """CRC32 of the index contents; data keyed by skill id is stale when it changes."""
+        return zlib.crc32(self._map)
+
+    def close(self):
+        self._map.close()
+
+
+def default_index_path(taxonomy_path):
+    """Index file next to the taxonomy, or in the temp dir when that is not writable."""
+    index_path = os.path.splitext(taxonomy_path)[0] + ".idx"
+    if os.access(os.path.dirname(os.path.abspath(index_path)), os.W_OK):
+        return index_path
+    return os.path.join(tempfile.gettempdir(), "resume_" + os.path.basename(index_path))
+
+
+def ensure_index(taxonomy_path=None, index_path=None):
+    """Return the path of an up-to-date index, compiling it if missing or older than the taxonomy."""
+    taxonomy_path = taxonomy_path or os.environ.get(TAXONOMY_PATH_ENV) or DEFAULT_TAXONOMY_PATH
+    index_path = index_path or os.environ.get(INDEX_PATH_ENV) or default_index_path(taxonomy_path)
+    if (not os.path.exists(index_path)
+            or os.path.getmtime(index_path) < os.path.getmtime(taxonomy_path)):
+        compile_index(taxonomy_path, index_path)
+    return index_path
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_skill_index():
+    """Return the process-wide skill index, compiling and mapping it on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SkillIndex(ensure_index())
+        return _index
@@ -0,0 +1,191 @@
+"""Local date-range and tenure engine for experience analysis.
+
+Dates are handled as month indices (``year * 12 + month - 1``). A role's
+interval is half-open: "Jan 2019 – Mar 2019" covers three months, and a
+year-only end ("2018 - 2020") stops at the start of that year, so it counts
+as two years rather than three. A role starting and ending in the same
+year ("2009 - 2009") would then be empty; it counts as MIN_ROLE_MONTHS
+instead of being dropped. Overlapping roles are merged before summing,
+so concurrent jobs are not double counted.
+"""
+import re
+from datetime import date
+
+from resume_core.model import as_resume_document, normalize_skill
+
+MONTHS = {name: index for index, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+ONGOING = ('present', 'current', 'now')
+DATE_PARTS_PATTERN = re.compile(r'(?:(?P<month_name>[a-z]{3})[a-z]*\.?\s+)?(?:(?P<month>\d{1,2})/)?(?P<year>\d{2,4})')
+# Months a same-year role ("2009 - 2009") counts for
+MIN_ROLE_MONTHS = 1
+# Separators inside a skill list: "AWS and Python", "Python, SQL or Go"
+SKILL_LIST_SEPARATOR = r'\s*,\s*(?:(?:and|or)\s+)?|\s+(?:and|or)\s+'
+SKILL_LIST_SPLIT_PATTERN = re.compile(SKILL_LIST_SEPARATOR, re.IGNORECASE)
+SKILL_ITEM = r'[a-z0-9+#./ -]+?'
+# "5+ years", "3-5 years of experience in Python", "at least 2 yrs with AWS and Python"
+REQUIREMENT_PATTERN = re.compile(
+    r'(?P<years>\d+)\s*(?:\+|-\s*\d+|to\s+\d+)?\s*(?:year|yr)s?'
+    r'(?:\s+of)?(?:\s+(?:professional|relevant|hands-on|industry|work))?(?:\s+experience)?'
+    rf'(?:\s+(?:in|with|using|of|building|developing)\s+(?P<skill>{SKILL_ITEM}(?:(?:{SKILL_LIST_SEPARATOR}){SKILL_ITEM})*))?'
+    r'(?=[,;()\n]|\.(?!\w)|\s+and\b|\s+or\b|$)',
+    re.IGNORECASE
+)
+GENERIC_SKILL_WORDS = ('experience', 'related field', 'the field', 'industry', 'a similar role', 'similar role')
+
+
+def month_index(year, month=1):
+    """Month index for a calendar year and month."""
+    return year * 12 + month - 1
+
+
+def current_month(today=None):
+    """Month index of today (or the given date)."""
+    today = today or date.today()
+    return month_index(today.year, today.month)
+
+
+def parse_date(text, is_end=False, start=None, today=None):
+    """Month index for one side of a date range, or None if it cannot be read.
+
+    Ends are exclusive: a month end is bumped by one, a bare year end is
+    January of that year. Two-digit end years ("2018-20") take their century
+    from ``start``.
+    """
+    text = text.strip().lower()
+    if text in ONGOING:
+        return current_month(today) + 1 if is_end else None
+    match = DATE_PARTS_PATTERN.fullmatch(text)
+    if not match:
+        return None
+
+    year = int(match.group('year'))
+    if year < 100:
+        if start is None:
+            return None
+        century = (start // 12) // 100 * 100
+        year += century if century + year >= start // 12 else century + 100
+    if match.group('month_name'):
+        month = MONTHS.get(match.group('month_name'))
+    elif match.group('month'):
+        month = int(match.group('month'))
+    else:
+        return month_index(year)
+    if month is None or not 1 <= month <= 12:
+        return None
+    return month_index(year, month) + (1 if is_end else 0)
+
+
+def entry_interval(entry, today=None):
+    """(start, end) month interval of an ExperienceEntry, or None without a readable date range."""
+    if not entry.start:
+        return None
+    start = parse_date(entry.start, today=today)
+    if start is None:
+        return None
+    end = parse_date(entry.end, is_end=True, start=start, today=today)
+    if end is None or end < start:
+        return None
+    return start, max(end, start + MIN_ROLE_MONTHS)
+
+
+def merge_intervals(intervals):
+    """Merge overlapping or touching intervals into a sorted, disjoint list."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def total_months(intervals):
+    """Months covered by a set of possibly overlapping intervals."""
+    return sum(end - start for start, end in merge_intervals(intervals))
+
+
+def experience_intervals(sections, today=None):
+    """(interval, lowercased role text) for every dated role in the experience sections."""
+    document = as_resume_document(sections)
+    roles = []
+    for entry, role_text in zip(document.experience, document.role_texts):
+        interval = entry_interval(entry, today)
+        if interval is not None:
+            roles.append((interval, role_text))
+    return roles
+
+
+def skill_tenure(roles, skills):
+    """Years of experience per skill, counting the (merged) roles that mention it."""
+    tenure = {}
+    for skill in skills:
+        pattern = re.compile(r'(?<![\w+#])' + re.escape(skill.lower()) + r'(?![\w+#])')
+        intervals = [interval for interval, role_text in roles if pattern.search(role_text)]
+        tenure[skill] = round(total_months(intervals) / 12, 1)
+    return tenure
+
+
+def requirement_skills(skill_list):
+    """Skills named by a requirement's skill list.
+
+    The first item is kept unless it is generic ("experience", "the
+    field"); later ones ("... with AWS and Python") only when the skill
+    taxonomy knows them, so "Python, strong communication skills" does not
+    add a tenure requirement for the prose.
+    """
+    skills = []
+    for position, item in enumerate(SKILL_LIST_SPLIT_PATTERN.split(skill_list or '')):
+        skill = item.strip(' ./-').lower()
+        if not skill or any(skill.startswith(word) for word in GENERIC_SKILL_WORDS):
+            continue
+        if position == 0 or normalize_skill(skill) is not None:
+            skills.append(skill)
+    return skills
+
+
+def parse_experience_requirements(text):
+    """Parse "N+ years" requirements into (overall years or None, {skill: years})."""
+    if isinstance(text, (list, tuple)):
+        text = '\n'.join(str(item) for item in text)
+    overall = None
+    per_skill = {}
+    for match in REQUIREMENT_PATTERN.finditer(str(text or "")):
+        years = int(match.group('years'))
+        skills = requirement_skills(match.group('skill'))
+        for skill in skills:
+            per_skill[skill] = max(years, per_skill.get(skill, 0))
+        if not skills:
+            overall = years if overall is None else max(overall, years)
+    return overall, per_skill
+
+
+def _coverage(actual, required):
+    return 100 if required <= 0 else min(100, int(100 * actual / required))
+
+
+def analyze_tenure(sections, requirement_text, today=None):
+    """Compare resume tenure against "N+ years" requirements.
+
+    Returns total and per-skill years, the parsed requirements and an
+    ``experience_match`` score (0-100): the average coverage of every
+    requirement, 100 when the job states none.
+    """
+    roles = experience_intervals(sections, today)
+    overall_required, skill_required = parse_experience_requirements(requirement_text)
+    total_years = round(total_months([interval for interval, _ in roles]) / 12, 1)
+    tenure = skill_tenure(roles, skill_required)
+
+    coverages = [_coverage(tenure[skill], years) for skill, years in skill_required.items()]
+    if overall_required is not None:
+        coverages.append(_coverage(total_years, overall_required))
+    return {
+        'total_years': total_years,
+        'required_years': overall_required,
+        'skill_years': tenure,
+        'skill_requirements': skill_required,
+        'experience_match': int(sum(coverages) / len(coverages)) if coverages else 100,
+        'roles_dated': len(roles),
+    }
+
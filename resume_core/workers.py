@@ -0,0 +1,267 @@
+"""Process-pool worker service for CPU-heavy resume work.
+
+PDF text extraction, local section parsing, ATS format checks and ReportLab
+rendering are pure Python and hold the GIL, so running them inside the
+Streamlit script thread serializes every session on the server process.
+The service below runs them in a pool of worker processes instead: the UI
+submits a named task, gets a task id back and polls for progress and the
+result.
+
+Bursts of PDF renders are bounded: at most a fixed number of render tasks
+may be queued or running at once (further submissions raise WorkerBusy),
+and each render gets a deadline after which it is reported as failed and
+its result discarded. A render that is already running cannot be killed
+without taking down its pool, so it keeps its worker until it finishes
+and still counts against the queue depth; one still queued is cancelled.
+
+Worker processes are spawned with a stub ``__main__`` (see
+ScriptFreeSpawnProcess), so they never re-run the Streamlit script.
+"""
+import io
+import multiprocessing
+import multiprocessing.context
+import os
+import sys
+import threading
+import time
+import types
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from resume_core import ats, parsing, rendering
+
+# Pool size can be tuned per deployment without code changes
+POOL_SIZE_ENV = "RESUME_WORKER_POOL_SIZE"
+DEFAULT_POOL_SIZE = os.cpu_count() or 2
+# Render tasks queued or running at once; 0 means four per worker
+RENDER_QUEUE_DEPTH_ENV = "RESUME_RENDER_QUEUE_DEPTH"
+RENDER_TIMEOUT = float(os.environ.get("RESUME_RENDER_TIMEOUT", "60"))  # seconds per render
+
+
+class WorkerBusy(RuntimeError):
+    """Raised when a task's queue is full; the caller should retry later."""
+
+
+# --- Task implementations (run inside worker processes) ---
+def _task_extract_text(report, pdf_bytes):
+    """Extract the text layer of a PDF."""
+    return parsing.extract_text_from_pdf(io.BytesIO(pdf_bytes))
+
+
+def _task_parse_sections(report, resume_text):
+    """Parse resume text into sections without AI."""
+    sections, confidence, header_section_count = parsing.parse_sections_with_confidence(resume_text)
+    report(0.9)
+    return {'sections': sections, 'confidence': confidence, 'header_section_count': header_section_count}
+
+
+def _task_extract_and_parse(report, pdf_bytes):
+    """Extract text from a PDF and parse it into sections in one round trip."""
+    text = parsing.extract_text_from_pdf(io.BytesIO(pdf_bytes))
+    report(0.6)
+    parsed = _task_parse_sections(lambda fraction: report(0.6 + 0.4 * fraction), text)
+    parsed['text'] = text
+    return parsed
+
+
+def _task_render_pdf(report, sections, template_name, options=None):
+    """Render resume sections to PDF bytes."""
+    return rendering.render_pdf_from_sections(sections, template_name, options, progress=report)
+
+
+def _task_ats_report(report, pdf_bytes):
+    """Local ATS format report of a PDF."""
+    return ats.analyze_pdf(pdf_bytes)
+
+
+TASKS = {
+    'extract_text': _task_extract_text,
+    'parse_sections': _task_parse_sections,
+    'extract_and_parse': _task_extract_and_parse,
+    'render_pdf': _task_render_pdf,
+    'ats_report': _task_ats_report,
+}
+
+
+def _run_task(progress_map, task_id, task_name, args, kwargs):
+    """Worker entry point: run a registered task and publish its progress."""
+    def report(fraction):
+        progress_map[task_id] = float(fraction)
+
+    report(0.0)
+    result = TASKS[task_name](report, *args, **kwargs)
+    report(1.0)
+    return result
+
+
+# --- Process start-up ---
+_main_swap_lock = threading.Lock()
+
+
+class ScriptFreeSpawnProcess(multiprocessing.context.SpawnProcess):
+    """Spawned process that does not re-run the parent's ``__main__`` script.
+
+    A spawned child re-imports the parent's main module (as ``__mp_main__``)
+    from ``sys.modules['__main__'].__file__``. Under Streamlit that is
+    Resume_Enshancer.py, so every worker would run the whole app: page
+    config, Supabase client and UI code. The child's start-up data is
+    built while an empty stub stands in for ``__main__``, so the child only
+    imports the modules its pickled tasks reference.
+    """
+
+    @staticmethod
+    def _Popen(process_obj):
+        with _main_swap_lock:
+            main_module = sys.modules['__main__']
+            sys.modules['__main__'] = types.ModuleType('__main__')
+            try:
+                return multiprocessing.context.SpawnProcess._Popen(process_obj)
+            finally:
+                sys.modules['__main__'] = main_module
+
+
+class ScriptFreeSpawnContext(multiprocessing.context.SpawnContext):
+    """Spawn context whose processes (pool workers and the manager) skip ``__main__``."""
+    Process = ScriptFreeSpawnProcess
+
+
+# --- Service (lives in the Streamlit server process) ---
+class WorkerService:
+    """Submit named tasks to a process pool and poll them by task id.
+
+    ``queue_limits`` maps task names to the number of such tasks that may
+    be queued or running at once; tasks without a limit are unbounded.
+    """
+
+    def __init__(self, pool_size=None, queue_limits=None):
+        if pool_size is None:
+            pool_size = int(os.environ.get(POOL_SIZE_ENV, "0")) or DEFAULT_POOL_SIZE
+        self.pool_size = max(1, pool_size)
+        if queue_limits is None:
+            render_depth = int(os.environ.get(RENDER_QUEUE_DEPTH_ENV, "0")) or 4 * self.pool_size
+            queue_limits = {'render_pdf': render_depth}
+        self.queue_limits = dict(queue_limits)
+
+        # Spawned workers only import resume_core, never the Streamlit script
+        context = ScriptFreeSpawnContext()
+        self._manager = context.Manager()
+        self._progress = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=self.pool_size, mp_context=context)
+        self._futures = {}
+        self._deadlines = {}
+        self._in_flight = {}  # task name -> futures queued or running, forgotten or not
+        self._lock = threading.Lock()
+
+    def submit(self, task_name, *args, timeout=None, **kwargs):
+        """Queue a task and return its id.
+
+        ``timeout`` (seconds) is the task's deadline from submission.
+        Raises WorkerBusy when the task's queue limit is reached.
+        """
+        if task_name not in TASKS:
+            raise ValueError(f"Unknown task: {task_name}")
+
+        task_id = uuid.uuid4().hex
+        with self._lock:
+            in_flight = self._in_flight.setdefault(task_name, set())
+            limit = self.queue_limits.get(task_name)
+            if limit is not None and len(in_flight) >= limit:
+                raise WorkerBusy(f"{len(in_flight)} {task_name} tasks already queued or running")
+            self._progress[task_id] = 0.0
+            future = self._executor.submit(_run_task, self._progress, task_id, task_name, args, kwargs)
+            in_flight.add(future)
+            self._futures[task_id] = future
+            if timeout is not None:
+                self._deadlines[task_id] = time.monotonic() + timeout
+        future.add_done_callback(lambda done: self._finished(task_name, done))
+        return task_id
+
+    def _finished(self, task_name, future):
+        with self._lock:
+            self._in_flight[task_name].discard(future)
+
+    def in_flight(self, task_name):
+        """Number of tasks of a kind queued or running, including timed-out ones still running."""
+        with self._lock:
+            return len(self._in_flight.get(task_name, ()))
+
+    def _timed_out(self, task_id, future):
+        """True (cancelling the task if it has not started) once an unfinished task is past its deadline."""
+        deadline = self._deadlines.get(task_id)
+        if deadline is None or future.done() or time.monotonic() < deadline:
+            return False
+        future.cancel()
+        return True
+
+    def status(self, task_id):
+        """Return the state ('pending', 'running', 'done', 'failed' or 'unknown') and progress of a task.
+
+        A task past its deadline is reported as failed with a timeout error.
+        """
+        with self._lock:
+            future = self._futures.get(task_id)
+        if future is None:
+            return {'state': 'unknown', 'progress': 0.0, 'error': None}
+
+        progress = self._progress.get(task_id, 0.0)
+        if self._timed_out(task_id, future):
+            return {'state': 'failed', 'progress': progress, 'error': "Timed out"}
+        if future.done() and future.cancelled():
+            return {'state': 'failed', 'progress': progress, 'error': "Cancelled"}
+        if future.done():
+            error = future.exception()
+            if error is not None:
+                return {'state': 'failed', 'progress': progress, 'error': str(error)}
+            return {'state': 'done', 'progress': 1.0, 'error': None}
+        state = 'running' if future.running() or progress > 0 else 'pending'
+        return {'state': state, 'progress': progress, 'error': None}
+
+    def result(self, task_id, timeout=None):
+        """Block until the task finishes and return its result, re-raising task errors.
+
+        Waits at most until the task's deadline, then raises TimeoutError.
+        """
+        with self._lock:
+            future = self._futures.get(task_id)
+            deadline = self._deadlines.get(task_id)
+        if future is None:
+            raise KeyError(f"Unknown task id: {task_id}")
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        try:
+            return future.result(timeout=timeout)
+        except CancelledError:
+            raise TimeoutError(f"Task {task_id} timed out before it started")
+        except FutureTimeoutError:
+            if deadline is not None and time.monotonic() >= deadline:
+                future.cancel()
+            raise TimeoutError(f"Task {task_id} did not finish in time")
+
+    def forget(self, task_id):
+        """Drop bookkeeping for a task once its result has been collected."""
+        with self._lock:
+            future = self._futures.pop(task_id, None)
+            self._deadlines.pop(task_id, None)
+        self._progress.pop(task_id, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self, wait=True):
+        """Stop the pool and its progress manager."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._manager.shutdown()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_worker_service():
+    """Return the process-wide worker service, starting it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = WorkerService()
+        return _service